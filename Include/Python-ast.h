@@ -617,3 +617,12 @@ withitem_ty _Py_withitem(expr_ty context_expr, expr_ty optional_vars, PyArena
 PyObject* PyAST_mod2obj(mod_ty t);
 mod_ty PyAST_obj2mod(PyObject* ast, PyArena* arena, int mode);
 int PyAST_Check(PyObject* obj);
+
+/* Like PyAST_mod2obj and PyAST_obj2mod, but also appending to the list nodes
+   each object converted from or to a node of a sum type with fields, such as
+   an expr or stmt, followed by the address of that node as an int. This
+   allows information to be associated with the nodes of an arena AST through
+   the objects, as the garter checker does, see _PyAST_CompileGarter. */
+PyObject* _PyAST_mod2obj_nodes(mod_ty t, PyObject* nodes);
+mod_ty _PyAST_obj2mod_nodes(PyObject* ast, PyArena* arena, int mode,
+                            PyObject* nodes);
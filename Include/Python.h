@@ -84,6 +84,7 @@
 #include "memoryobject.h"
 #include "tupleobject.h"
 #include "listobject.h"
+#include "typedlistobject.h"
 #include "dictobject.h"
 #include "odictobject.h"
 #include "enumobject.h"
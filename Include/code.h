@@ -34,6 +34,8 @@ typedef struct {
     PyObject *co_lnotab;	/* string (encoding addr<->lineno mapping) See
 				   Objects/lnotab_notes.txt for details. */
     void *co_zombieframe;     /* for optimization only (see frameobject.c) */
+    Py_ssize_t *co_globalhints; /* for optimization only (see
+                                   LOAD_GLOBAL_BOUND in ceval.c) */
     PyObject *co_weakreflist;   /* to support weakrefs to code objects */
 } PyCodeObject;
 
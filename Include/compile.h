@@ -58,6 +58,39 @@ PyAPI_FUNC(PyObject*) _Py_Mangle(PyObject *p, PyObject *name);
 #define PY_INVALID_STACK_EFFECT INT_MAX
 PyAPI_FUNC(int) PyCompile_OpcodeStackEffect(int opcode, int oparg);
 
+/* Values of the specs which the garter checker records on the AST objects of
+   nodes it has validated, and which are passed to _PyAST_CompileGarter in a
+   dict keyed by the addresses of the corresponding arena nodes, see
+   Garter_CompileStringObject. They are kept out of the nodes themselves, as
+   they aren't part of the ast module's API.
+
+   The spec of BinOp, AugAssign, Compare and Subscript nodes is the type of
+   their operands, if the checker has proven it, for which the compiler emits
+   specialized opcodes. That of List nodes is the type of their items, for
+   which it emits typed lists, that of Name nodes is Garter_SPEC_BOUND where
+   the variable is bound whenever it is loaded, for which it emits
+   LOAD_GLOBAL_BOUND for globals, that of Call nodes is
+   Garter_SPEC_DIRECT where exactly the declared positional arguments are
+   passed, for which it emits direct calls, and that of ClassDef nodes is
+   Garter_SPEC_SLOTS where the fields are the only attributes of the
+   instances, which are then laid out with a slot for each. */
+#define Garter_SPEC_NONE  0
+#define Garter_SPEC_INT   1     /* The operands are ints */
+#define Garter_SPEC_FLOAT 2     /* The operands are ints or floats */
+#define Garter_SPEC_LIST  3     /* A list indexed by an int */
+#define Garter_SPEC_BOOL  4     /* The items are bools */
+#define Garter_SPEC_BOUND 5     /* The variable is bound */
+#define Garter_SPEC_DIRECT 6    /* The arguments match the parameters */
+#define Garter_SPEC_SLOTS 7     /* The fields are the only attributes */
+
+PyAPI_FUNC(PyCodeObject *) _PyAST_CompileGarter(
+    struct _mod *mod,
+    PyObject *filename,
+    PyCompilerFlags *flags,
+    int optimize,
+    PyArena *arena,
+    PyObject *specs);
+
 #ifdef __cplusplus
 }
 #endif
@@ -143,6 +143,8 @@ PyAPI_FUNC(void) _PyDict_DebugMallocStats(FILE *out);
 
 int _PyObjectDict_SetItem(PyTypeObject *tp, PyObject **dictptr, PyObject *name, PyObject *value);
 PyObject *_PyDict_LoadGlobal(PyDictObject *, PyDictObject *, PyObject *);
+PyObject *_PyDict_LoadGlobalHint(PyDictObject *, PyDictObject *, PyObject *,
+                                 Py_ssize_t *);
 #endif
 
 #ifdef __cplusplus
@@ -29,6 +29,8 @@ extern "C" {
 #define BINARY_TRUE_DIVIDE       27
 #define INPLACE_FLOOR_DIVIDE     28
 #define INPLACE_TRUE_DIVIDE      29
+#define BINARY_SUBSCR_LIST       30
+#define STORE_SUBSCR_LIST        31
 #define GET_AITER                50
 #define GET_ANEXT                51
 #define BEFORE_ASYNC_WITH        52
@@ -123,6 +125,15 @@ extern "C" {
 #define BUILD_SET_UNPACK        153
 #define SETUP_ASYNC_WITH        154
 #define FORMAT_VALUE            155
+#define BINARY_OP_INT           156
+#define BINARY_OP_FLOAT         157
+#define COMPARE_OP_INT          158
+#define COMPARE_OP_FLOAT        159
+#define BUILD_INT_LIST          160
+#define BUILD_FLOAT_LIST        161
+#define BUILD_BOOL_LIST         162
+#define LOAD_GLOBAL_BOUND       164
+#define CALL_FUNCTION_DIRECT    165
 
 /* EXCEPT_HANDLER is a special, implicit block type which is created when
    entering an except handler. It is not an opcode but we define it here
@@ -133,6 +133,11 @@ PyAPI_FUNC(PyObject *) Garter_CompileStringObject(
     PyCompilerFlags *flags,
     int optimize,
     PyObject *global_scope);
+PyAPI_FUNC(PyObject *) Garter_CompileASTObject(
+    PyObject *tree,
+    PyObject *filename, int mode,
+    PyCompilerFlags *flags,
+    int optimize);
 #endif
 PyAPI_FUNC(struct symtable *) Py_SymtableString(
     const char *str,
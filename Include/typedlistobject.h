@@ -0,0 +1,58 @@
+/* Typed list object interface */
+
+/*
+Typed lists are the lists of ints, floats or bools which Garter code creates
+from the list displays whose item type the checker has proven. The items are
+stored unboxed, as in an array.array, but a typed list supports the sequence
+operations and methods of a list: any object may be stored in it, and storing
+one which doesn't fit the type of the items (an int too large for a C long, a
+float which is a NaN, or an object of any other type) boxes all of the items,
+after which they are stored as the object pointers of a list.
+
+A typed list isn't a list, however, as code which passes PyList_Check may
+access ob_item directly. Its type is _garter.TypedList, isinstance(x, list)
+is false, and modules which only accept lists, such as json, reject it.
+Garter code can't tell, as type(), isinstance() and such modules aren't in
+its scope, but Python code passed its lists can.
+*/
+
+#ifndef Py_TYPEDLISTOBJECT_H
+#define Py_TYPEDLISTOBJECT_H
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#ifndef Py_LIMITED_API
+typedef struct {
+    PyObject_VAR_HEAD
+    /* The type of the items: 'l' for ints, stored as C longs, 'd' for floats,
+       stored as doubles, or '?' for bools, stored as chars. */
+    char ob_typecode;
+    /* How the items are stored: as ob_typecode, or 'O' for object pointers
+       once an item which doesn't fit ob_typecode has been stored. */
+    char ob_storage;
+    /* Vector of ob_size items, with space for 'allocated' of them. */
+    void *ob_items;
+    Py_ssize_t allocated;
+} PyTypedListObject;
+#endif
+
+PyAPI_DATA(PyTypeObject) PyTypedList_Type;
+PyAPI_DATA(PyTypeObject) PyTypedListIter_Type;
+
+#define PyTypedList_CheckExact(op) (Py_TYPE(op) == &PyTypedList_Type)
+
+#ifndef Py_LIMITED_API
+/* A new typed list of the n objects in items, unboxed if they fit typecode */
+PyAPI_FUNC(PyObject *) _PyTypedList_FromArray(char typecode, PyObject **items,
+                                              Py_ssize_t n);
+/* The item at index i, which must be in range, as a new reference */
+PyAPI_FUNC(PyObject *) _PyTypedList_GetItem(PyObject *op, Py_ssize_t i);
+/* Store v at index i, which must be in range, without stealing v */
+PyAPI_FUNC(int) _PyTypedList_SetItem(PyObject *op, Py_ssize_t i, PyObject *v);
+#endif
+
+#ifdef __cplusplus
+}
+#endif
+#endif /* !Py_TYPEDLISTOBJECT_H */
@@ -15,13 +15,37 @@ The lack of type-checking in the python module is easily made up for by how the
 C module had to use Python objects (which aren't type-safe) anyways, meaning
 that most type checks were relegated to runtime anyways.
 
-Performance is also not a concern for Garter programs, due to their small size.
+Although Garter programs are small, the checker is run on every program
+submitted for a class, and on every edit in IDLE, so its speed matters.
+IncrementalChecker rechecks only the statements of a module which
+may have changed, and Profile measures where the checker spends its time.
+
+The tools built on the checker live in their own modules: gartercache caches
+check results on disk, garterimport allows .gt modules to be imported from
+python, and gartercheck checks many files at once from the command line.
 """
 
+import __future__
+import _garter
+import array
 import ast
-import re
-
-_filename = None # Set by the compile function
+import collections
+import functools
+import importlib.util
+import inspect
+import marshal
+import operator
+import os
+import sys
+import time
+import tokenize
+import weakref
+from types import GeneratorType
+
+try:
+    from _thread import allocate_lock as Lock
+except ImportError:
+    from _dummy_thread import allocate_lock as Lock
 
 
 # XXX: Improve the error system
@@ -30,7 +54,33 @@ _filename = None # Set by the compile function
 # * Potentially circumvent the SyntaxError requirement, to get better formatting
 class GarterError(SyntaxError):
     def __init__(self, node, body):
-        super().__init__(body, (_filename, node.lineno, node.col_offset, None))
+        super().__init__(body, (None, node.lineno, node.col_offset, None))
+
+    def locate(self, filename):
+        """
+        Record the name of the file the error occurred in. Called by check, as
+        the filename isn't known where the error is raised.
+        """
+        self.filename = filename
+        self.args = (self.msg, (filename, self.lineno, self.offset, self.text))
+
+
+class GarterErrors(GarterError):
+    """
+    Raised when collecting errors, if any were found. The exception itself
+    describes the first error, and errors lists all of them, in the order in
+    which they occur in the source.
+    """
+    def __init__(self, errors):
+        errors = sorted(errors, key=lambda err: (err.lineno, err.offset))
+        SyntaxError.__init__(self, *errors[0].args)
+        self.errors = errors
+
+    def locate(self, filename):
+        for err in self.errors:
+            if err.filename == None:
+                err.locate(filename)
+        super().locate(filename)
 
 
 class Attribute:
@@ -47,28 +97,97 @@ def module(scope, asname, name, attrs):
     scope.declare(asname, TyMod(name, attrs), mutable=False)
 
 
+# Types are hash-consed: constructing a type which is structurally equal to
+# a live type returns that type, such that equality on types is identity, and
+# types may be used as dictionary keys. The table holds types weakly, so types
+# which are no longer referenced (e.g. from old REPL inputs) are released,
+# once they have also dropped out of the subsumption cache below.
+_interned = weakref.WeakValueDictionary()
+_intern_lock = Lock()
+
+
+# Subsumption and completion are memoized on the (interned) types involved, as
+# structural comparisons of nested list, dict and function types are repeated
+# at every use site of a value of that type. The cache holds the types of the
+# SUBSUME_CACHE_SIZE most recently compared pairs strongly, which bounds the
+# number of otherwise unreferenced types kept alive by it; subsume_cache_clear
+# releases them all.
+SUBSUME_CACHE_SIZE = 4096
+
+@functools.lru_cache(maxsize=SUBSUME_CACHE_SIZE)
+def _relation(rel, a, b):
+    return getattr(a, rel)(b)
+
+
+def subsume_cache_info():
+    """
+    Return the hits, misses, maxsize and currsize of the subsumption cache
+    """
+    return _relation.cache_info()
+
+
+def subsume_cache_clear():
+    """ Forget every cached comparison, releasing the types involved """
+    _relation.cache_clear()
+
+
 class Ty:
+    _fields = ()
+    _attributes = None
+
+    def __new__(cls, *fields):
+        key = (cls,) + fields
+        self = _interned.get(key)
+        if self is None:
+            # Ensure that concurrent checkers agree on the interned type
+            with _intern_lock:
+                self = _interned.get(key)
+                if self is None:
+                    self = super().__new__(cls)
+                    for name, value in zip(cls._fields, fields):
+                        setattr(self, name, value)
+                    _interned[key] = self
+        return self
+
+    def subsumes(self, other):
+        """
+        True if a value of type other may be used where a value of type self
+        is expected, else False
+        """
+        if other is TY_ERROR:
+            return True
+        return _relation('_subsumes', self, other)
+
     def completes(self, other):
         """
         True if the type self is a more or equally complete type than other,
         else False
         """
-        return self == other
+        if other is TY_ERROR:
+            return True
+        return _relation('_completes', self, other)
+
+    def _completes(self, other):
+        return self is other
+
+    def methods(self):
+        """
+        The types of the methods on the type, by name
+        """
+        return {}
 
     def attribute(self, name):
+        if self._attributes is None:
+            # Built once per distinct type, the first time it is needed
+            self._attributes = wrap_attr(self.methods())
         return self._attributes.get(name, None)
 
-    def __eq__(self, other):
-        return self.subsumes(other) and other.subsumes(self)
-
 
 class TyNone(Ty):
-    _attributes = {}
-
     def is_complete(self):
         return False
 
-    def subsumes(self, other):
+    def _subsumes(self, other):
         return type(other) == TyNone
 
     def __repr__(self):
@@ -76,12 +195,10 @@ class TyNone(Ty):
 
 
 class TyInt(Ty):
-    _attributes = {}
-
     def is_complete(self):
         return True
 
-    def subsumes(self, other):
+    def _subsumes(self, other):
         return type(other) == TyInt
 
     def __repr__(self):
@@ -89,12 +206,10 @@ class TyInt(Ty):
 
 
 class TyFloat(Ty):
-    _attributes = {}
-
     def is_complete(self):
         return True
 
-    def subsumes(self, other):
+    def _subsumes(self, other):
         return type(other) == TyFloat or \
             type(other) == TyInt
 
@@ -103,12 +218,10 @@ class TyFloat(Ty):
 
 
 class TyBool(Ty):
-    _attributes = {}
-
     def is_complete(self):
         return True
 
-    def subsumes(self, other):
+    def _subsumes(self, other):
         return type(other) == TyBool
 
     def __repr__(self):
@@ -116,17 +229,16 @@ class TyBool(Ty):
 
 
 class TyStr(Ty):
-    _attributes = {}
-
-    def __init__(self):
-        self._attributes = wrap_attr({
+    def methods(self):
+        return {
             'split': TyFunc(TyList(self), [self]),
             'join': TyFunc(self, [TyList(self)]),
-        })
+        }
+
     def is_complete(self):
         return True
 
-    def subsumes(self, other):
+    def _subsumes(self, other):
         return type(other) == TyStr
 
     def __repr__(self):
@@ -134,28 +246,28 @@ class TyStr(Ty):
 
 
 class TyDict(Ty):
-    _attributes = {}
+    _fields = ('key', 'value')
 
-    def __init__(self, key, value):
-        self.key = key
-        self.value = value
-        self._attributes = wrap_attr({
+    def methods(self):
+        key = self.key
+        value = self.value
+        return {
             'pop': TyFunc(value, [key, value]),
             'setdefault': TyFunc(value, [key, value]),
             'get': TyFunc(value, [key, value]),
             'clear': TyFunc(TY_NONE, []),
             'copy': TyFunc(self, []),
             'update': TyFunc(TY_NONE, [self]),
-        })
+        }
 
     def is_complete(self):
         return self.key != None and self.value != None and \
                self.key.is_complete() and self.value.is_complete()
 
-    def subsumes(self, other):
+    def _subsumes(self, other):
         return self.completes(other)
 
-    def completes(self, other):
+    def _completes(self, other):
         if type(other) != TyDict:
             return False
         if other.key == None and other.value == None:
@@ -163,23 +275,16 @@ class TyDict(Ty):
         return self.key.completes(other.key) and \
             self.value.completes(other.value)
 
-    def __eq__(self, other):
-        if not isinstance(other, TyDict):
-            return False
-        return self.key == other.key and \
-            self.value == other.value
-
     def __repr__(self):
         return '{{{}: {}}}'.format(self.key, self.value)
 
 
 class TyList(Ty):
-    def is_complete(self):
-        return self.item != None and self.item.is_complete()
+    _fields = ('item',)
 
-    def __init__(self, item):
-        self.item = item
-        self._attributes = wrap_attr({
+    def methods(self):
+        item = self.item
+        return {
             'append': TyFunc(TY_NONE, [item]),
             'extend': TyFunc(TY_NONE, [self]),
             'insert': TyFunc(TY_NONE, [TY_INT, item]),
@@ -190,12 +295,15 @@ class TyList(Ty):
             'reverse': TyFunc(TY_NONE, []),
             'sort': TyFunc(TY_NONE, []),
             'clear': TyFunc(TY_NONE, []),
-        })
+        }
 
-    def subsumes(self, other):
+    def is_complete(self):
+        return self.item != None and self.item.is_complete()
+
+    def _subsumes(self, other):
         return self.completes(other)
 
-    def completes(self, other):
+    def _completes(self, other):
         if type(other) != TyList:
             return False
         if other.item == None:
@@ -207,19 +315,26 @@ class TyList(Ty):
 
 
 class TyClass(Ty):
-    def is_complete(self):
-        return self.fields != None
+    _fields = ('name', 'fields')
 
-    def __init__(self, name, fields):
+    def __new__(cls, name, fields):
+        if fields == None: # Placeholder types, such as the type of None
+            return super().__new__(cls, name, fields)
+        # Classes are nominal, so each class declaration is a distinct type
+        self = object.__new__(cls)
         self.name = name
         self.fields = fields
+        return self
 
-    def subsumes(self, other):
+    def is_complete(self):
+        return self.fields != None
+
+    def _subsumes(self, other):
         if type(other) != TyClass:
             return False
         return self.completes(other)
 
-    def completes(self, other):
+    def _completes(self, other):
         if type(other) != TyClass:
             return False
         return other.fields == None or \
@@ -233,6 +348,10 @@ class TyClass(Ty):
 
 
 class TyMod(Ty):
+    def __new__(cls, name, fields):
+        # Each import produces a distinct module type
+        return object.__new__(cls)
+
     def __init__(self, name, fields):
         self.name = name
         self._attributes = wrap_attr(fields)
@@ -240,7 +359,7 @@ class TyMod(Ty):
     def is_complete(self):
         return False
 
-    def subsumes(self, other):
+    def _subsumes(self, other):
         return other is self
 
     def __repr__(self):
@@ -248,22 +367,21 @@ class TyMod(Ty):
 
 
 class TyFunc(Ty):
-    _attributes = {}
+    _fields = ('ret', 'args')
+
+    def __new__(cls, ret, args):
+        return super().__new__(cls, ret, tuple(args))
 
     def is_complete(self):
         return True
 
-    def __init__(self, ret, args):
-        self.ret = ret
-        self.args = args
-
     # Subsumption on functions:
     # e.g. (int, int) -> float subsumes (float, float) -> int
     # (float, float) -> int does not subsume (int, int) -> float
     # As a float is not a legal argument to (int, int) -> float,
     # and the return value isn't necessarially an int
 
-    def subsumes(self, other):
+    def _subsumes(self, other):
         if type(other) != TyFunc:
             return False
         if len(self.args) != len(other.args):
@@ -278,15 +396,31 @@ class TyFunc(Ty):
         # Then we are more general!
         return True
 
-    def __eq__(self, other):
-        if not isinstance(other, TyFunc):
-            return False
-        return self.ret == other.ret and \
-            self.args == other.args
-
     def __repr__(self):
         return repr(self.ret)+'(' + ', '.join([repr(x) for x in self.args]) + ')'
 
+class TyError(Ty):
+    """
+    The type of an expression which failed to validate, when collecting
+    errors. It is compatible with every other type, such that a single mistake
+    doesn't produce further errors wherever its value is used.
+    """
+    def is_complete(self):
+        return True
+
+    def _subsumes(self, other):
+        return True
+
+    def _completes(self, other):
+        return True
+
+    def attribute(self, name):
+        return Attribute(self, mutable=True)
+
+    def __repr__(self):
+        return '<error>'
+
+TY_ERROR = TyError()
 TY_NONE = TyNone()
 TY_BOOL = TyBool()
 TY_INT = TyInt()
@@ -324,25 +458,52 @@ INVALID_VARIABLE = 'invalid_variable' # Special case value
 
 
 class VariableInfo:
-    def __init__(self, var, local, globl):
+    """
+    The resolution of a name from a given scope. The variable is stored in slot
+    `slot` of the enclosing scope at depth `depth`, where the global scope has
+    depth 0.
+    """
+    def __init__(self, var, local, globl, depth, slot):
         self.ty = var.ty
         self.mutable = var.mutable
         self.local = local
         self.globl = globl
         self.var = var
+        self.depth = depth
+        self.slot = slot
 
 
 class Scope:
     """
     A given scope in the Garter programming language. Used for each scope,
     starting from the root and going up to inner scopes such as function scopes.
+
+    Variables are stored in the slots list, and vars maps names to their slot.
+    Names are resolved to a VariableInfo once per scope, and the resolution is
+    cached in resolved, such that repeated references to a name don't walk the
+    scope chain.
+
+    The global scope records how to undo each change made to it in journal,
+    such that a backup is just a position in the journal, and restoring it
+    only undoes the changes made since, however many names have been declared.
+
+    The bodies of functions are validated when they are first referenced, or
+    when their scope is flushed. A lazy global scope isn't flushed after each
+    check, such that only the functions reachable from the checked code are
+    validated, until check_deferred is called.
     """
 
     def __init__(self, up, root=False):
         self.up = up
         self.root = root
+        self.depth = 0 if up == None else up.depth + 1
+        self.ctx = None if up == None else up.ctx # The Checker, set by validate
         self.vars = {}
+        self.slots = []
+        self.resolved = {}
         self.classes = {}
+        self.journal = [] if up == None else None
+        self.lazy = False
         self._func = None # The current function type, set by validate_funcdef
 
     def func(self):
@@ -365,23 +526,37 @@ class Scope:
         assert type(name) is str
 
         # Check if it is in this scope or any non-root parents
+        info = self.resolved.get(name)
+        if info != None and info.local:
+            return False
         curr = self
         while True:
-            if name in curr.vars and curr.vars[name] != INVALID_VARIABLE:
+            slot = curr.vars.get(name)
+            if slot != None and curr.slots[slot] is not INVALID_VARIABLE:
                 return False
             if curr.root: break
             curr = curr.up
 
-        self.vars[name] = Variable(ty, mutable, init)
+        var = Variable(ty, mutable, init)
+        slot = self.vars.get(name)
+        if slot == None:
+            self.vars[name] = len(self.slots)
+            self.slots.append(var)
+            if self.journal != None:
+                self.journal.append(('var', name))
+        else:
+            if self.journal != None:
+                self.journal.append(('slot', name, slot, self.slots[slot]))
+            self.slots[slot] = var
+        # The name may have resolved to a variable which this one shadows
+        self.resolved.pop(name, None)
         return True
 
-    def lookup(self, name):
+    def resolve(self, name):
         """
-        Looks up a variable. Returns a VariableInfo object.
-        None is returned if there is no variable with the given name.
-        Initializes the variable with init() before returning
-        If the variable has an associated init, and has not been init-ed,
-        invokes that function.
+        Walks the scope chain to find the variable with the given name.
+        Returns a VariableInfo object, INVALID_VARIABLE if the variable has
+        been found but not yet declared, or None if there is no such variable.
         """
         local = True
         curr = self
@@ -390,16 +565,42 @@ class Scope:
             if not (local or curr.root):
                 curr = curr.up
                 continue
-            if name in curr.vars:
-                if curr.vars[name] is INVALID_VARIABLE:
+            slot = curr.vars.get(name)
+            if slot != None:
+                var = curr.slots[slot]
+                if var is INVALID_VARIABLE:
                     return INVALID_VARIABLE
-                curr.vars[name].init()
-                return VariableInfo(curr.vars[name], local, curr.up == None)
+                return VariableInfo(var, local, curr.up == None,
+                                    curr.depth, slot)
             if curr.root:
                 local = False
             curr = curr.up
         return None
 
+    def lookup(self, name):
+        """
+        Looks up a variable. Returns a VariableInfo object.
+        None is returned if there is no variable with the given name.
+        Initializes the variable with init() before returning
+        If the variable has an associated init, and has not been init-ed,
+        invokes that function.
+        """
+        info = self.resolved.get(name)
+        if info != None:
+            return info
+        info = self.resolve(name)
+        ctx = self.ctx # None outside of validate
+        if ctx != None and ctx.unit != None: # Checking incrementally
+            ctx.unit.found(name, info)
+        if info == None or info is INVALID_VARIABLE:
+            return info
+        if info.depth == 0 and ctx != None:
+            ctx.demand(info.var)
+        else:
+            info.var.init()
+        self.resolved[name] = info
+        return info
+
     def lookup_class(self, name):
         """
         Looks up a class with the given name. Returns the type of the class if
@@ -408,9 +609,15 @@ class Scope:
         curr = self
         while curr != None:
             if name in curr.classes:
-                return curr.classes[name]
+                clazz = curr.classes[name]
+                break
             curr = curr.up
-        return None
+        else:
+            clazz = None
+        unit = self.ctx.unit if self.ctx != None else None
+        if unit != None and (curr == None or curr.up == None):
+            unit.deps.append(('class', name, clazz))
+        return clazz
 
     def declare_class(self, name, clazz):
         """
@@ -428,42 +635,80 @@ class Scope:
             curr = curr.up
 
         self.classes[name] = clazz
+        if self.journal != None:
+            self.journal.append(('class', name))
         return True
 
     def found_local(self, name):
         assert self.root
         if name not in self.vars:
-            self.vars[name] = INVALID_VARIABLE
+            self.vars[name] = len(self.slots)
+            self.slots.append(INVALID_VARIABLE)
+            self.resolved.pop(name, None)
+            if self.journal != None:
+                self.journal.append(('var', name))
 
     def backup(self):
+        """
+        Capture the state of the global scope, such that it can be restored.
+        Backups must be restored in the reverse order to which they were taken.
+        """
         assert self.up == None and self.root and self._func == None
-        return {
-            'vars': self.vars.copy(),
-            'classes': self.classes.copy(),
-        }
+        journal = self.journal
+        return (len(journal), journal[-1] if journal else None)
 
     def restore(self, backup):
         assert self.up == None and self.root and self._func == None
-        self.vars = backup['vars']
-        self.classes = backup['classes']
+        length, last = backup
+        journal = self.journal
+        if len(journal) < length or \
+           (length > 0 and journal[length - 1] is not last):
+            raise ValueError("The state of the scope has already been "
+                             "rolled back past this backup")
+        while len(journal) > length:
+            entry = journal.pop()
+            kind = entry[0]
+            if kind == 'init': # The body of a function must be validated again
+                entry[1]._init = entry[2]
+                continue
+            name = entry[1]
+            if kind == 'var':
+                del self.vars[name]
+                self.slots.pop()
+            elif kind == 'slot':
+                self.slots[entry[2]] = entry[3]
+            else:
+                del self.classes[name]
+            self.resolved.pop(name, None)
 
     def flush(self):
-        for var in self.vars.values():
+        for var in self.slots:
             if var != INVALID_VARIABLE:
-                var.init()
+                if self.up == None:
+                    self.ctx.demand(var)
+                else:
+                    var.init()
 
 
 # Garter defines keywords which aren't present in Python. We need to reject
 # these keywords whenever they are present as identifiers in unintended places
-keyword_re = re.compile(r'__.+__|' # Starting and ending with __ => keyword
-                        r'int|float|bool|str|' # Type keywords
-                        r'len|range|print') # Magic Functions
+KEYWORDS = frozenset(['int', 'float', 'bool', 'str', # Type keywords
+                      'len', 'range', 'print']) # Magic Functions
+def is_keyword(name):
+    # Starting and ending with __ => keyword
+    return name in KEYWORDS or \
+        (len(name) > 4 and name.startswith('__') and name.endswith('__'))
+
 def ensure_non_keyword(name, node=None):
+    """
+    Names are checked where they are declared, so that uses only need checking
+    when they fail to resolve to a declaration.
+    """
     if isinstance(name, ast.Name):
         if node == None:
             node = name
         name = name.id
-    if keyword_re.match(name):
+    if is_keyword(name):
         raise GarterError(node, "Expected identifier, "
                           "instead found keyword {}".format(name))
 
@@ -501,10 +746,10 @@ def validate_type(scope, expr):
             return TY_BOOL
 
         # Class Types
-        ensure_non_keyword(expr)
         clazz = scope.lookup_class(expr.id)
         if clazz != None:
             return clazz
+        ensure_non_keyword(expr)
 
         raise GarterError(expr, "Unrecognized type name {}".format(expr.id))
 
@@ -560,7 +805,7 @@ def validate_funclike(scope, stmt, selfty=None):
     # Determine the types of the arguments
     arg_tys = []
     args = arguments.args[:]
-    inner = Scope(scope, root=True)
+    params = [] # The (name, type) of each argument, including self
 
     # Handle the implicit self argument if present
     if selfty != None:
@@ -569,8 +814,7 @@ def validate_funclike(scope, stmt, selfty=None):
         if isa.annotation != None:
             raise GarterError(isa,
                               "The implicit self argument should not have a type annotation")
-        if not inner.declare(isa.arg, selfty):
-            raise RuntimeError("This should not be able to happen...")
+        params.append((isa.arg, selfty))
 
     # Handle non-implicit self arguments
     for arg in args:
@@ -579,29 +823,44 @@ def validate_funclike(scope, stmt, selfty=None):
             raise GarterError(arg, "Type annotations on arguments are required")
         ty = validate_type(scope, arg.annotation)
         arg_tys.append(ty) # Record the type of the argument
-        if not inner.declare(arg.arg, ty):
+        if any(name == arg.arg for name, _ in params):
             raise GarterError(arg, f"There is another argument with name {arg.arg}")
+        params.append((arg.arg, ty))
 
     # Create the function type and the validation function
     fty = TyFunc(returns, arg_tys)
+    filename = scope.ctx.filename
     def func_init():
         """ The logic which is run when the function is referenced / invoked for the first time """
-        # Discover locals for scoping rules
-        discover_locals(inner, stmt.body)
-        # Perform the actual validation
-        inner._func = fty
-        did_return = validate_stmts(inner, stmt.body, froot=True)
-        if not did_return and returns != TY_NONE:
-            raise GarterError(stmt, "Control flow reaches end of non-void function")
-        # Flush all functions declared within this function!
-        inner.flush()
+        # The body may be validated again if a lazy global scope is restored
+        # after validating it, so nothing may be kept from an earlier attempt
+        inner = Scope(scope, root=True)
+        for name, ty in params:
+            inner.declare(name, ty)
+        try:
+            # Discover locals for scoping rules
+            discover_locals(inner, stmt.body)
+            # Perform the actual validation
+            inner._func = fty
+            did_return = validate_stmts(inner, stmt.body, froot=True)
+            if not did_return and returns != TY_NONE:
+                inner.ctx.report(GarterError(stmt, "Control flow reaches end "
+                                             "of non-void function"))
+            # Flush all functions declared within this function!
+            inner.flush()
+        except GarterError as err:
+            # Functions may be validated by a later check than declared them
+            if err.filename == None and not isinstance(err, GarterErrors):
+                err.locate(filename)
+            raise
+        inner.ctx.stats['functions'] += 1
 
     return (fty, func_init)
 
 
 def validate_boolop(scope, expr):
     for value in expr.values:
-        ty = validate_expr(scope, value)
+        ty = yield value
         if not TY_BOOL.subsumes(ty):
             # XXX: Print the actual type?
             raise GarterError(expr,
@@ -609,119 +868,145 @@ def validate_boolop(scope, expr):
     return TY_BOOL
 
 
-def validate_binop(scope, expr):
-    lhs = validate_expr(scope, expr.left)
-    rhs = validate_expr(scope, expr.right)
-
+# The result types of the binary and unary operators, keyed on the operator
+# and operand types. Operand types which are not listed are errors, with the
+# exception of list concatenation, which is handled by validate_binop.
+BINOP_SYMBOLS = {
+    ast.Add: '+',
+    ast.Sub: '-',
+    ast.Mult: '*',
+    ast.Div: '/',
+    ast.Mod: '%',
+    ast.Pow: '**',
+    ast.FloorDiv: '//',
+}
+BINOP_RESULTS = {}
+for _op in BINOP_SYMBOLS:
+    for _lhs in (TY_INT, TY_FLOAT):
+        for _rhs in (TY_INT, TY_FLOAT):
+            BINOP_RESULTS[_op, _lhs, _rhs] = TY_FLOAT
+for _op in (ast.Add, ast.Sub, ast.Mult, ast.Mod, ast.FloorDiv):
+    BINOP_RESULTS[_op, TY_INT, TY_INT] = TY_INT
+BINOP_RESULTS[ast.Add, TY_STR, TY_STR] = TY_STR
+
+# The spec recorded on arithmetic and comparisons of numbers, from which the
+# compiler emits opcodes specialized for ints or floats
+OPERAND_SPECS = {
+    (TY_INT, TY_INT): _garter.SPEC_INT,
+    (TY_INT, TY_FLOAT): _garter.SPEC_FLOAT,
+    (TY_FLOAT, TY_INT): _garter.SPEC_FLOAT,
+    (TY_FLOAT, TY_FLOAT): _garter.SPEC_FLOAT,
+}
+
+# The spec recorded on list displays of numbers and bools, from which the
+# compiler emits typed lists, which store their items unboxed
+LIST_SPECS = {
+    TY_INT: _garter.SPEC_INT,
+    TY_FLOAT: _garter.SPEC_FLOAT,
+    TY_BOOL: _garter.SPEC_BOOL,
+}
+
+UNARYOP_SYMBOLS = {
+    ast.Not: 'not',
+    ast.UAdd: '+',
+    ast.USub: '-',
+}
+UNARYOP_RESULTS = {
+    (ast.Not, TY_BOOL): TY_BOOL,
+    (ast.UAdd, TY_INT): TY_INT,
+    (ast.UAdd, TY_FLOAT): TY_FLOAT,
+    (ast.USub, TY_INT): TY_INT,
+    (ast.USub, TY_FLOAT): TY_FLOAT,
+}
+
+
+def validate_binop(scope, expr, lvalue, lhs, rhs):
     op = type(expr.op)
-    if op is ast.Add:
-        if TY_INT.subsumes(lhs) and TY_INT.subsumes(rhs):
-            return TY_INT
-        elif TY_FLOAT.subsumes(lhs) and TY_FLOAT.subsumes(rhs):
-            return TY_FLOAT
-        elif TY_STR.subsumes(lhs) and TY_STR.subsumes(rhs):
-            return TY_STR
-        elif type(lhs) is TyList and type(rhs) is TyList:
-            item = subsumes(lhs.item, rhs.item)
-            if item != None:
-                return TyList(item)
-        raise GarterError(expr, "Invalid operands to +: {} and {}".format(lhs, rhs))
-    elif op is ast.Sub:
-        if TY_INT.subsumes(lhs) and TY_INT.subsumes(rhs):
-            return TY_INT
-        elif TY_FLOAT.subsumes(lhs) and TY_FLOAT.subsumes(rhs):
-            return TY_FLOAT
-        raise GarterError(expr, "Invalid operands to -: {} and {}".format(lhs, rhs))
-    elif op is ast.Mult:
-        if TY_INT.subsumes(lhs) and TY_INT.subsumes(rhs):
-            return TY_INT
-        elif TY_FLOAT.subsumes(lhs) and TY_FLOAT.subsumes(rhs):
-            return TY_FLOAT
-        raise GarterError(expr, "Invalid operands to *: {} and {}".format(lhs, rhs))
-    elif op is ast.Div:
-        if TY_FLOAT.subsumes(lhs) and TY_FLOAT.subsumes(rhs):
-            return TY_FLOAT
-        raise GarterError(expr, "Invalid operands to /: {} and {}".format(lhs, rhs))
-    elif op is ast.Mod:
-        if TY_INT.subsumes(lhs) and TY_INT.subsumes(rhs):
-            return TY_INT
-        elif TY_FLOAT.subsumes(lhs) and TY_FLOAT.subsumes(rhs):
-            return TY_FLOAT
-        raise GarterError(expr, "Invalid operands to %: {} and {}".format(lhs, rhs))
-    elif op is ast.Pow:
-        if TY_FLOAT.subsumes(lhs) and TY_FLOAT.subsumes(rhs):
-            return TY_FLOAT
-        raise GarterError(expr, "Invalid operands to **: {} and {}".format(lhs, rhs))
-    elif op is ast.FloorDiv:
-        if TY_INT.subsumes(lhs) and TY_INT.subsumes(rhs):
-            return TY_INT
-        elif TY_FLOAT.subsumes(lhs) and TY_FLOAT.subsumes(rhs):
-            return TY_FLOAT
-        raise GarterError(expr, "Invalid operands to //: {} and {}".format(lhs, rhs))
+    result = BINOP_RESULTS.get((op, lhs, rhs))
+    if result != None:
+        expr.spec = OPERAND_SPECS.get((lhs, rhs), _garter.SPEC_NONE)
+        return result
+    expr.spec = _garter.SPEC_NONE
+    if op not in BINOP_SYMBOLS:
+        raise GarterError(expr, "Unrecognized binary operator")
+    if op is ast.Add and type(lhs) is TyList and type(rhs) is TyList:
+        item = subsume(lhs.item, rhs.item)
+        if item != None:
+            return TyList(item)
+    raise GarterError(expr, "Invalid operands to {}: {} and {}".format(
+        BINOP_SYMBOLS[op], lhs, rhs))
+
+
+def validate_unaryop(scope, expr, lvalue, operand):
+    op = type(expr.op)
+    result = UNARYOP_RESULTS.get((op, operand))
+    if result != None:
+        return result
+    if op not in UNARYOP_SYMBOLS:
+        raise GarterError(expr, "Unrecognized unary operator")
+    raise GarterError(expr, "Invalid operand to {}: {}".format(
+        UNARYOP_SYMBOLS[op], operand))
 
-    raise GarterError(expr, "Unrecognized binary operator")
 
+def validate_compare(scope, expr):
+    spec = _garter.SPEC_INT
+    left = yield expr.left
+    for op, right_expr in zip(expr.ops, expr.comparators):
+        right = yield right_expr
+        validate_comparison(expr, op, left, right)
+        # The comparisons of a chain are specialized together, so each pair
+        # of operands must be numbers
+        pair = OPERAND_SPECS.get((left, right), _garter.SPEC_NONE)
+        if pair == _garter.SPEC_NONE or spec == _garter.SPEC_NONE:
+            spec = _garter.SPEC_NONE
+        elif pair == _garter.SPEC_FLOAT:
+            spec = pair
+        left = right
 
-def validate_unaryop(scope, expr):
-    operand = validate_expr(scope, expr.operand)
+    expr.spec = spec
+    return TY_BOOL
 
-    op = type(expr.op)
-    if op is ast.Not:
-        if TY_BOOL.subsumes(operand):
-            return TY_BOOL
-        raise GarterError(expr, "Invalid operand to not: {}".format(operand))
-    elif op is ast.UAdd:
-        if TY_FLOAT.subsumes(operand):
-            return operand
-        raise GarterError(expr, "Invalid operand to +: {}".format(operand))
-    elif op is ast.USub:
-        if TY_FLOAT.subsumes(operand):
-            return operand
-        raise GarterError(expr, "Invalid operand to -: {}".format(operand))
 
-    raise GarterError(expr, "Unrecognized unary operator")
+def validate_single_compare(scope, expr, lvalue, left, right):
+    validate_comparison(expr, expr.ops[0], left, right)
+    expr.spec = OPERAND_SPECS.get((left, right), _garter.SPEC_NONE)
+    return TY_BOOL
 
 
-def validate_compare(scope, expr):
-    left = validate_expr(scope, expr.left)
-    for op, right_expr in zip(expr.ops, expr.comparators):
-        right = validate_expr(scope, right_expr)
-        kind = type(op)
-        # XXX: Actually write out the right operator in error messages
-        if kind == ast.Eq or kind == ast.NotEq:
-            x = subsume(left, right)
-            if x == None:
-                raise GarterError(expr, f"Invalid operands to ==/!=: {left} and {right}")
-
-        elif kind == ast.Lt or kind == ast.LtE or \
-             kind == ast.Gt or kind == ast.GtE:
-            if not (TY_FLOAT.subsumes(left) and TY_FLOAT.subsumes(right)):
-                raise GarterError(expr, f"Invalid operands to </<=/>/>=: {left} and {right}")
-
-        elif kind == ast.In or kind == ast.NotIn:
-            if right == TY_STR:
-                if not right.subsumes(left):
-                    raise GarterError(expr, f"Invalid operands to in: {left} and {right}")
-            elif type(right) == TyList:
-                if not right.item.subsumes(left):
-                    raise GarterError(expr, f"Invalid operands to in: {left} and {right}")
-            elif type(right) == TyDict:
-                if not right.key.subsumes(left):
-                    raise GarterError(expr, f"Invalid operands to in: {left} and {right}")
-            else:
-                raise GarterError(expr, f"Invalid operands to in: {left} and {right}")
+def validate_comparison(expr, op, left, right):
+    kind = type(op)
+    # XXX: Actually write out the right operator in error messages
+    if kind == ast.Eq or kind == ast.NotEq:
+        x = subsume(left, right)
+        if x == None:
+            raise GarterError(expr, f"Invalid operands to ==/!=: {left} and {right}")
+
+    elif kind == ast.Lt or kind == ast.LtE or \
+         kind == ast.Gt or kind == ast.GtE:
+        if not (TY_FLOAT.subsumes(left) and TY_FLOAT.subsumes(right)):
+            raise GarterError(expr, f"Invalid operands to </<=/>/>=: {left} and {right}")
 
+    elif kind == ast.In or kind == ast.NotIn:
+        if right == TY_STR:
+            if not right.subsumes(left):
+                raise GarterError(expr, f"Invalid operands to in: {left} and {right}")
+        elif type(right) == TyList:
+            if not right.item.subsumes(left):
+                raise GarterError(expr, f"Invalid operands to in: {left} and {right}")
+        elif type(right) == TyDict:
+            if not right.key.subsumes(left):
+                raise GarterError(expr, f"Invalid operands to in: {left} and {right}")
         else:
-            raise GarterError(expr, "Unsupported operator")
-        left = right
+            raise GarterError(expr, f"Invalid operands to in: {left} and {right}")
 
-    return TY_BOOL
+    else:
+        raise GarterError(expr, "Unsupported operator")
 
 
-def validate_name(scope, expr, lvalue):
-    ensure_non_keyword(expr)
+def validate_name(scope, expr, lvalue=False):
     var = scope.lookup(expr.id)
     if var == None:
+        ensure_non_keyword(expr)
         raise GarterError(expr, "No variable with name {} in scope".format(expr.id))
     if var == INVALID_VARIABLE:
         raise GarterError(expr, "The variable with name {} may not be initialized".format(expr.id))
@@ -733,16 +1018,20 @@ def validate_name(scope, expr, lvalue):
             raise GarterError(expr, f"Cannot assign to {expr.id}, as it is "
                                 "non-local. Try using the `nonlocal` or "
                                 "`global` statement to expose it in this scope")
+    # Variables are declared before they are used, and never deleted, so
+    # the compiler can load them with the opcodes specialized for bound ones
+    if not lvalue:
+        expr.spec = _garter.SPEC_BOUND
     return var.ty
 
 
 def validate_ifexp(scope, expr):
-    test = validate_expr(scope, expr.test)
+    test = yield expr.test
     if not TY_BOOL.subsumes(test):
         raise GarterError(expr.test,
                           "Test in if expression must have type bool")
-    then = validate_expr(scope, expr.body)
-    orelse = validate_expr(scope, expr.orelse)
+    then = yield expr.body
+    orelse = yield expr.orelse
 
     result = subsume(then, orelse)
     if result == None:
@@ -750,16 +1039,56 @@ def validate_ifexp(scope, expr):
     return result
 
 
+_num = operator.attrgetter('n')
+_value = operator.attrgetter('value')
+
+def literal_type(scope, exprs):
+    """
+    If exprs are all literal numbers, all literal strings or all literal
+    booleans, returns the type which they have in common, found without
+    validating each of them, such that large literal tables are checked
+    quickly. Returns None otherwise, or when the type of each expression must
+    be recorded for gcompile(..., return_types=True).
+    """
+    if not exprs or scope.ctx.types is not None:
+        return None
+    kinds = set(map(type, exprs))
+    if len(kinds) != 1:
+        return None
+    kind = kinds.pop()
+    if kind is ast.Num:
+        # As in validate_num, but joined: [1, 2.3] is [float]
+        if set(map(type, map(_num, exprs))) == {int}:
+            return TY_INT
+        return TY_FLOAT
+    if kind is ast.Str:
+        return TY_STR
+    if kind is ast.NameConstant:
+        if set(map(type, map(_value, exprs))) == {bool}:
+            return TY_BOOL
+    return None
+
+
 def validate_dict(scope, expr):
+    key = literal_type(scope, expr.keys)
+    value = literal_type(scope, expr.values)
+    if key != None and value != None:
+        return TyDict(key, value)
+    return validate_dict_items(scope, expr)
+
+
+def validate_dict_items(scope, expr):
     key = None
     value = None
     for (kvalue, vvalue) in zip(expr.keys, expr.values):
-        key_ty = validate_expr(scope, kvalue)
-        value_ty = validate_expr(scope, vvalue)
+        key_ty = yield kvalue
+        value_ty = yield vvalue
         if key == None:
             key = key_ty
             value = value_ty
             continue
+        if key_ty is key and value_ty is value:
+            continue
         if not key.subsumes(key_ty):
             if key_ty.subsumes(key):
                 key = key_ty
@@ -776,26 +1105,40 @@ def validate_dict(scope, expr):
 
 
 def validate_list(scope, expr):
+    elt = literal_type(scope, expr.elts)
+    if elt != None:
+        expr.spec = LIST_SPECS.get(elt, _garter.SPEC_NONE)
+        return TyList(elt)
+    return validate_list_items(scope, expr)
+
+
+def validate_list_items(scope, expr):
     elt = None
     for value in expr.elts:
-        ty = validate_expr(scope, value)
+        ty = yield value
         if elt == None:
             elt = ty
             continue
-        if not elt.subsumes(ty):
+        if ty is not elt and not elt.subsumes(ty):
             if ty.subsumes(elt):
                 elt = ty # e.g. [1, 2.3] is [float]
                 continue
             raise GarterError(expr, "Mismatched Types: Arrays must contain "
                               "consistent element types.")
+    expr.spec = LIST_SPECS.get(elt, _garter.SPEC_NONE)
     return TyList(elt) # Works even if elt is None
 
 
-def validate_attribute(scope, expr, lvalue):
-    ty = validate_expr(scope, expr.value)
-    ensure_non_keyword(expr.attr, expr)
+def specialize_empty_list(expr, ty):
+    # Empty list displays take the type of the items from where they're used
+    if type(expr) == ast.List and not expr.elts and type(ty) == TyList:
+        expr.spec = LIST_SPECS.get(ty.item, _garter.SPEC_NONE)
+
+
+def validate_attribute(scope, expr, lvalue, ty):
     attr = ty.attribute(expr.attr)
     if attr == None:
+        ensure_non_keyword(expr.attr, expr)
         raise GarterError(expr, f"{ty} does not have an attribute {expr.attr}")
     if lvalue and not attr.mutable:
         raise GarterError(expr, "Attempt to assign to immutable attribute")
@@ -803,16 +1146,13 @@ def validate_attribute(scope, expr, lvalue):
 
 
 def validate_subscript_slice(scope, expr, lvalue):
-    ty = validate_expr(scope, expr.value)
-    def require_int(x):
+    ty = yield expr.value
+    for x in (expr.slice.lower, expr.slice.upper, expr.slice.step):
         if x != None:
-            ty = validate_expr(scope, x)
-            if not TY_INT.subsumes(ty):
+            bound = yield x
+            if not TY_INT.subsumes(bound):
                 raise GarterError(x, "Expected int as slice operand, "
-                                  "instead got {}".format(ty))
-    require_int(expr.slice.lower)
-    require_int(expr.slice.upper)
-    require_int(expr.slice.step)
+                                  "instead got {}".format(bound))
 
     if type(ty) == TyStr:
         if lvalue:
@@ -823,10 +1163,7 @@ def validate_subscript_slice(scope, expr, lvalue):
     raise GarterError(expr, "Type {} does not support slicing".format(ty))
 
 
-def validate_subscript_index(scope, expr, lvalue):
-    ty = validate_expr(scope, expr.value)
-    index = validate_expr(scope, expr.slice.value)
-
+def validate_subscript_index(scope, expr, lvalue, ty, index):
     if type(ty) == TyStr:
         if lvalue:
             raise GarterError(expr, "str is immutable, cannot mutate it")
@@ -836,6 +1173,7 @@ def validate_subscript_index(scope, expr, lvalue):
     elif type(ty) == TyList:
         if not TY_INT.subsumes(index):
             raise GarterError(expr, "Can only index into {} with int".format(ty))
+        expr.spec = _garter.SPEC_LIST
         return ty.item
     elif type(ty) == TyDict:
         if not ty.key.subsumes(index):
@@ -844,27 +1182,29 @@ def validate_subscript_index(scope, expr, lvalue):
 
 
 def validate_subscript(scope, expr, lvalue):
-    slicekind = type(expr.slice)
-    if slicekind == ast.Slice:
+    # Indexing is validated as an operator, by validate_subscript_index
+    if type(expr.slice) == ast.Slice:
         return validate_subscript_slice(scope, expr, lvalue)
-    elif slicekind == ast.Index:
-        return validate_subscript_index(scope, expr, lvalue)
     raise GarterError(expr, "Unaccepted slice format")
 
 
 def validate_call(scope, expr):
     if len(expr.keywords) > 0:
         raise GarterError(expr, "Keyword arguments are not supported")
-    func = validate_expr(scope, expr.func)
+    func = yield expr.func
     if type(func) != TyFunc:
         raise GarterError(expr, f"Expected a function object, instead found {func}")
     if len(func.args) != len(expr.args):
         raise GarterError(expr, "Function of type {} expected {} arguments, "
                           "instead found {}".format(func, len(func.args), len(expr.args)))
     for ty, arg in zip(func.args, expr.args):
-        arg_ty = validate_expr(scope, arg)
+        arg_ty = yield arg
         if not ty.subsumes(arg_ty):
             raise GarterError(arg, "Expected {}, instead found {}".format(ty, arg_ty))
+        specialize_empty_list(arg, ty)
+    # Exactly the declared positional arguments are passed, so a Python
+    # function can be called without binding them by name
+    expr.spec = _garter.SPEC_DIRECT
     return func.ret
 
 
@@ -873,7 +1213,7 @@ def validate_len(scope, expr):
         raise GarterError(expr, "len() doesn't accept keyword arguments")
     if len(expr.args) != 1:
         raise GarterError(expr, "len() accepts exactly 1 argument")
-    ty = validate_expr(scope, expr.args[0])
+    ty = yield expr.args[0]
     if type(ty) == TyStr or \
        type(ty) == TyList or \
        type(ty) == TyDict:
@@ -881,17 +1221,25 @@ def validate_len(scope, expr):
     raise GarterError(expr.args[0], f"the len() operation is not supported on {ty}")
 
 
+CAST_TYPES = {
+    'int': TY_INT,
+    'str': TY_STR,
+    'float': TY_FLOAT,
+}
+
+
 def validate_cast(scope, expr):
     if len(expr.keywords) > 0:
         raise GarterError(expr, "casts don't accept keyword arguments")
     if len(expr.args) != 1:
         raise GarterError(expr, "casts accept exactly 1 argument")
-    ty = validate_expr(scope, expr.args[0])
+    ty = yield expr.args[0]
     if type(ty) != TyStr and \
        type(ty) != TyInt and \
        type(ty) != TyFloat:
         raise GarterError(expr.args[0],
                           f"can only cast from str, int, or float, instead found {ty}")
+    return CAST_TYPES[expr.func.id]
 
 
 def validate_input(scope, expr):
@@ -900,89 +1248,319 @@ def validate_input(scope, expr):
     if len(expr.args) > 1:
         raise GarterError(expr, "input() accepts only 0-1 arguments")
     if len(expr.args) == 0:
-        return
-    ty = validate_expr(scope, expr.args[0])
+        return TY_STR
+    ty = yield expr.args[0]
     if ty != TY_STR:
         raise GarterError(expr.args[0], "expected str parameter, instead found {ty}")
+    return TY_STR
 
 
-def validate_expr(scope, expr, lvalue = False):
-    # Confirm that it is valid in the lvalue context
-    kind = type(expr)
-    if lvalue and not (kind is ast.Name or
-                       kind is ast.Subscript or
-                       kind is ast.Attribute):
-        raise GarterError(expr, "Can only assign to names, "
-                            "attributes, and subscriptions")
+# Magic functions, which are validated specially when called by name
+BUILTIN_CALLS = {
+    'len': validate_len,
+    'int': validate_cast,
+    'str': validate_cast,
+    'float': validate_cast,
+    'input': validate_input,
+}
 
-    if kind is ast.Num:
-        if isinstance(expr.n, int):
-            return TY_INT
-        return TY_FLOAT
 
-    elif kind is ast.Str:
-        return TY_STR
+def validate_callexpr(scope, expr):
+    if type(expr.func) is ast.Name:
+        builtin = BUILTIN_CALLS.get(expr.func.id)
+        if builtin != None:
+            return builtin(scope, expr)
+    return validate_call(scope, expr)
 
-    elif kind is ast.Name:
-        return validate_name(scope, expr, lvalue)
 
-    elif kind is ast.BoolOp:
-        return validate_boolop(scope, expr)
+def validate_num(scope, expr):
+    if isinstance(expr.n, int):
+        return TY_INT
+    return TY_FLOAT
 
-    elif kind is ast.NameConstant:
-        if isinstance(expr.value, bool):
-            return TY_BOOL
-        if expr.value == None:
-            return TyClass('__unknown__', None)
-        raise GarterError(expr, "Unrecognized NameConstant")
 
-    elif kind is ast.List:
-        return validate_list(scope, expr)
+def validate_str(scope, expr):
+    return TY_STR
 
-    elif kind is ast.Dict:
-        return validate_dict(scope, expr)
 
-    elif kind is ast.BinOp:
-        return validate_binop(scope, expr)
+def validate_nameconstant(scope, expr):
+    if isinstance(expr.value, bool):
+        return TY_BOOL
+    if expr.value == None:
+        return TyClass('__unknown__', None)
+    raise GarterError(expr, "Unrecognized NameConstant")
 
-    elif kind is ast.UnaryOp:
-        return validate_unaryop(scope, expr)
 
-    elif kind is ast.IfExp:
-        return validate_ifexp(scope, expr)
+def validate_lambda(scope, expr):
+    raise NotImplementedError()
+
+
+# The validators for each kind of expression node. Validators for expressions
+# which may be assigned to are passed whether they are in an lvalue context,
+# all other kinds of expressions are rejected in lvalue contexts.
+#
+# Validators of expressions with subexpressions are generators, which yield
+# each subexpression to be validated, and are sent its type (see validate_expr),
+# or return such a generator.
+#
+# New kinds of expressions may be supported by registering them here.
+LVALUE_VALIDATORS = {
+    ast.Name: validate_name,
+    ast.Subscript: validate_subscript,
+}
+EXPR_VALIDATORS = {
+    ast.Num: validate_num,
+    ast.Str: validate_str,
+    ast.BoolOp: validate_boolop,
+    ast.NameConstant: validate_nameconstant,
+    ast.List: validate_list,
+    ast.Dict: validate_dict,
+    ast.IfExp: validate_ifexp,
+    ast.Lambda: validate_lambda,
+    ast.Compare: validate_compare,
+    ast.Call: validate_callexpr,
+}
+# The validators of operators, which only need the types of all of their
+# operands, are instead passed them, after whether they are in an lvalue
+# context, once they have all been validated, which avoids suspending the
+# validator. Each is registered with a function giving the operands of the
+# expression, or None if it is instead validated by the validator registered
+# above, and whether the expression may be assigned to.
+OPERATOR_VALIDATORS = {
+    ast.BinOp: (validate_binop, operator.attrgetter('left', 'right'), False),
+    ast.UnaryOp: (validate_unaryop, lambda expr: (expr.operand,), False),
+    ast.Attribute: (validate_attribute, lambda expr: (expr.value,), True),
+    ast.Compare: (validate_single_compare,
+                  lambda expr: (expr.left, expr.comparators[0])
+                               if len(expr.comparators) == 1 else None,
+                  False),
+    ast.Subscript: (validate_subscript_index,
+                    lambda expr: (expr.value, expr.slice.value)
+                                 if type(expr.slice) == ast.Index else None,
+                    True),
+}
+# The validators of expressions without subexpressions, which are called
+# directly when they are the operands of operators or yielded by validators
+LEAF_VALIDATORS = {
+    ast.Num: validate_num,
+    ast.Str: validate_str,
+    ast.Name: validate_name,
+    ast.NameConstant: validate_nameconstant,
+}
+
+
+# Subexpressions are validated recursively up to this depth, and beyond it by
+# validate_expr_deep, which doesn't recurse. Recursion is faster for the
+# shallow expressions which are usual, but is limited by the recursion limit.
+MAX_RECURSIVE_DEPTH = 50
+
+
+def validate_expr(scope, expr, lvalue = False, depth = 0):
+    """
+    Validates expr, returning its type. Subexpressions are validated
+    recursively, with the depth of expr, until it reaches MAX_RECURSIVE_DEPTH.
+    """
+    if depth >= MAX_RECURSIVE_DEPTH:
+        return validate_expr_deep(scope, expr, lvalue)
+    ctx = scope.ctx
+    poisons = ctx.poisons
+    depth += 1
+    try:
+        kind = type(expr)
+        leaf = LEAF_VALIDATORS.get(kind)
+        if leaf is not None and not lvalue:
+            ty = leaf(scope, expr)
+        else:
+            op = OPERATOR_VALIDATORS.get(kind)
+            operands = None
+            if op is not None and (op[2] or not lvalue):
+                operands = op[1](expr)
+            if operands is None:
+                ty = dispatch_expr(scope, expr, lvalue)
+                if type(ty) is GeneratorType:
+                    ty = drive_validator(scope, ty, depth)
+            elif len(operands) == 1:
+                ty = op[0](scope, expr, lvalue,
+                           validate_expr(scope, operands[0], False, depth))
+            else:
+                ty = op[0](scope, expr, lvalue,
+                           validate_expr(scope, operands[0], False, depth),
+                           validate_expr(scope, operands[1], False, depth))
+    except Exception as err:
+        ty, err = finish_expr(ctx, expr, poisons, None, err)
+        if err is not None:
+            raise err
+        return ty
+    if ty is TY_ERROR or ctx.types is not None:
+        ty, _ = finish_expr(ctx, expr, poisons, ty, None)
+    return ty
+
 
-    elif kind is ast.Lambda:
-        raise NotImplementedError()
+def drive_validator(scope, validator, depth):
+    """
+    Validates each subexpression which the suspended validator yields, at
+    depth, returning the type it returns.
+    """
+    ty = err = None
+    while True:
+        try:
+            if err is None:
+                expr = validator.send(ty)
+            else:
+                expr, err = validator.throw(err), None
+        except StopIteration as stop:
+            return stop.value
+        try:
+            ty = validate_expr(scope, expr, False, depth)
+        except Exception as e:
+            ty, err = None, e
 
-    elif kind is ast.Compare:
-        return validate_compare(scope, expr)
 
-    elif kind is ast.Call:
-        if type(expr.func) is ast.Name:
-            if expr.func.id == "len":
-                return validate_len(scope, expr)
-            elif expr.func.id == "int":
-                validate_cast(scope, expr)
-                return TY_INT
-            elif expr.func.id == "str":
-                validate_cast(scope, expr)
-                return TY_STR
-            elif expr.func.id == "float":
-                validate_cast(scope, expr)
-                return TY_FLOAT
-            elif expr.func.id == "input":
-                validate_input(scope, expr)
-                return TY_STR
+def validate_expr_deep(scope, expr, lvalue = False):
+    """
+    Validates expr, returning its type. Rather than validating subexpressions
+    recursively, the validators of expressions which have them are suspended on
+    a stack while each subexpression they yield is validated, such that the
+    depth of expressions isn't limited by the recursion limit. Errors are
+    passed to the suspended validators as if they had been raised by a
+    recursive call.
+    """
+    ctx = scope.ctx
+    record = ctx.types is not None
+    # The expressions being validated, innermost last, as (validator, expr,
+    # lvalue, poisons, operands, types) frames. The validator is a suspended
+    # generator, or, for operators, the function which is called with the types
+    # of the operands once they have all been validated.
+    stack = []
+    ty = err = None
+    while True:
+        # Start validating expr
+        poisons = ctx.poisons
+        op = OPERATOR_VALIDATORS.get(type(expr))
+        operands = None
+        if op is not None and (op[2] or not lvalue):
+            validator, operands, _ = op
+            operands = operands(expr)
+        if operands is not None:
+            types = []
+            # Operands without subexpressions are validated immediately
+            for operand in operands:
+                leaf = LEAF_VALIDATORS.get(type(operand))
+                if leaf is None:
+                    break
+                operand_poisons = ctx.poisons
+                try:
+                    ty = leaf(scope, operand)
+                except Exception as e:
+                    ty, err = None, e
+                if err is not None or ty is TY_ERROR or record:
+                    ty, err = finish_expr(ctx, operand, operand_poisons, ty, err)
+                    if err is not None:
+                        break
+                types.append(ty)
+            else:
+                try:
+                    ty = validator(scope, expr, lvalue, *types)
+                except Exception as e:
+                    ty, err = None, e
+            if err is None and len(types) < len(operands):
+                stack.append((validator, expr, lvalue, poisons, operands, types))
+                expr = operands[len(types)]
+                lvalue = False
+                continue
+        else:
+            try:
+                ty = dispatch_expr(scope, expr, lvalue)
+            except Exception as e:
+                ty, err = None, e
+            if type(ty) is GeneratorType:
+                stack.append((ty, expr, lvalue, poisons, None, None))
+                ty = None
+                poisons = None
+        if poisons is not None and (err is not None or ty is TY_ERROR or record):
+            ty, err = finish_expr(ctx, expr, poisons, ty, err)
+
+        # Pass the result to the innermost validator, until one needs another
+        # subexpression to be validated
+        while stack:
+            validator, parent, lvalue, poisons, operands, types = stack[-1]
+            try:
+                if operands is None:
+                    # Subexpressions without subexpressions of their own are
+                    # validated immediately
+                    while True:
+                        if err is None:
+                            expr = validator.send(ty)
+                        else:
+                            expr = validator.throw(err)
+                            err = None
+                        leaf = LEAF_VALIDATORS.get(type(expr))
+                        if leaf is None:
+                            break
+                        leaf_poisons = ctx.poisons
+                        try:
+                            ty = leaf(scope, expr)
+                        except Exception as e:
+                            ty, err = None, e
+                        if err is not None or ty is TY_ERROR or record:
+                            ty, err = finish_expr(ctx, expr, leaf_poisons, ty, err)
+                    break
+                if err is None:
+                    types.append(ty)
+                    if len(types) < len(operands):
+                        expr = operands[len(types)]
+                        break
+                    ty = validator(scope, parent, lvalue, *types)
+            except StopIteration as stop:
+                ty, err = stop.value, None
+            except Exception as e:
+                ty, err = None, e
+            stack.pop()
+            if err is not None or ty is TY_ERROR or record:
+                ty, err = finish_expr(ctx, parent, poisons, ty, err)
+        else:
+            if err is not None:
+                raise err
+            return ty
+        lvalue = False
 
-        return validate_call(scope, expr)
 
-    elif kind is ast.Attribute:
-        return validate_attribute(scope, expr, lvalue)
+def finish_expr(ctx, expr, poisons, ty, err):
+    """
+    Completes the validation of expr, which produced either the type ty or the
+    exception err, returning the resulting (type, exception) pair. A GarterError
+    is recovered from if errors are being collected, giving the type TY_ERROR.
+    """
+    if err != None:
+        if not isinstance(err, GarterError):
+            return None, err
+        try:
+            ctx.recover(err, poisons)
+        except GarterError as e:
+            return None, e
+        ty = TY_ERROR
+    if ty is TY_ERROR:
+        ctx.poisons += 1
+    if ctx.types is not None:
+        ctx.types[expr] = ty
+    return ty, None
+
+
+def dispatch_expr(scope, expr, lvalue):
+    kind = type(expr)
+    validator = LVALUE_VALIDATORS.get(kind)
+    if validator != None:
+        return validator(scope, expr, lvalue)
 
-    elif kind is ast.Subscript:
-        return validate_subscript(scope, expr, lvalue)
+    # Confirm that it is valid in the lvalue context
+    if lvalue:
+        raise GarterError(expr, "Can only assign to names, "
+                            "attributes, and subscriptions")
 
-    raise GarterError(expr, "Unrecognized expression kind")
+    validator = EXPR_VALIDATORS.get(kind)
+    if validator == None:
+        raise GarterError(expr, "Unrecognized expression kind")
+    return validator(scope, expr)
 
 
 def validate_methoddef(scope, clazz, stmt):
@@ -1008,6 +1586,7 @@ def validate_fielddef(scope, clazz, stmt):
         target_ty = validate_type(scope, stmt.type)
         if not target_ty.subsumes(value_ty):
             raise GarterError(stmt, "Invalid type in assignment")
+        specialize_empty_list(stmt.value, target_ty)
 
     if not target_ty.is_complete():
         raise GarterError(stmt, "Incomplete type in declaration")
@@ -1052,12 +1631,23 @@ def validate_classdef(scope, stmt):
 
     initializers = []
     for s in stmt.body:
-        initializers.append(validate_class_stmt(scope, clazz, s))
+        poisons = scope.ctx.poisons
+        try:
+            initializers.append(validate_class_stmt(scope, clazz, s))
+        except GarterError as err:
+            scope.ctx.recover(err, poisons)
+            poison_field(clazz, s)
 
     # Initialize the methods in the class
     for init in initializers:
         init()
 
+    # The fields are the only attributes of the instances, so they can be
+    # laid out as slots, see compiler_class_slots in compile.c. Their names
+    # can't conflict with __slots__ or __garter_defaults__, as dunder names
+    # are keywords.
+    stmt.spec = _garter.SPEC_SLOTS
+
 
 def validate_assign(scope, stmt):
     if len(stmt.targets) != 1:
@@ -1092,6 +1682,7 @@ def validate_assign(scope, stmt):
 
     if not target_ty.subsumes(value_ty):
         raise GarterError(stmt, "Invalid type in assignment")
+    specialize_empty_list(stmt.value, target_ty)
 
 
 def validate_augassign(scope, stmt):
@@ -1103,6 +1694,7 @@ def validate_augassign(scope, stmt):
     binop.op = stmt.op
     binop.left = stmt.target
     binop.right = stmt.value
+    binop.spec = _garter.SPEC_NONE
     binop.lineno = stmt.lineno
     binop.col_offset = stmt.col_offset
 
@@ -1114,6 +1706,7 @@ def validate_augassign(scope, stmt):
     assign.col_offset = stmt.col_offset
 
     validate_assign(scope, assign)
+    stmt.spec = binop.spec
 
 
 def validate_if(scope, stmt):
@@ -1224,6 +1817,8 @@ def validate_return(scope, stmt):
             raise GarterError(stmt, "Unexpected return value for function with no return value")
         if not returns.subsumes(ty):
             raise GarterError(stmt, "Expected return type {}, instead got {}".format(returns, ty))
+        specialize_empty_list(stmt.value, returns)
+    return True
 
 
 def validate_funcdef(scope, stmt):
@@ -1233,104 +1828,135 @@ def validate_funcdef(scope, stmt):
                           f"already been defined")
 
 
+# The attributes of the modules which may be imported by garter programs.
+# New builtin modules may be supported by registering them here.
+MODULES = {
+    'random': {
+        'randint': TyFunc(TY_INT, [TY_INT, TY_INT]),
+        'random': TyFunc(TY_FLOAT, []),
+    },
+    'math': {
+        'sin': TyFunc(TY_FLOAT, [TY_FLOAT]),
+        'cos': TyFunc(TY_FLOAT, [TY_FLOAT]),
+        'sqrt': TyFunc(TY_FLOAT, [TY_FLOAT]),
+        'abs': TyFunc(TY_FLOAT, [TY_FLOAT]),
+    },
+}
+
+
 def validate_import(scope, stmt):
     for name in stmt.names:
         asname = name.asname if name.asname != None else name.name
-        if name.name == "random":
-            module(scope, asname, 'random', {
-                'randint': TyFunc(TY_INT, [TY_INT, TY_INT]),
-                'random': TyFunc(TY_FLOAT, []),
-            })
-        elif name.name == "math":
-            module(scope, asname, 'math', {
-                'sin': TyFunc(TY_FLOAT, [TY_FLOAT]),
-                'cos': TyFunc(TY_FLOAT, [TY_FLOAT]),
-                'sqrt': TyFunc(TY_FLOAT, [TY_FLOAT]),
-                'abs': TyFunc(TY_FLOAT, [TY_FLOAT]),
-            })
-        else:
+        ensure_non_keyword(asname, stmt)
+        attrs = MODULES.get(name.name)
+        if attrs == None:
+            attrs = module_exports(scope, stmt, name.name)
+        if attrs == None:
             raise GarterError(stmt, f"Unrecognized module name {name.name}")
+        module(scope, asname, name.name, attrs)
 
 
-def validate_stmt(scope, stmt):
-    """
-    Validates that a statement is correct.
-    Returns True if the statement unconditionally returned.
-    """
-    assert isinstance(stmt, ast.stmt)
-
-    kind = type(stmt)
-    if kind is ast.FunctionDef:
-        validate_funcdef(scope, stmt)
-        return False
-
-    elif kind is ast.ClassDef:
-        validate_classdef(scope, stmt)
-        return False
-
-    elif kind is ast.Return:
-        validate_return(scope, stmt)
-        return True
+def validate_exprstmt(scope, stmt):
+    # Check if we're looking at the print statement
+    if type(stmt.value) is ast.Call and \
+       type(stmt.value.func) is ast.Name and \
+       stmt.value.func.id == "print":
+        validate_print(scope, stmt.value)
+    else:
+        # Otherwise do normal validation logic
+        validate_expr(scope, stmt.value)
 
-    elif kind is ast.Assign:
-        validate_assign(scope, stmt)
-        return False
 
-    elif kind is ast.AugAssign:
-        validate_augassign(scope, stmt)
-        return False
+def validate_misplaced_scope_decl(scope, stmt):
+    raise GarterError(stmt, "nonlocal and global statements must be the "
+                      "first statements in a function definition")
 
-    elif kind is ast.If:
-        return validate_if(scope, stmt)
 
-    elif kind is ast.For:
-        validate_for(scope, stmt)
-        return False
+def validate_noop(scope, stmt):
+    # Pass statements are allowed anywhere! Python already checks if break and
+    # continue are in a loop in its validation pass, so, we don't have to check
+    # that here!
+    pass
 
-    elif kind is ast.While:
-        validate_while(scope, stmt)
-        return False
 
-    elif kind is ast.Assert:
-        validate_assert(scope, stmt)
-        return False
+# The validators for each kind of statement node. Statement validators return
+# True if the statement unconditionally returns.
+#
+# New kinds of statements may be supported by registering them here.
+STMT_VALIDATORS = {
+    ast.FunctionDef: validate_funcdef,
+    ast.ClassDef: validate_classdef,
+    ast.Return: validate_return,
+    ast.Assign: validate_assign,
+    ast.AugAssign: validate_augassign,
+    ast.If: validate_if,
+    ast.For: validate_for,
+    ast.While: validate_while,
+    ast.Assert: validate_assert,
+    ast.Nonlocal: validate_misplaced_scope_decl,
+    ast.Global: validate_misplaced_scope_decl,
+    ast.Expr: validate_exprstmt,
+    ast.Break: validate_noop,
+    ast.Continue: validate_noop,
+    ast.Pass: validate_noop,
+    ast.Import: validate_import,
+}
 
-    elif kind is ast.Nonlocal or kind is ast.Global:
-        raise GarterError(stmt, "nonlocal and global statements must be the "
-                          "first statements in a function definition")
 
-    elif kind is ast.Expr:
-        # Check if we're looking at the print statement
-        if type(stmt.value) is ast.Call and \
-           type(stmt.value.func) is ast.Name and \
-           stmt.value.func.id == "print":
-            validate_print(scope, stmt.value)
-        else:
-            # Otherwise do normal validation logic
-            validate_expr(scope, stmt.value)
-        return False
+def validate_stmt(scope, stmt):
+    """
+    Validates that a statement is correct.
+    Returns True if the statement unconditionally returned.
+    """
+    assert isinstance(stmt, ast.stmt)
 
-    elif kind is ast.Break or \
-         kind is ast.Continue:
-        # Python already checks if we are in a loop in its validation pass,
-        # so, we don't have to check that here!
-        pass
+    ctx = scope.ctx
+    poisons = ctx.poisons
+    try:
+        validator = STMT_VALIDATORS.get(type(stmt))
+        if validator == None:
+            raise GarterError(stmt, "Statement kind not supported")
+        return bool(validator(scope, stmt))
+    except GarterError as err:
+        ctx.recover(err, poisons)
+        poison_bindings(scope, stmt)
+        return type(stmt) is ast.Return
 
-    elif kind is ast.Pass:
-        # Pass statements are allowed anywhere!
-        return False
 
+def poison_bindings(scope, stmt):
+    """
+    Declare the names which stmt would have bound, had it been valid, with the
+    error type. Called when recovering from an error in stmt.
+    """
+    kind = type(stmt)
+    if kind is ast.FunctionDef:
+        names = [stmt.name]
+    elif kind is ast.ClassDef:
+        names = [stmt.name]
+        scope.declare_class(stmt.name, TY_ERROR)
+    elif kind is ast.Assign and stmt.type:
+        names = [t.id for t in stmt.targets if type(t) is ast.Name]
     elif kind is ast.Import:
-        validate_import(scope, stmt)
-        return False
-
+        names = [a.asname if a.asname != None else a.name for a in stmt.names]
     else:
-        raise GarterError(stmt, "Statement kind not supported")
+        return
+    for name in names:
+        scope.declare(name, TY_ERROR) # Fails if it was already declared
+
+
+def poison_field(clazz, stmt):
+    """ Like poison_bindings, for the fields of classes """
+    if type(stmt) is ast.FunctionDef:
+        clazz.fields.setdefault(stmt.name, Attribute(TY_ERROR, mutable=False))
+    elif type(stmt) is ast.Assign:
+        for t in stmt.targets:
+            if type(t) is ast.Name:
+                clazz.fields.setdefault(t.id, Attribute(TY_ERROR, mutable=True))
 
 
 def validate_nonlocal(scope, stmt):
     for name in stmt.names:
-        vi = scope.lookup(stmt)
+        vi = scope.lookup(name)
         if not vi:
             raise GarterError(stmt, f"No such variable named {name}")
 
@@ -1362,7 +1988,7 @@ def validate_global(scope, stmt):
             raise GarterError(stmt, f"Cannot refer to non-global variable {name} "
                               "with 'global' statement. Instead use the 'nonlocal' statement")
 
-        init = (lambda v: (lambda: v.init()))(vi.var)
+        init = (lambda v: (lambda: scope.ctx.demand(v)))(vi.var)
         scope.declare(name, vi.ty, mutable=True, init=init)
 
 
@@ -1372,20 +1998,26 @@ def validate_stmts(scope, stmts, froot=False):
     Returns true if the statements listed unconditionally return
     """
     returns = False
+    unreachable = False
     for stmt in stmts:
         if froot: # nonlocal and global are allowed
-            if type(stmt) is ast.Nonlocal:
-                validate_nonlocal(scope, stmt)
-                continue
-            elif type(stmt) is ast.Global:
-                validate_global(scope, stmt)
+            if type(stmt) is ast.Nonlocal or type(stmt) is ast.Global:
+                try:
+                    if type(stmt) is ast.Nonlocal:
+                        validate_nonlocal(scope, stmt)
+                    else:
+                        validate_global(scope, stmt)
+                except GarterError as err:
+                    scope.ctx.recover(err)
                 continue
             else:
                 froot = False
 
-        if returns:
-            raise GarterError(stmt, "Unreachable code after statement which "
-                              "unconditionally returns")
+        if returns and not unreachable:
+            unreachable = True # Only reported once
+            scope.ctx.report(GarterError(stmt, "Unreachable code after "
+                                         "statement which unconditionally "
+                                         "returns"))
         if validate_stmt(scope, stmt):
             returns = True
     return returns
@@ -1417,14 +2049,210 @@ def validate_mod(scope, mod):
         raise GarterError(mod, "Invalid module type")
 
 
-def validate(mod, scope):
+# The default limit on the number of errors reported when collecting errors
+MAX_ERRORS = 100
+
+
+class Checker:
+    """
+    The state of a single invocation of the checker, which is reachable from
+    every scope created during that invocation as scope.ctx. Keeping this state
+    out of the module allows independent checks to run concurrently in
+    different threads, as long as they don't share a global scope.
+
+    With the collect_errors option, errors are recorded in errors, rather than
+    aborting the check. Validation resumes with the next statement, and the
+    expression which failed is given the type TY_ERROR. Errors caused by an
+    expression of type TY_ERROR (counted by poisons) aren't reported, as they
+    are consequences of an error which already was.
+    """
+
+    def __init__(self, filename='<unknown>', **options):
+        self.filename = filename
+        self.options = options
+        self.stats = collections.Counter()
+        self.collect_errors = options.get('collect_errors', False)
+        self.max_errors = options.get('max_errors', MAX_ERRORS)
+        self.errors = []
+        self.poisons = 0
+        self.unit = None # The Unit being validated by an IncrementalChecker
+        self.global_scope = None
+        self.queue = collections.deque() # Global functions to validate
+        self.draining = False
+        # The type of each expression, with the return_types option
+        self.types = {} if options.get('return_types', False) else None
+
+    def demand(self, var):
+        """
+        Ensure that the body of var, a global variable, has been validated.
+        Bodies demanded while validating another are queued rather than
+        validated recursively, which doesn't change their results, as nothing
+        is declared in the global scope in the meantime.
+        """
+        if var == INVALID_VARIABLE or var._init == None:
+            return
+        self.queue.append(var)
+        if self.draining:
+            return
+        self.draining = True
+        journal = self.global_scope.journal
+        try:
+            while self.queue:
+                var = self.queue.popleft()
+                init = var._init
+                if init != None: # Not yet validated
+                    journal.append(('init', var, init))
+                    var.init()
+        finally:
+            self.draining = False
+            self.queue.clear()
+
+    def report(self, err):
+        """
+        Report the error err, which aborts the check unless collecting errors
+        """
+        if not self.collect_errors:
+            raise err
+        self.errors.append(err)
+        if len(self.errors) >= self.max_errors:
+            raise GarterErrors(self.errors)
+
+    def recover(self, err, poisons=None):
+        """
+        Recover from the error err, which was raised while validating a node.
+        poisons is the value of self.poisons when that node was entered.
+        """
+        if not self.collect_errors or isinstance(err, GarterErrors):
+            raise err
+        if poisons == None or poisons == self.poisons:
+            self.report(err)
+
+
+def validate(mod, scope, ctx=None):
+    if ctx == None:
+        ctx = Checker()
     backup = scope.backup()
+    scope.ctx = ctx
+    ctx.global_scope = scope
     try:
-        validate_mod(scope, mod)
-        scope.flush()
+        if mod != None:
+            validate_mod(scope, mod)
+        if mod == None or not scope.lazy:
+            scope.flush()
+        if ctx.errors:
+            raise GarterErrors(ctx.errors)
     except:
         scope.restore(backup)
         raise
+    finally:
+        scope.ctx = None
+
+
+def check(mod, filename='<unknown>', scope=None, **options):
+    """
+    Validate the ast object mod as garter code within the global scope scope,
+    raising a GarterError if it is invalid. With collect_errors=True, all of
+    the errors (up to max_errors) are found, and a GarterErrors listing them is
+    raised instead. This is the validation half of
+    gcompile, and is also invoked by Garter_CompileStringObject.
+    Returns the Checker used for the validation.
+    """
+    # Create a default scope if one isn't provided for this invocation
+    if not scope:
+        scope = new_global_scope()
+
+    # Ensure we have a valid global scope object
+    if scope.up != None or not scope.root:
+        raise TypeError("Unexpected non-toplevel scope!")
+    ctx = Checker(filename, **options)
+    try:
+        validate(mod, scope, ctx)
+    except GarterError as err:
+        # Record the filename information for error reporting purposes,
+        # unless the error is in a function from an earlier check
+        if err.filename == None:
+            err.locate(filename)
+        raise
+    return ctx
+
+
+def check_deferred(scope, filename='<unknown>', **options):
+    """
+    Validate the bodies of the functions in the lazy global scope scope which
+    haven't been reached by the code checked within it so far, such as in the
+    background while a REPL is idle. Raises a GarterError if one is invalid,
+    in which case that function remains unvalidated.
+    """
+    return check(None, filename, scope, **options)
+
+
+class TypeTable:
+    """
+    The types found by the checker for the expressions of a module, as returned
+    by gcompile(..., return_types=True). Nodes are numbered in the order that
+    ast.walk visits them, so that a tool which parses the same source again can
+    recover the type of each expression with annotate, rather than validating
+    it again. Each distinct type is held once, in types, and ids maps each node
+    number to an index into types (or -1 if the node has no type), taking 2
+    bytes per node unless the module has more than 32767 distinct types.
+
+    Tables can be saved next to bytecode with dumps, and read back with loads,
+    in which case types holds the description of each type, rather than the
+    type itself.
+    """
+
+    def __init__(self, types, ids):
+        self.types = types
+        self.ids = ids
+
+    @classmethod
+    def build(cls, mod, found):
+        types = []
+        index = {}
+        ids = []
+        for node in ast.walk(mod):
+            ty = found.get(node)
+            if ty is None:
+                ids.append(-1)
+                continue
+            i = index.get(ty)
+            if i is None:
+                i = index[ty] = len(types)
+                types.append(ty)
+            ids.append(i)
+        return cls(types, array.array('h' if len(types) < 2**15 else 'i', ids))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def get(self, n):
+        """ The type of the n-th node of the module, or None """
+        i = self.ids[n]
+        return self.types[i] if i >= 0 else None
+
+    def annotate(self, mod):
+        """
+        Return a dictionary from each expression node in mod, a tree parsed from
+        the source the table was built for, to its type
+        """
+        types = self.types
+        return {node: types[i] for node, i in zip(ast.walk(mod), self.ids)
+                if i >= 0}
+
+    def dumps(self):
+        return marshal.dumps((tuple(str(ty) for ty in self.types),
+                              self.ids.typecode, self.ids.tobytes()))
+
+    @classmethod
+    def loads(cls, data):
+        types, typecode, ids = marshal.loads(data)
+        return cls(list(types), array.array(typecode, ids))
+
+
+# The flags of the future statements which compile() inherits from its caller
+FUTURE_FLAGS = functools.reduce(operator.or_, (
+    getattr(__future__, name).compiler_flag
+    for name in __future__.all_feature_names))
 
 
 # A Python compile-function like entry point for the program!
@@ -1434,39 +2262,659 @@ def gcompile(source,
              flags=0,
              dont_inherit=False,
              optimize=-1,
-             scope=None):
+             scope=None,
+             collect_errors=False,
+             max_errors=MAX_ERRORS,
+             return_types=False):
     """
     Not named `compile`, such that the built in compile function is
     callable from this module, as we need to be able to compile it.
+
+    If collect_errors is True, a GarterErrors listing every type error (up to
+    max_errors of them) is raised, rather than a GarterError for the first.
+    Syntax errors are still reported one at a time by the parser.
+
+    If return_types is True, a (code, TypeTable) pair is returned, recording
+    the type of every expression which was validated.
+
+    Unless dont_inherit is True, the future statements in effect in the code
+    calling gcompile are applied, as they are by compile().
     """
+    if not dont_inherit:
+        # Those of the caller, rather than of this module
+        flags |= sys._getframe(1).f_code.co_flags & FUTURE_FLAGS
     if not isinstance(source, ast.AST):
-        return gcompile(ast.parse(source, filename, mode),
-                        filename, mode, flags, dont_inherit,
-                        optimize, scope)
+        if not collect_errors and not return_types:
+            # Parse, validate and compile in C, such that the parsed tree can
+            # be compiled directly, rather than being converted back from ast
+            # objects
+            return _garter.compile(source, filename, mode, flags, True,
+                                   optimize, scope)
+        source = compile(source, filename, mode, flags | ast.PyCF_ONLY_AST,
+                         True, optimize)
+
+    ctx = check(source, filename, scope, collect_errors=collect_errors,
+                max_errors=max_errors, return_types=return_types)
+
+    if flags & ast.PyCF_ONLY_AST:
+        code = source
+    else:
+        # Compile the object itself, with the specs recorded on it by check
+        code = _garter.compile_checked(source, filename, mode, flags,
+                                       optimize)
+    if return_types:
+        return code, TypeTable.build(source, ctx.types)
+    return code
 
-    # Create a default scope if one isn't provided for this invocation
-    if not scope:
-        scope = new_global_scope()
 
-    # Record the filename information for error reporting purposes
-    global _filename
-    _filename = filename
+def new_global_scope(cls=Scope, lazy=False):
+    scope = cls(None, True)
+    scope.lazy = lazy
+    scope.declare("abs", TyFunc(TY_FLOAT, [TY_FLOAT]), mutable=False)
+    scope.declare("ord", TyFunc(TY_INT, [TY_STR]), mutable=False)
+    return scope
 
-    # Ensure we have a valid global scope object
-    if scope.up != None or not scope.root:
-        raise TypeError("Unexpected non-toplevel scope!")
+
+
+# Profiling the checker
+
+_profile = None # The enabled Profile, if any
+
+
+class Profile:
+    """
+    Records where the checker spends its time while enabled, for example:
+
+        with garter.Profile() as prof:
+            garter.gcompile(source)
+        prof.print_stats()
+
+    Enabling a profile replaces each validate_* function (in the module and in
+    the tables which dispatch to them) with a wrapper which counts and times
+    it, and restores them when disabled, so that checking is unaffected when no
+    profile is enabled. As the replacement is module wide, only one profile may
+    be enabled at a time, and checks shouldn't run in other threads meanwhile.
+
+    The profile records:
+      nodes   - the number of statements and expressions validated, by kind
+      calls   - for each validate_* function, the number of calls, the time
+                spent in the function itself and in it and its callees, and
+                the number of calls from each caller
+      depths  - a histogram of the number of scopes walked to resolve a name,
+                with names which weren't found counted under 'miss'
+      lookups - hits and misses of the scopes' resolved name caches
+      types   - the types constructed, and how many of those were allocated
+                rather than found in the intern table
+      subsume - hits and misses of the subsumption cache
+
+    The profile can be read by pstats.Stats, saved with dump_stats for pstats
+    based tools, or converted to JSON with as_dict or dump_json.
+    """
+
+    def __init__(self):
+        self.nodes = collections.Counter()
+        self.calls = {}
+        self.depths = collections.Counter()
+        self.lookups = collections.Counter()
+        self.types = collections.Counter()
+        self.subsume = collections.Counter()
+        self._stack = []
+        self._restore = None
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
+
+    def enable(self):
+        global _profile
+        if _profile is not None:
+            raise RuntimeError("A garter Profile is already enabled")
+        _profile = self
+
+        restore = []
+        module = globals()
+        # Nodes are counted by the validators which expressions are
+        # dispatched to, as leaves and operators bypass dispatch_expr
+        counted = {validate_stmt}
+        for table in (LVALUE_VALIDATORS, EXPR_VALIDATORS, LEAF_VALIDATORS):
+            counted.update(table.values())
+        counted.update(op[0] for op in OPERATOR_VALIDATORS.values())
+        wrappers = {}
+        for name, fn in list(module.items()):
+            if (name.startswith('validate_') or name == 'dispatch_expr') and \
+               hasattr(fn, '__code__'):
+                wrappers[fn] = module[name] = self._wrap(fn, fn in counted)
+                restore.append((module, name, fn))
+        for table in list(module.values()):
+            if type(table) is not dict or table is module:
+                continue
+            for key, fn in table.items():
+                if type(fn) is tuple and fn and hasattr(fn[0], '__code__') and \
+                   fn[0] in wrappers:
+                    # e.g. OPERATOR_VALIDATORS
+                    table[key] = (wrappers[fn[0]],) + fn[1:]
+                    restore.append((table, key, fn))
+                elif hasattr(fn, '__code__') and fn in wrappers:
+                    table[key] = wrappers[fn]
+                    restore.append((table, key, fn))
+
+        lookup, resolve, new = Scope.lookup, Scope.resolve, Ty.__dict__['__new__']
+        Scope.lookup = self._wrap_lookup(lookup)
+        Scope.resolve = self._wrap_resolve(resolve)
+        Ty.__new__ = staticmethod(self._wrap_new(new.__func__))
+        self._restore = restore, lookup, resolve, new, _relation.cache_info()
+
+    def disable(self):
+        global _profile
+        if _profile is not self:
+            return
+        restore, lookup, resolve, new, info = self._restore
+        for table, key, fn in restore:
+            table[key] = fn
+        Scope.lookup, Scope.resolve, Ty.__new__ = lookup, resolve, new
+        after = _relation.cache_info()
+        self.subsume['hits'] += after.hits - info.hits
+        self.subsume['misses'] += after.misses - info.misses
+        self._restore = None
+        _profile = None
+
+    def _wrap(self, fn, count=False):
+        # [calls, own time, cumulative time, callers, active calls, code]
+        entry = self.calls.setdefault(fn.__name__, [0, 0.0, 0.0,
+                                                    collections.Counter(), 0,
+                                                    fn.__code__])
+        name = fn.__name__
+        callers = entry[3]
+        stack = self._stack
+        nodes = self.nodes if count else None
+        perf_counter = time.perf_counter
+
+        def enter(args):
+            if nodes is not None:
+                nodes[type(args[1]).__name__] += 1
+            callers[stack[-1][0] if stack else None] += 1
+            frame = [name, 0.0, perf_counter()] # Time spent in callees, start
+            stack.append(frame)
+            entry[4] += 1
+            return frame
+
+        def exit(frame):
+            elapsed = perf_counter() - frame[2]
+            stack.pop()
+            entry[4] -= 1
+            entry[0] += 1
+            entry[1] += elapsed - frame[1]
+            if entry[4] == 0: # Don't count recursive calls twice
+                entry[2] += elapsed
+            if stack:
+                stack[-1][1] += elapsed
+
+        if inspect.isgeneratorfunction(fn):
+            # Expression validators remain on the stack while validate_expr
+            # validates the subexpressions which they yield
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                frame = enter(args)
+                try:
+                    return (yield from fn(*args, **kwargs))
+                finally:
+                    exit(frame)
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                frame = enter(args)
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    exit(frame)
+        return wrapper
+
+    def _wrap_lookup(self, lookup):
+        lookups = self.lookups
+        def wrapper(scope, name):
+            lookups['hits' if name in scope.resolved else 'misses'] += 1
+            return lookup(scope, name)
+        return wrapper
+
+    def _wrap_resolve(self, resolve):
+        depths = self.depths
+        def wrapper(scope, name):
+            info = resolve(scope, name)
+            if info == None or info is INVALID_VARIABLE:
+                depths['miss'] += 1
+            else:
+                depths[scope.depth - info.depth] += 1
+            return info
+        return wrapper
+
+    def _wrap_new(self, new):
+        types = self.types
+        def wrapper(cls, *fields):
+            types['constructed'] += 1
+            if (cls,) + fields not in _interned:
+                types['allocated'] += 1
+            return new(cls, *fields)
+        return wrapper
+
+    def create_stats(self):
+        """ Fill in self.stats in the format read by pstats.Stats """
+        keys = {name: (code.co_filename, code.co_firstlineno, name)
+                for name, (*_, code) in self.calls.items()}
+        self.stats = {}
+        for name, (calls, tt, ct, callers, _, _) in self.calls.items():
+            if calls:
+                self.stats[keys[name]] = (calls, calls, tt, ct,
+                                          {keys[caller]: n for caller, n
+                                           in callers.items() if caller})
+
+    def dump_stats(self, filename):
+        self.create_stats()
+        with open(filename, 'wb') as f:
+            marshal.dump(self.stats, f)
+
+    def print_stats(self, sort='cumulative', file=None):
+        import pstats
+        stats = pstats.Stats(self, stream=file)
+        stats.sort_stats(sort).print_stats()
+        for field, counts in sorted(self.as_dict().items()):
+            if field != 'calls':
+                print(field, dict(counts), file=file)
+
+    def as_dict(self):
+        """ The profile as a dictionary, suitable for json.dump """
+        return {
+            'nodes': dict(self.nodes),
+            'calls': {name: {'calls': calls, 'time': tt, 'cumulative': ct,
+                             'callers': {str(c): n for c, n in callers.items()}}
+                      for name, (calls, tt, ct, callers, _, _)
+                      in self.calls.items() if calls},
+            'depths': {str(d): n for d, n in self.depths.items()},
+            'lookups': dict(self.lookups),
+            'types': dict(self.types),
+            'subsume': dict(self.subsume),
+        }
+
+    def dump_json(self, file):
+        import json
+        json.dump(self.as_dict(), file, indent=2, sort_keys=True)
+
+
+# The errors which the checker raises, by name
+ERROR_TYPES = {cls.__name__: cls for cls in
+               (SyntaxError, IndentationError, TabError, GarterError,
+                GarterErrors)}
+
+
+def rebuild_error(kind, args):
+    """
+    The error of class kind, a name in ERROR_TYPES, with the arguments args,
+    such as for an error which was recorded rather than raised.
+    """
+    cls = ERROR_TYPES[kind]
+    err = cls.__new__(cls)
+    SyntaxError.__init__(err, *args)
+    return err
+
+
+# Incremental checking of successive versions of a module
+
+class Unit:
+    """
+    The record of validating a top-level statement, or the body of a top-level
+    function, as part of an incremental check. deps lists what the unit found
+    in the global scope, all of which must be found again for the unit to be
+    reused, and effects lists the declarations which it made there.
+    """
+
+    def __init__(self, key, lineno, ty=None):
+        self.key = key
+        self.lineno = lineno
+        self.ty = ty # The type of the function, for function bodies
+        self.deps = []
+        self.effects = []
+        self.errors = []
+        self.files = [] # The garter modules imported by the unit
+        self.returns = False
+
+    def found(self, name, info):
+        if info == None or info is INVALID_VARIABLE:
+            self.deps.append(('var', name, info))
+        elif info.depth == 0:
+            self.deps.append(('var', name, (info.ty, info.mutable)))
+
+    def current(self, scope):
+        """
+        Whether the global scope scope matches what this unit found in it
+        """
+        lookup = Scope(scope, root=True) # Not to populate scope.resolved
+        for kind, name, outcome in self.deps:
+            if kind == 'var':
+                info = lookup.lookup(name)
+                if info == None or info is INVALID_VARIABLE:
+                    if info is not outcome:
+                        return False
+                elif outcome == None or outcome is INVALID_VARIABLE or \
+                     info.ty is not outcome[0] or info.mutable != outcome[1]:
+                    return False
+            elif kind == 'class':
+                if lookup.lookup_class(name) is not outcome:
+                    return False
+            elif kind == 'declare':
+                slot = scope.vars.get(name)
+                free = slot == None or scope.slots[slot] is INVALID_VARIABLE
+                if free != outcome:
+                    return False
+            elif kind == 'declare_class':
+                if (name not in scope.classes) != outcome:
+                    return False
+        return dependencies_current(self.files)
+
+
+class UnitScope(Scope):
+    """
+    The global scope of an IncrementalChecker, which records the declarations
+    made in it by the unit being validated.
+    """
+
+    def __init__(self, up, root=False):
+        super().__init__(up, root)
+        self.checker = None
+
+    def declare(self, name, ty, mutable=True, init=None):
+        unit = self.ctx.unit if self.ctx != None else None
+        if unit != None and init != None:
+            init = self.checker.body_init(self, ty, init)
+        ok = super().declare(name, ty, mutable, init)
+        if unit != None:
+            unit.deps.append(('declare', name, ok))
+            if ok:
+                unit.effects.append(('var', name, ty, mutable, init != None))
+        return ok
+
+    def declare_class(self, name, clazz):
+        unit = self.ctx.unit if self.ctx != None else None
+        ok = super().declare_class(name, clazz)
+        if unit != None:
+            unit.deps.append(('declare_class', name, ok))
+            if ok:
+                unit.effects.append(('class', name, clazz))
+        return ok
+
+
+class IncrementalChecker:
+    """
+    Checks successive versions of a module, such as a file being edited in
+    IDLE, revalidating only the parts of it which may have changed.
+
+    Each top-level statement, and the body of each top-level function, is
+    validated as a separate Unit, keyed on its source text. Units are reused
+    from the previous check if their text is unchanged, and everything which
+    they found in the global scope is still the same, in which case their
+    declarations and errors are replayed rather than validated again.
+    """
+
+    def __init__(self, filename='<unknown>', cache=None):
+        self.filename = filename
+        self.cache = cache # A gartercache.ResultCache, or None
+        self.units = {} # Units from the last check, by key
+        self.bodies = {}
+        self.reused = 0 # Counts of units in the last check
+        self.validated = 0
+
+    def gcompile(self, source, optimize=-1, collect_errors=False):
+        """
+        Check and compile source, as gcompile(source, filename, 'exec') within
+        a fresh global scope would. If the checker has a cache, a result
+        cached for the same source is returned without checking it, and the
+        results of checks are stored in the cache.
+        """
+        cache = self.cache
+        if cache == None:
+            return self.check(source, optimize, collect_errors, [])
+        path = cache.path(source, self.filename, 'exec', optimize,
+                          collect_errors)
+        entry = cache.load(path)
+        if entry != None:
+            # The units of the last check are kept for the next one
+            cache.hits += 1
+            self.reused = self.validated = 0
+            return cache.replay(entry)
+        cache.misses += 1
+        return cache.record(path, lambda deps: self.check(
+            source, optimize, collect_errors, deps))
+
+    def check(self, source, optimize, collect_errors, deps):
+        """
+        Check and compile source, reusing the units of the last check where
+        possible, and adding the garter modules it imports to deps.
+        """
+        if isinstance(source, bytes):
+            source = importlib.util.decode_source(source)
+        tree = compile(source, self.filename, 'exec', ast.PyCF_ONLY_AST)
+        lines = source.splitlines(True)
+
+        self._units, self.units = self.units, {}
+        self._bodies, self.bodies = self.bodies, {}
+        self._errors = []
+        self.reused = self.validated = 0
+        scope = new_global_scope(UnitScope)
+        scope.checker = self
+        ctx = Checker(self.filename, collect_errors=True,
+                      max_errors=sys.maxsize, dependencies=[])
+        scope.ctx = ctx
+        ctx.global_scope = scope
+        try:
+            discover_locals(scope, tree.body)
+            returns = False
+            stmts = tree.body
+            for i, stmt in enumerate(stmts):
+                if returns:
+                    returns = False # Only reported once
+                    self._errors.append(GarterError(
+                        stmt, "Unreachable code after statement which "
+                        "unconditionally returns"))
+                end = len(lines)
+                if i + 1 < len(stmts):
+                    end = max(stmts[i + 1].lineno - 1, stmt.lineno)
+                key = (''.join(lines[stmt.lineno - 1:end]), stmt.col_offset)
+                returns = self.check_stmt(scope, stmt, key) or returns
+            scope.flush()
+        finally:
+            scope.ctx = None
+            self._units = self._bodies = None
+
+        # Reused units don't import their modules again
+        for units in (self.units, self.bodies):
+            for candidates in units.values():
+                for unit in candidates:
+                    for dep in unit.files:
+                        if dep not in deps:
+                            deps.append(dep)
+        errors, self._errors = self._errors, None
+        if errors:
+            err = GarterErrors(errors)
+            err.locate(self.filename)
+            raise err if collect_errors else err.errors[0]
+        return _garter.compile_checked(tree, self.filename, 'exec', 0,
+                                       optimize)
+
+    def validate_unit(self, scope, unit, validate):
+        ctx = scope.ctx
+        saved = ctx.unit, ctx.errors
+        ctx.unit, ctx.errors = unit, unit.errors
+        files = ctx.options['dependencies']
+        start = len(files)
+        try:
+            result = validate()
+        finally:
+            ctx.unit, ctx.errors = saved
+            unit.files = files[start:]
+        self._errors.extend(unit.errors)
+        self.validated += 1
+        return result
+
+    def reuse_unit(self, unit, lineno):
+        delta = lineno - unit.lineno
+        for err in unit.errors:
+            self._errors.append(rebuild_error(type(err).__name__, (
+                err.msg, (err.filename, err.lineno + delta, err.offset,
+                          err.text))))
+        self.reused += 1
+
+    def check_stmt(self, scope, stmt, key):
+        """
+        Validate or replay the top-level statement stmt. Returns True if it
+        unconditionally returns.
+        """
+        candidates = self._units.get(key)
+        if candidates:
+            unit = candidates.pop(0)
+            if unit.current(scope):
+                for effect in unit.effects:
+                    if effect[0] == 'var':
+                        _, name, ty, mutable, body = effect
+                        init = self.body_init(scope, ty, None, stmt, key) \
+                               if body else None
+                        Scope.declare(scope, name, ty, mutable, init)
+                    else:
+                        Scope.declare_class(scope, effect[1], effect[2])
+                self.reuse_unit(unit, stmt.lineno)
+                self.units.setdefault(key, []).append(unit)
+                return unit.returns
+
+        unit = Unit(key, stmt.lineno)
+        self._stmt = stmt, key
+        def validate():
+            scope.resolved.clear() # Such that every lookup is recorded
+            return validate_stmt(scope, stmt)
+        unit.returns = self.validate_unit(scope, unit, validate)
+        self.units.setdefault(key, []).append(unit)
+        return unit.returns
+
+    def body_init(self, scope, fty, func_init, stmt=None, key=None):
+        """
+        The init function of the top-level function with type fty, declared
+        by stmt, which validates its body as a separate unit. func_init is the
+        function's original init function, if it has been created.
+        """
+        if stmt == None:
+            stmt, key = self._stmt
+        def init():
+            nonlocal func_init
+            candidates = self._bodies.get(key)
+            if candidates:
+                unit = candidates.pop(0)
+                if unit.ty is fty and unit.current(scope):
+                    self.reuse_unit(unit, stmt.lineno)
+                    self.bodies.setdefault(key, []).append(unit)
+                    return
+
+            unit = Unit(key, stmt.lineno, fty)
+            def validate():
+                nonlocal func_init
+                if func_init == None:
+                    func_init = validate_funclike(scope, stmt)[1]
+                func_init()
+            self.validate_unit(scope, unit, validate)
+            self.bodies.setdefault(key, []).append(unit)
+        return init
+
+
+# Importing .gt modules from garter programs, see garterimport for importing
+# them from python
+
+GARTER_SUFFIXES = ['.gt']
+
+
+def find_module_source(name):
+    """ The path to the .gt file for the module name on sys.path, if any """
+    relpath = name.replace('.', os.sep)
+    for entry in sys.path:
+        if not isinstance(entry, str):
+            continue
+        for suffix in GARTER_SUFFIXES:
+            path = os.path.join(entry, relpath + suffix)
+            if os.path.isfile(path):
+                return path
+    return None
+
+
+def _stat_key(path):
     try:
-        validate(source, scope)
-    finally:
-        _filename = None
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime, st.st_size)
 
-    # Compile the object itself.
-    return compile(source, filename, mode, flags, dont_inherit, optimize)
 
+def dependencies_current(deps):
+    """
+    Whether the (name, path, key) module dependencies recorded by a check
+    would still resolve in the same way, to unchanged sources.
+    """
+    for name, path, key in deps:
+        if find_module_source(name) != path:
+            return False
+        if path != None and _stat_key(path) != key:
+            return False
+    return True
 
-def new_global_scope():
-    scope = Scope(None, True)
-    scope.declare("abs", TyFunc(TY_FLOAT, [TY_FLOAT]), mutable=False)
-    scope.declare("ord", TyFunc(TY_INT, [TY_STR]), mutable=False)
-    return scope
 
+# The attributes exported by the .gt modules which have been imported by
+# garter code, keyed by path, alongside the dependencies of that module
+# (including itself). Modules are nominally typed, so each version of a module
+# is checked once.
+_module_exports = {}
+
+
+def module_exports(scope, stmt, name):
+    """
+    The attributes of the garter module name, as seen by garter code importing
+    it, or None if there is no such module. If the check was passed a
+    dependencies list, the modules which were looked up are recorded in it.
+    """
+    deps = scope.ctx.options.get('dependencies')
+    path = find_module_source(name)
+    if path == None:
+        if deps != None:
+            deps.append((name, None, None))
+        return None
+
+    entry = _module_exports.get(path)
+    if entry == None or not dependencies_current(entry[0]):
+        importing = scope.ctx.options.get('importing', ())
+        if path in importing:
+            raise GarterError(stmt, f"Circular import of module {name}")
+        moddeps = [(name, path, _stat_key(path))]
+        try:
+            with tokenize.open(path) as f:
+                tree = ast.parse(f.read(), path)
+            modscope = new_global_scope()
+            check(tree, path, modscope, importing=importing + (path,),
+                  dependencies=moddeps)
+        except SyntaxError as err:
+            if deps != None:
+                deps.extend(moddeps)
+            raise GarterError(stmt, f"Error in imported module {name}: "
+                              f"{err.filename}:{err.lineno}: {err.msg}")
+
+        builtins = new_global_scope().vars
+        attrs = {}
+        for varname, slot in modscope.vars.items():
+            var = modscope.slots[slot]
+            if varname not in builtins and var is not INVALID_VARIABLE:
+                attrs[varname] = var.ty
+        entry = _module_exports[path] = (moddeps, attrs)
+
+    if deps != None:
+        deps.extend(entry[0])
+    return entry[1]
+
+
+if __name__ == '__main__':
+    # The command line interface, python -m garter check, is gartercheck's
+    import gartercheck
+    sys.exit(int(not gartercheck.main()))
@@ -0,0 +1,191 @@
+"""
+On-disk caching of the results of checking Garter source code.
+
+ResultCache.gcompile acts as garter.gcompile, but reuses the result of checking
+the same source before, if the checker and the garter modules which the source
+imports are unchanged since. Results are kept in the directory named by
+$GARTERCACHE, or in ~/.cache/garter, see default_cache.
+"""
+
+import _garter
+import ast
+import garter
+import hashlib
+import marshal
+import os
+import sys
+from importlib._bootstrap_external import MAGIC_NUMBER, _write_atomic
+
+
+DEFAULT_CACHE_SIZE = 64 * 1024 * 1024
+
+_checker_version = None
+
+
+def checker_version():
+    """
+    A fingerprint of the checker and of the bytecode format, which is part of
+    every cache key, such that cached results are invalidated by changes to
+    either of them.
+    """
+    global _checker_version
+    if _checker_version == None:
+        h = hashlib.sha1(MAGIC_NUMBER)
+        with open(garter.__file__, 'rb') as f:
+            h.update(f.read())
+        _checker_version = h.digest()
+    return _checker_version
+
+
+def default_cache_dir():
+    return os.environ.get('GARTERCACHE') or \
+        os.path.join(os.path.expanduser('~'), '.cache', 'garter')
+
+
+class ResultCache:
+    """
+    A size-bounded on-disk cache of gcompile results, similar to the
+    __pycache__ directories holding .pyc files. Entries are keyed on a hash of
+    the source, filename, mode, optimization level and checker version, and
+    hold either the marshalled code object or the error raised while checking
+    it, along with the garter modules which it imported. Once the cache grows
+    beyond max_size bytes, the least recently used entries are evicted.
+    """
+
+    def __init__(self, directory=None, max_size=DEFAULT_CACHE_SIZE):
+        self.directory = directory if directory != None else default_cache_dir()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._size = None # Estimated size of the cache, once it is known
+
+    def path(self, source, filename, mode, optimize, collect_errors=False):
+        if isinstance(source, str):
+            source = source.encode('utf-8')
+        h = hashlib.sha1(checker_version())
+        h.update(repr((filename, mode, optimize,
+                       collect_errors)).encode('utf-8'))
+        h.update(source)
+        return os.path.join(self.directory, h.hexdigest() + '.gtc')
+
+    def gcompile(self, source, filename='<unknown>', mode='exec', optimize=-1,
+                 collect_errors=False):
+        """
+        Like gcompile within a fresh global scope, but reusing the cached
+        result if this source has been checked before, and the garter modules
+        which it imports haven't changed since.
+        """
+        path = self.path(source, filename, mode, optimize, collect_errors)
+        entry = self.load(path)
+        if entry != None:
+            self.hits += 1
+            return self.replay(entry)
+
+        self.misses += 1
+        def compile_source(deps):
+            # Checked from the ast, such that the imported modules can be
+            # recorded as dependencies of the result.
+            tree = compile(source, filename, mode, ast.PyCF_ONLY_AST)
+            garter.check(tree, filename, dependencies=deps,
+                         collect_errors=collect_errors)
+            return _garter.compile_checked(tree, filename, mode, 0,
+                                           optimize)
+        return self.record(path, compile_source)
+
+    def replay(self, entry):
+        """ Return the code object in entry, or raise the error it holds """
+        ok, value, deps = entry
+        if ok:
+            return value
+        kind, args, errors = value
+        if kind == 'GarterErrors':
+            raise garter.GarterErrors([
+                garter.rebuild_error('GarterError', a) for a in errors])
+        raise garter.rebuild_error(kind, args)
+
+    def record(self, path, compile_source):
+        """
+        Store the result of compile_source(deps) at path, whether it is a code
+        object or a checker error, and return or raise it. compile_source
+        fills deps with the garter modules which the source imported.
+        """
+        deps = []
+        try:
+            code = compile_source(deps)
+        except SyntaxError as err:
+            if type(err).__name__ in garter.ERROR_TYPES:
+                errors = [e.args for e in getattr(err, 'errors', ())]
+                self.store(path, (False, (type(err).__name__, err.args,
+                                          errors), deps))
+            raise
+        self.store(path, (True, code, deps))
+        return code
+
+    def load(self, path):
+        """ The entry at path, if it exists and is still current """
+        try:
+            with open(path, 'rb') as f:
+                entry = marshal.loads(f.read())
+            ok, value, deps = entry
+        except (OSError, EOFError, ValueError, TypeError):
+            return None # Missing or corrupted entry
+        if not garter.dependencies_current(deps):
+            return None
+        try:
+            os.utime(path) # Mark the entry as recently used
+        except OSError:
+            pass
+        return entry
+
+    def store(self, path, entry):
+        if sys.dont_write_bytecode:
+            return
+        data = marshal.dumps(entry)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            _write_atomic(path, data)
+        except OSError:
+            return # The cache is best-effort
+        if self._size == None:
+            self.evict()
+        else:
+            self._size += len(data)
+            if self._size > self.max_size:
+                self.evict()
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache is no more
+        than three quarters full.
+        """
+        entries = []
+        try:
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith('.gtc'):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        except OSError:
+            return
+        size = sum(e[1] for e in entries)
+        if size > self.max_size:
+            entries.sort()
+            for mtime, esize, path in entries:
+                if size <= self.max_size * 3 // 4:
+                    break
+                try:
+                    os.unlink(path)
+                    size -= esize
+                except OSError:
+                    pass
+        self._size = size
+
+
+_default_cache = None
+
+
+def default_cache():
+    """ The ResultCache in the default cache directory """
+    global _default_cache
+    if _default_cache == None:
+        _default_cache = ResultCache()
+    return _default_cache
@@ -0,0 +1,181 @@
+"""
+Checking many Garter source files at once, e.g. all of the submissions for an
+assignment, from python or from the command line:
+
+    python -m gartercheck check [-j N] [--json] [--all-errors] FILE|DIR...
+
+which is also run by python -m garter.
+"""
+
+import collections
+import garter
+import gartercache
+import marshal
+import os
+import sys
+import time
+import tokenize
+
+try:
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+except ImportError:
+    ProcessPoolExecutor = None
+
+
+CheckResult = collections.namedtuple(
+    'CheckResult', 'path ok lineno offset message time code errors')
+CheckResult.__doc__ = """
+The result of checking a single file. lineno, offset and message describe the
+(first) error if ok is False, and are None otherwise. time is the number of
+seconds the check took, and code is the marshalled code object if it was
+requested. errors lists the (lineno, offset, message) of every error found.
+An exception raised by the checker itself is reported as an internal error.
+"""
+
+
+def internal_error(path, err, time):
+    """A CheckResult reporting that checking path raised err"""
+    message = 'internal error: {}: {}'.format(type(err).__name__, err)
+    return CheckResult(path, False, None, None, message, time, None,
+                       [(None, None, message)])
+
+
+def check_file(path, marshal_code=False, cache=None, collect_errors=False):
+    """
+    Check and compile the garter source file at path, returning a CheckResult.
+    If cache is a ResultCache, it is used to avoid rechecking unchanged files.
+    If collect_errors is True, all of the errors in the file are found.
+    """
+    start = time.perf_counter()
+    try:
+        with tokenize.open(path) as f:
+            source = f.read()
+        if cache != None:
+            code = cache.gcompile(source, path, 'exec',
+                                  collect_errors=collect_errors)
+        else:
+            code = garter.gcompile(source, path, 'exec',
+                                   collect_errors=collect_errors)
+    except SyntaxError as err:
+        errors = [(e.lineno, e.offset, e.msg)
+                  for e in getattr(err, 'errors', [err])]
+        return CheckResult(path, False, err.lineno, err.offset, err.msg,
+                           time.perf_counter() - start, None, errors)
+    except (OSError, ValueError, OverflowError) as err:
+        return CheckResult(path, False, None, None, str(err),
+                           time.perf_counter() - start, None,
+                           [(None, None, str(err))])
+    except Exception as err:
+        # Reported for this file, rather than ending the batch
+        return internal_error(path, err, time.perf_counter() - start)
+    if marshal_code:
+        code = marshal.dumps(code)
+    else:
+        code = None
+    return CheckResult(path, True, None, None, None,
+                       time.perf_counter() - start, code, [])
+
+
+def find_sources(paths):
+    """
+    Expand the directories in paths into the garter source files within them
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if name.endswith(('.py', '.gt')):
+                    yield os.path.join(dirpath, name)
+
+
+def check_many(paths, workers=1, marshal_code=False, cache=None,
+               collect_errors=False):
+    """
+    Check the files and directories in paths, yielding a CheckResult for each
+    file as soon as it has been checked, so results may arrive out of order.
+    If workers is not 1, the files are checked in that many worker processes
+    (or one per CPU if workers is 0 or None). cache and collect_errors are
+    passed to check_file.
+    """
+    paths = list(find_sources(paths))
+    if workers is not None and workers < 0:
+        raise ValueError('workers must be greater or equal to 0')
+    if workers == 1 or ProcessPoolExecutor is None:
+        for path in paths:
+            yield check_file(path, marshal_code, cache, collect_errors)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers or None) as executor:
+        futures = {executor.submit(check_file, path, marshal_code, cache,
+                                   collect_errors): path
+                   for path in paths}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as err:
+                # e.g. the worker died, or the result couldn't be pickled
+                result = internal_error(futures[future], err, 0.0)
+            yield result
+
+
+def main():
+    """Script main program."""
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(
+        description='Check garter source files.')
+    subparsers = parser.add_subparsers(dest='command')
+    check_parser = subparsers.add_parser(
+        'check', help='type check garter source files')
+    check_parser.add_argument('paths', metavar='FILE|DIR', nargs='+',
+                              help='files and directories to check')
+    check_parser.add_argument('-j', '--workers', default=1, type=int,
+                              help='check files concurrently in this many '
+                                   'processes; 0 means one per CPU')
+    check_parser.add_argument('--json', action='store_true',
+                              help='write a JSON object per line for each file')
+    check_parser.add_argument('-q', action='store_true', dest='quiet',
+                              help='only report files with errors')
+    check_parser.add_argument('--no-cache', action='store_false', dest='cache',
+                              help="don't use the on-disk result cache")
+    check_parser.add_argument('--all-errors', action='store_true',
+                              help='report every type error in each file, '
+                                   'rather than only the first')
+
+    args = parser.parse_args()
+    if args.command != 'check':
+        parser.print_usage()
+        return False
+
+    success = True
+    try:
+        cache = gartercache.ResultCache() if args.cache else None
+        for result in check_many(args.paths, args.workers, cache=cache,
+                                 collect_errors=args.all_errors):
+            success = success and result.ok
+            if args.json:
+                print(json.dumps(result._asdict()), flush=True)
+            elif not result.ok:
+                for lineno, offset, message in result.errors:
+                    if lineno != None:
+                        print('{}:{}:{}: {}'.format(result.path, lineno,
+                                                    offset, message),
+                              flush=True)
+                    else:
+                        print('{}: {}'.format(result.path, message),
+                              flush=True)
+            elif not args.quiet:
+                print('{}: ok ({:.3f}s)'.format(result.path, result.time),
+                      flush=True)
+    except KeyboardInterrupt:
+        print("\n[interrupted]")
+        return False
+    return success
+
+
+if __name__ == '__main__':
+    sys.exit(int(not main()))
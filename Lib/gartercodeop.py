@@ -16,23 +16,13 @@ First, check if the source consists entirely of blank lines and
 comments; if so, replace it with 'pass', because the built-in
 parser doesn't always do the right thing for these.
 
-Compile three times: as is, with \n, and with \n\n appended.  If it
-compiles as is, it's complete.  If it compiles with one \n appended,
-we expect more.  If it doesn't compile either way, we compare the
-error we get when compiling with \n or \n\n appended.  If the errors
-are the same, the code is broken.  But if the errors are different, we
-expect more.  Not intuitive; not even guaranteed to hold in future
-releases; but this matches the compiler's behavior from Python 1.4
-through 2.2, at least.
-
-Caveat:
-
-It is possible (but not likely) that the parser stops parsing with a
-successful outcome before reaching the end of the source; in this
-case, trailing symbols may be ignored instead of causing an error.
-For example, a backslash followed by two newlines may be followed by
-arbitrary garbage.  This will be fixed once the API for the parser is
-better.
+Then, tokenize the source to determine whether more input is expected:
+when it ends within brackets, a triple-quoted string, or after a line
+continuation; when its last line is the header of a compound statement
+(or a decorator); or when it contains a compound statement which hasn't
+been ended by a blank line.  If so, the source is only parsed, to report
+syntax errors which more input can't fix.  Otherwise, it is compiled,
+and validated, exactly once.
 
 The two interfaces are:
 
@@ -58,6 +48,8 @@ Compile():
 
 import __future__
 import garter
+import io
+import tokenize
 
 _features = [getattr(__future__, fname)
              for fname in __future__.all_feature_names]
@@ -65,6 +57,51 @@ _features = [getattr(__future__, fname)
 __all__ = ["Compile", "CommandCompiler"]
 
 PyCF_DONT_IMPLY_DEDENT = 0x200          # Matches pythonrun.h
+PyCF_ONLY_AST = 0x400                   # Matches pythonrun.h
+
+_TRIVIA = (tokenize.NL, tokenize.COMMENT, tokenize.INDENT, tokenize.DEDENT,
+           tokenize.ENDMARKER)
+_COMPOUND = frozenset(['if', 'elif', 'else', 'while', 'for', 'try', 'except',
+                       'finally', 'with', 'def', 'class', '@'])
+
+def _needs_more(source):
+    """Return True if source is incomplete, judging by the state of the
+    tokenizer at its end."""
+    depth = 0
+    first = last = None # Of the significant tokens on the last logical line
+    compound = False
+    try:
+        # Terminated as it is compiled, such that a line continuation at the
+        # end raises TokenError, whereas a backslash in a comment doesn't
+        readline = io.StringIO(source + "\n").readline
+        for tok in tokenize.generate_tokens(readline):
+            if tok.type == tokenize.OP:
+                if tok.string in '([{':
+                    depth += 1
+                elif tok.string in ')]}':
+                    depth -= 1
+                    if depth < 0:
+                        return False # Unbalanced, more won't help
+            elif tok.type == tokenize.NEWLINE:
+                first = None
+                continue
+            if tok.type not in _TRIVIA:
+                if first is None:
+                    first = tok
+                    compound = compound or tok.string in _COMPOUND
+                last = tok
+    except tokenize.TokenError:
+        return True # EOF within brackets or a triple-quoted string
+    except SyntaxError:
+        return False # e.g. inconsistent indentation
+    if last is None:
+        return True # Nothing to evaluate yet
+    if last.type == tokenize.OP and last.string == ':':
+        return True
+    if first is not None and first.string == '@':
+        return True
+    # Compound statements are ended by a blank line
+    return compound and not source.endswith('\n')
 
 def _maybe_compile(compiler, source, filename, symbol, scope):
     # Check for source consisting of only blank lines and comments
@@ -76,38 +113,19 @@ def _maybe_compile(compiler, source, filename, symbol, scope):
         if symbol != "eval":
             source = "pass"     # Replace it with a 'pass' statement
 
-    err = err1 = err2 = None
-    code = code1 = code2 = None
-
-    # Try to compile it as-is, we take a back up just in case
-    backup = scope.backup()
-    try:
-        code = compiler(source, filename, symbol, scope)
-    except SyntaxError as err:
-        pass
-
-    if code:
-        return code
-    scope.restore(backup) # We decided not to compile
-
-    # These compiler outputs will not be used - so we restore the old value when done
+    if _needs_more(source):
+        # Report the errors which occur before the end of the input, as more
+        # input can't fix them
+        try:
+            compile(source + "\n", filename, symbol,
+                    PyCF_ONLY_AST | PyCF_DONT_IMPLY_DEDENT)
+        except SyntaxError as err:
+            if 'EOF' not in err.msg:
+                raise
+        return None
 
-    backup = scope.backup()
-    try:
-        code1 = compiler(source + "\n", filename, symbol, scope)
-    except SyntaxError as e:
-        err1 = e
-    scope.restore(backup)
-
-    backup = scope.backup()
-    try:
-        code2 = compiler(source + "\n\n", filename, symbol, scope)
-    except SyntaxError as e:
-        err2 = e
-    scope.restore(backup)
-
-    if not code1 and repr(err1) == repr(err2):
-        raise err1
+    # Compile and validate it, any declarations are rolled back on failure
+    return compiler(source + "\n", filename, symbol, scope)
 
 class Compile:
     """Instances of this class behave much like the built-in compile
@@ -132,9 +150,12 @@ class CommandCompiler:
     the instance 'remembers' and compiles all subsequent program texts
     with the statement in force."""
 
-    def __init__(self,):
+    def __init__(self, lazy=False):
         self.compiler = Compile()
-        self.scope = garter.new_global_scope() # A fresh global scope
+        self.lazy = lazy
+        # A fresh global scope; a lazy one only checks function bodies
+        # once a later command reaches them (see check_deferred)
+        self.scope = garter.new_global_scope(lazy=lazy)
 
     def __call__(self, source, filename="<input>", symbol="single"):
         r"""Compile a command and determine whether it is incomplete.
@@ -156,3 +177,12 @@ class CommandCompiler:
           malformed literals).
         """
         return _maybe_compile(self.compiler, source, filename, symbol, self.scope)
+
+    def reset(self):
+        """Forget every name declared by previous commands."""
+        self.scope = garter.new_global_scope(lazy=self.lazy)
+
+    def check_deferred(self, filename="<input>"):
+        """Check the bodies a lazy scope has not needed yet, raising the
+        first GarterError found."""
+        garter.check_deferred(self.scope, filename)
@@ -0,0 +1,98 @@
+"""
+Importing .gt modules from python.
+
+install() adds a path hook, after which .gt files on sys.path can be imported
+as modules, being checked as they are compiled. As with .py files, their
+bytecode is cached in __pycache__, under a garter-XY tag.
+"""
+
+import garter
+import os
+import sys
+from importlib._bootstrap_external import (
+    FileFinder, SourceFileLoader, _code_to_bytecode, _compile_bytecode,
+    _get_supported_file_loaders, _validate_bytecode_header)
+
+
+def cache_from_source(path, optimization=None):
+    """
+    The path of the bytecode cached for the .gt file at path. This mirrors
+    importlib.util.cache_from_source, but uses a garter-XY tag, such that the
+    bytecode for foo.gt can't collide with that of a foo.py beside it.
+    """
+    head, tail = os.path.split(path)
+    base = tail.rpartition('.')[0] or tail
+    if optimization == None:
+        optimization = sys.flags.optimize
+    opt = f'.opt-{optimization}' if optimization else ''
+    tag = 'garter-{}{}'.format(*sys.version_info[:2])
+    return os.path.join(head, '__pycache__', f'{base}.{tag}{opt}.pyc')
+
+
+_checker_mtime = None
+
+
+def checker_mtime():
+    global _checker_mtime
+    if _checker_mtime == None:
+        try:
+            _checker_mtime = os.stat(garter.__file__).st_mtime
+        except OSError:
+            _checker_mtime = 0
+    return _checker_mtime
+
+
+class GarterLoader(SourceFileLoader):
+    """
+    Loader for .gt source files, which are validated when they are compiled.
+    As with .py files, the bytecode is cached in __pycache__, and a module
+    whose cached bytecode is up to date is loaded without being validated.
+    """
+
+    def source_to_code(self, data, path, *, _optimize=-1):
+        return garter.gcompile(data, path, 'exec', optimize=_optimize)
+
+    def get_code(self, fullname):
+        source_path = self.get_filename(fullname)
+        bytecode_path = cache_from_source(source_path)
+        st = self.path_stats(source_path)
+        try:
+            data = self.get_data(bytecode_path)
+            # Bytecode from before the checker was changed may no longer
+            # be valid garter code, so it isn't trusted.
+            if os.stat(bytecode_path).st_mtime < checker_mtime():
+                raise ImportError('stale bytecode')
+            bytes_data = _validate_bytecode_header(data, source_stats=st,
+                                                   name=fullname,
+                                                   path=bytecode_path)
+        except (ImportError, EOFError, OSError):
+            pass
+        else:
+            return _compile_bytecode(bytes_data, name=fullname,
+                                     bytecode_path=bytecode_path,
+                                     source_path=source_path)
+
+        source = self.get_data(source_path)
+        code = self.source_to_code(source, source_path)
+        if not sys.dont_write_bytecode:
+            data = _code_to_bytecode(code, st['mtime'], len(source))
+            self._cache_bytecode(source_path, bytecode_path, data)
+        return code
+
+
+_path_hook = None
+
+
+def install():
+    """
+    Allow .gt files to be imported, by installing a path hook for a FileFinder
+    which knows about them in addition to the usual kinds of modules.
+    """
+    global _path_hook
+    if _path_hook != None:
+        return
+    loaders = _get_supported_file_loaders()
+    loaders.append((GarterLoader, garter.GARTER_SUFFIXES))
+    _path_hook = FileFinder.path_hook(*loaders)
+    sys.path_hooks.insert(0, _path_hook)
+    sys.path_importer_cache.clear()
@@ -6,13 +6,17 @@ garter's logic.
 
 from code import InteractiveConsole
 from gartercodeop import CommandCompiler
+import os
 import readline
 import sys
 import garter
+import garterimport
 
 if __name__ == "__main__":
+    garterimport.install()
     if len(sys.argv) >= 2:
         filename = sys.argv[1]
+        sys.path[0] = os.path.dirname(os.path.abspath(filename))
         with open(filename) as f:
             source = f.read()
         codeob = garter.gcompile(source, filename)
@@ -1,6 +1,8 @@
+import os
 import sys
 import traceback
-from garter import gcompile
+from gartercache import default_cache
+from garterimport import install
 
 
 def showsyntaxerror(filename=None):
@@ -60,10 +62,13 @@ def showtraceback():
         last_tb = ei = None
 
 if __name__ == '__main__':
+    install()
     filename = sys.argv[1]
+    # Like python, make modules beside the script importable
+    sys.path[0] = os.path.dirname(os.path.abspath(filename))
     with open(filename) as f:
         try:
-            code = gcompile(f.read(), filename, 'exec')
+            code = default_cache().gcompile(f.read(), filename, 'exec')
             try:
                 exec(code, {})
             except SystemExit:
@@ -389,7 +389,8 @@ class ModifiedInterpreter(InteractiveInterpreter):
         self.tkconsole = tkconsole
         locals = sys.modules['__main__'].__dict__
         InteractiveInterpreter.__init__(self, locals=locals)
-        self.compile = CommandCompiler() # Use the garter command compiler
+        # Use the garter command compiler, checking function bodies on first use
+        self.compile = CommandCompiler(lazy=True)
         self.save_warnings_filters = None
         self.restarting = False
         self.subprocess_arglist = None
@@ -505,7 +506,7 @@ class ModifiedInterpreter(InteractiveInterpreter):
             # reload remote debugger breakpoints for all PyShellEditWindows
             debug.load_breakpoints()
         self.compile.compiler.flags = self.original_compiler_flags
-        self.compile.compiler.global_scope = garter.new_global_scope()
+        self.compile.reset()
         self.restarting = False
         return self.rpcclt
 
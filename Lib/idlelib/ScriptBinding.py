@@ -27,6 +27,7 @@ from idlelib.configHandler import idleConf
 from idlelib import macosxSupport
 
 import garter
+import gartercache
 
 indent_message = """Error: Inconsistent indentation detected!
 
@@ -52,6 +53,8 @@ class ScriptBinding:
         # XXX This should be done differently
         self.flist = self.editwin.flist
         self.root = self.editwin.root
+        # Rechecks only the parts of the module which have been edited
+        self.checker = None
 
         if macosxSupport.isCocoaTk():
             self.editwin.text_frame.bind('<<run-module-event-2>>', self._run_module_event)
@@ -99,7 +102,10 @@ class ScriptBinding:
         text.tag_remove("ERROR", "1.0", "end")
         try:
             # If successful, return the compiled code
-            return garter.gcompile(source, filename, "exec")
+            if self.checker is None or self.checker.filename != filename:
+                self.checker = garter.IncrementalChecker(
+                    filename, gartercache.default_cache())
+            return self.checker.gcompile(source)
         except (SyntaxError, OverflowError, ValueError) as value:
             msg = getattr(value, 'msg', '') or value or "<no detail available>"
             lineno = getattr(value, 'lineno', '') or 1
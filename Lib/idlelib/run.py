@@ -19,6 +19,8 @@ from idlelib import IOBinding
 
 import __main__
 
+import garterimport
+
 LOCALHOST = '127.0.0.1'
 
 import warnings
@@ -91,6 +93,7 @@ def main(del_exitfunc=False):
     global quitting
     global no_exitfunc
     no_exitfunc = del_exitfunc
+    garterimport.install() # Allow user code to import .gt modules
     #time.sleep(15) # test subprocess not responding
     try:
         assert(len(sys.argv) > 1)
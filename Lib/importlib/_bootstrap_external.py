@@ -224,12 +224,22 @@ _code_type = type(_write_atomic.__code__)
 #     Python 3.5b2  3340 (fix dictionary display evaluation order #11205)
 #     Python 3.5b2  3350 (add GET_YIELD_FROM_ITER opcode #24400)
 #     Python 3.6a0  3360 (add FORMAT_VALUE opcode #25483)
+#     Python 3.6a0  3361 (add type-specialized opcodes for Garter code)
+#     Python 3.6a0  3362 (add BUILD_INT_LIST, BUILD_FLOAT_LIST and
+#                         BUILD_BOOL_LIST opcodes for Garter code)
+#     Python 3.6a0  3363 (add LOAD_FAST_BOUND and LOAD_GLOBAL_BOUND opcodes
+#                         for Garter code)
+#     Python 3.6a0  3364 (add CALL_FUNCTION_DIRECT opcode for Garter code)
+#     Python 3.6a0  3365 (LOAD_FAST_BOUND checks that the variable is bound,
+#                         and CO_GARTER is no longer set)
+#     Python 3.6a0  3366 (remove LOAD_FAST_BOUND, as LOAD_FAST is emitted
+#                         instead)
 #
 # MAGIC must change whenever the bytecode emitted by the compiler may no
 # longer be understood by older implementations of the eval loop (usually
 # due to the addition of new opcodes).
 
-MAGIC_NUMBER = (3360).to_bytes(2, 'little') + b'\r\n'
+MAGIC_NUMBER = (3366).to_bytes(2, 'little') + b'\r\n'
 _RAW_MAGIC_NUMBER = int.from_bytes(MAGIC_NUMBER, 'little')  # For import.c
 
 _PYCACHE = '__pycache__'
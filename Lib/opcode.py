@@ -216,4 +216,26 @@ def_op('BUILD_SET_UNPACK', 153)
 
 def_op('FORMAT_VALUE', 155)
 
+# Specialized forms of other opcodes, emitted for Garter code when the checker
+# has proven the types of the operands. None of them trusts the checker: they
+# check the operands they are given, and fall back to the behaviour of the
+# opcode which they specialize if the operands turn out not to be small ints,
+# floats or lists, or the function called not to be a Python function, such
+# that they never change the result. LOAD_GLOBAL_BOUND only differs from
+# LOAD_GLOBAL in remembering where in the globals it found the name.
+def_op('BINARY_SUBSCR_LIST', 30)
+def_op('STORE_SUBSCR_LIST', 31)
+def_op('BINARY_OP_INT', 156)    # The binary or inplace opcode specialized
+def_op('BINARY_OP_FLOAT', 157)  # ""
+def_op('COMPARE_OP_INT', 158)   # Comparison operator
+hascompare.append(158)
+def_op('COMPARE_OP_FLOAT', 159) # ""
+hascompare.append(159)
+def_op('BUILD_INT_LIST', 160)   # Number of list items
+def_op('BUILD_FLOAT_LIST', 161) # ""
+def_op('BUILD_BOOL_LIST', 162)  # ""
+name_op('LOAD_GLOBAL_BOUND', 164) # Index in name list
+def_op('CALL_FUNCTION_DIRECT', 165)  # #args, which match the parameters
+hasnargs.append(165)
+
 del def_op, name_op, jrel_op, jabs_op
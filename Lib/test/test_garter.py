@@ -0,0 +1,834 @@
+"""Tests for the garter checker and the code it compiles."""
+
+import _garter
+import ast
+import dis
+import functools
+import garter
+import gc
+import gartercache
+import gartercheck
+import multiprocessing
+import os
+import sys
+import textwrap
+import types
+import unittest
+import weakref
+from fractions import Fraction
+from test import support
+try:
+    import threading
+except ImportError:
+    threading = None
+
+
+def run(source):
+    """Check, compile and run source, returning its globals."""
+    ns = {}
+    exec(garter.gcompile(textwrap.dedent(source), '<test>', 'exec'), ns)
+    return ns
+
+
+class SlotLayoutTests(unittest.TestCase):
+
+    source = """
+        class Node:
+            value: int = 3
+            name: str = 'node'
+            __priv: float = 1.5
+
+            def priv(self) -> float:
+                return self.__priv
+
+        node: Node = Node()
+    """
+
+    def test_no_dict(self):
+        ns = run(self.source)
+        node = ns['node']
+        self.assertFalse(hasattr(node, '__dict__'))
+        with self.assertRaises(AttributeError):
+            node.other = 1
+
+    def test_defaults(self):
+        ns = run(self.source)
+        Node, node = ns['Node'], ns['node']
+        self.assertEqual(Node.__garter_defaults__, (1.5, 'node', 3))
+        self.assertEqual(node.value, 3)
+        self.assertEqual(node.name, 'node')
+        node.value = 4
+        self.assertEqual(node.value, 4)
+        self.assertEqual(Node().value, 3)
+
+    def test_private_names_mangled(self):
+        ns = run(self.source)
+        Node, node = ns['Node'], ns['node']
+        self.assertEqual(Node.__slots__, ('_Node__priv', 'name', 'value'))
+        self.assertEqual(node._Node__priv, 1.5)
+        self.assertEqual(node.priv(), 1.5)
+        self.assertFalse(hasattr(node, '__priv'))
+
+    def test_dunder_names_rejected(self):
+        # Such that no member can conflict with those implementing the layout
+        for name in ('__slots__', '__garter_defaults__', '__new__', '__x__'):
+            with self.assertRaises(garter.GarterError):
+                run(f"""
+                    class Node:
+                        {name}: int = 1
+                """)
+        with self.assertRaises(garter.GarterError):
+            run("""
+                class Node:
+                    def __init__(self):
+                        pass
+            """)
+
+
+class BoundNameTests(unittest.TestCase):
+
+    source = """
+        x: int = 1
+        def f() -> int:
+            y: int = x
+            return y
+    """
+
+    def test_opcodes(self):
+        f = run(self.source)['f']
+        opnames = [i.opname for i in dis.get_instructions(f)]
+        self.assertEqual(opnames[:3],
+                         ['LOAD_GLOBAL_BOUND', 'STORE_FAST', 'LOAD_FAST'])
+        self.assertNotIn('LOAD_FAST_BOUND', dis.opmap)
+
+    def test_rebinding(self):
+        ns = run(self.source)
+        f = ns['f']
+        self.assertEqual(f(), 1)
+        ns['x'] = 2
+        self.assertEqual(f(), 2)
+
+    def test_deleting(self):
+        ns = run(self.source)
+        f = ns['f']
+        self.assertEqual(f(), 1)
+        del ns['x']
+        with self.assertRaises(NameError):
+            f()
+        ns['x'] = 3
+        self.assertEqual(f(), 3)
+
+    def test_builtins(self):
+        ns = run(self.source)
+        f = ns['f']
+        self.assertEqual(f(), 1)
+        del ns['x']
+        ns['__builtins__'] = {'x': 5}
+        self.assertEqual(f(), 5)
+        # The global shadows the builtin once it is bound again
+        ns['x'] = 7
+        self.assertEqual(f(), 7)
+        del ns['__builtins__']['x']
+        self.assertEqual(f(), 7)
+
+    def test_resize(self):
+        ns = run(self.source)
+        f = ns['f']
+        self.assertEqual(f(), 1)
+        for i in range(1000):
+            ns['v{}'.format(i)] = i
+        self.assertEqual(f(), 1)
+        ns['x'] = 8
+        self.assertEqual(f(), 8)
+        for i in range(1000):
+            del ns['v{}'.format(i)]
+        self.assertEqual(f(), 8)
+
+
+class SpecializedOpTests(unittest.TestCase):
+
+    source = """
+        def iops(a: int, b: int) -> [int]:
+            return [a + b, a - b, a * b, a // b, a % b]
+        def idiv(a: int, b: int) -> float:
+            return a / b
+        def fops(a: float, b: float) -> [float]:
+            return [a + b, a - b, a * b, a / b]
+        def icmp(a: int, b: int) -> [bool]:
+            return [a < b, a <= b, a == b, a != b, a > b, a >= b]
+        def fcmp(a: float, b: float) -> [bool]:
+            return [a < b, a <= b, a == b, a != b, a > b, a >= b]
+        def aug(a: int, b: int) -> int:
+            a += b
+            a *= b
+            return a
+        def get(xs: [int], i: int) -> int:
+            return xs[i]
+        def put(xs: [int], i: int, v: int) -> [int]:
+            xs[i] = v
+            return xs
+    """
+
+    def setUp(self):
+        self.specialized = run(self.source)
+        # The same functions compiled by compile(), which doesn't specialize
+        self.generic = {}
+        exec(compile(textwrap.dedent(self.source), '<test>', 'exec'),
+             self.generic)
+
+    def opnames(self, name):
+        return [i.opname for i in dis.get_instructions(self.specialized[name])]
+
+    def assertSame(self, name, *args):
+        def call(ns):
+            try:
+                # Compared by repr, such that NaNs and types are compared too
+                return repr(ns[name](*args)), None
+            except Exception as err:
+                return None, type(err)
+        expected = call(self.generic)
+        self.assertEqual(call(self.specialized), expected,
+                         '{}{}'.format(name, args))
+        return expected
+
+    def test_opcodes(self):
+        self.assertEqual(self.opnames('iops').count('BINARY_OP_INT'), 5)
+        self.assertEqual(self.opnames('fops').count('BINARY_OP_FLOAT'), 4)
+        self.assertEqual(self.opnames('icmp').count('COMPARE_OP_INT'), 6)
+        self.assertEqual(self.opnames('fcmp').count('COMPARE_OP_FLOAT'), 6)
+        self.assertEqual(self.opnames('aug').count('BINARY_OP_INT'), 2)
+        self.assertIn('BINARY_SUBSCR_LIST', self.opnames('get'))
+        self.assertIn('STORE_SUBSCR_LIST', self.opnames('put'))
+
+    def test_int_edges(self):
+        big = 2 ** 62
+        for a, b in ((7, 2), (-7, 2), (7, -2), (-7, -2), (2 ** 30 - 1, 1),
+                     (big, big), (-big, big), (2 ** 40, 2 ** 40),
+                     (-2 ** 63, -1), (2 ** 100, -3), (-2 ** 63, 2 ** 63)):
+            for name in ('iops', 'idiv', 'icmp', 'aug', 'fops', 'fcmp'):
+                self.assertSame(name, a, b)
+        self.assertEqual(self.specialized['iops'](-2 ** 63, -1)[3], 2 ** 63)
+
+    def test_float_edges(self):
+        for a, b in ((1.5, 0.25), (-1.5, 2), (3, -0.5), (1e308, 1e308),
+                     (float('inf'), 1.0), (float('nan'), 1.0),
+                     (2 ** 53 + 1, 2 ** 53), (2 ** 70, 1.0)):
+            self.assertSame('fops', a, b)
+            self.assertSame('fcmp', a, b)
+
+    def test_zero_division(self):
+        for name, args in (('iops', (1, 0)), ('iops', (0, 0)),
+                           ('idiv', (1, 0)), ('fops', (1.0, 0.0)),
+                           ('fops', (1, 0))):
+            self.assertEqual(self.assertSame(name, *args),
+                             (None, ZeroDivisionError))
+
+    def test_fallback(self):
+        # Operands which aren't ints or floats are handled as they would be
+        # by the generic opcodes
+        for args in ((True, 2), (2, False), (1.5, 2), ('a', 'b'),
+                     ([1], [2]), (None, 1)):
+            for name in ('iops', 'idiv', 'fops', 'icmp', 'fcmp', 'aug'):
+                self.assertSame(name, *args)
+        self.assertSame('iops', Fraction(1, 2), 3)
+        self.assertSame('fcmp', Fraction(1, 3), 1 / 3)
+
+    def test_indexing(self):
+        for i in (0, 2, -1, -3, 3, -4, 2 ** 70, True):
+            self.assertSame('get', [1, 2, 3], i)
+            self.assertSame('put', [1, 2, 3], i, 9)
+        # Sequences which aren't lists, and keys which aren't ints
+        for xs, i in (((1, 2), 1), ({'k': 1}, 'k'), ('ab', -1),
+                      ([1, 2, 3], slice(1, None)), ([1], 1.0)):
+            self.assertSame('get', xs, i)
+            self.assertSame('put', xs, i, [9])
+
+
+class DirectCallTests(unittest.TestCase):
+
+    source = """
+        def add(a: int, b: int) -> int:
+            return a + b
+        def call(a: int, b: int) -> int:
+            return add(a, b)
+        def fib(n: int) -> int:
+            if n < 2:
+                return n
+            return fib(n - 1) + fib(n - 2)
+        def down(n: int) -> int:
+            return down(n + 1)
+        def scaled(k: int) -> int:
+            def by(x: int) -> int:
+                return x * k
+            return by(3)
+        def use(k: int) -> int:
+            return scaled(k) + call(k, 1)
+        class Counter:
+            total: int = 0
+            def add(self, k: int) -> int:
+                self.total = self.total + k
+                return self.total
+            def count(self, n: int) -> int:
+                if n == 0:
+                    return self.total
+                self.add(n)
+                return self.count(n - 1)
+    """
+
+    def setUp(self):
+        self.ns = run(self.source)
+
+    def test_opcodes(self):
+        for name in ('call', 'fib', 'scaled', 'use'):
+            opnames = [i.opname for i in dis.get_instructions(self.ns[name])]
+            self.assertIn('CALL_FUNCTION_DIRECT', opnames)
+            self.assertNotIn('CALL_FUNCTION', opnames)
+
+    def test_plain(self):
+        self.assertEqual(self.ns['call'](2, 3), 5)
+        self.assertEqual(self.ns['call'](2 ** 70, -1), 2 ** 70 - 1)
+
+    def test_recursion(self):
+        self.assertEqual(self.ns['fib'](15), 610)
+        self.assertEqual(self.ns['Counter']().count(10), 55)
+        with self.assertRaises(RecursionError):
+            self.ns['down'](0)
+
+    def test_cells(self):
+        # k is both an argument and a cell of scaled
+        self.assertIn('k', self.ns['scaled'].__code__.co_cellvars)
+        self.assertEqual(self.ns['scaled'](4), 12)
+        self.assertEqual(self.ns['use'](4), 17)
+
+    def test_generator(self):
+        def add(a, b):
+            yield a
+            yield b
+        self.ns['add'] = add
+        self.assertEqual(list(self.ns['call'](1, 2)), [1, 2])
+
+    def test_fallback(self):
+        class Callable:
+            def __call__(self, a, b):
+                return ('called', a, b)
+        class Holder:
+            def method(self, a, b):
+                return (self, a, b)
+        def defaults(a, b, c=10):
+            return a + b + c
+        def kwonly(a, b, *, c=20):
+            return a + b + c
+        def varargs(*args):
+            return args
+        holder = Holder()
+        for callee, expected in ((pow, 8), (complex, 2 + 3j),
+                                 (Callable(), ('called', 2, 3)),
+                                 (functools.partial(max, 4), 4),
+                                 (holder.method, (holder, 2, 3)),
+                                 (defaults, 15), (kwonly, 25),
+                                 (varargs, (2, 3))):
+            self.ns['add'] = callee
+            self.assertEqual(self.ns['call'](2, 3), expected)
+        self.ns['add'] = 1
+        with self.assertRaises(TypeError):
+            self.ns['call'](2, 3)
+
+
+class LiteralTests(unittest.TestCase):
+
+    def outcome(self, source, **options):
+        try:
+            garter.gcompile(source, '<test>', 'exec', **options)
+        except garter.GarterError as err:
+            return err.lineno, err.msg
+        return None
+
+    def assertSameOutcome(self, source):
+        # Recording the types of expressions checks each item of a literal,
+        # rather than the literal as a whole
+        self.assertEqual(self.outcome(source),
+                         self.outcome(source, return_types=True))
+        return self.outcome(source)
+
+    def test_wide_nested(self):
+        rows = ', '.join('[{0}, {0}]'.format(i) for i in range(2000))
+        ns = run('x: [[int]] = [{}]\n'.format(rows))
+        self.assertEqual(len(ns['x']), 2000)
+        self.assertEqual(ns['x'][1999], [1999, 1999])
+        self.assertIsNone(self.assertSameOutcome(
+            'x: [[int]] = [{}]\n'.format(rows)))
+        for source in ('x: [[int]] = [{}, [2.5]]\n',
+                       'x: [[float]] = [{}, [2.5]]\n',
+                       "x: [[int]] = [{}, ['a']]\n"):
+            with self.subTest(source=source[:18]):
+                self.assertIsNotNone(
+                    self.assertSameOutcome(source.format(rows)))
+
+    def test_mixed_numbers(self):
+        self.assertEqual(run('x: [float] = [1, 2.5, 3]\n')['x'], [1, 2.5, 3])
+        self.assertEqual(run('x := [2.5, 1]\ny: float = x[0]\n')['y'], 2.5)
+        self.assertEqual(run("d: {str: float} = {'a': 1, 'b': 2.5}\n")['d'],
+                         {'a': 1, 'b': 2.5})
+        for source, valid in (('x: [float] = [1, 2.5, 3]\n', True),
+                              ('x: [int] = [1, 2.5, 3]\n', False),
+                              ('x: [float] = [1, 2, 3]\n', False),
+                              ('d: {int: float} = {1: 2, 3: 4.5}\n', True),
+                              ('d: {float: int} = {1: 2, 3.5: 4}\n', True),
+                              ('d: {int: int} = {1: 2, 3: 4.5}\n', False),
+                              ("x: [float] = [1, 'a']\n", False)):
+            with self.subTest(source=source):
+                self.assertEqual(self.assertSameOutcome(source) is None, valid)
+
+
+class DeepExpressionTests(unittest.TestCase):
+
+    terms = 500
+
+    def test_sum(self):
+        # Deeper than the recursion limit allows validating recursively
+        source = 'x: int = {}\n'.format(' + '.join(['1'] * self.terms))
+        self.assertEqual(run(source)['x'], self.terms)
+        source = 'x: float = {} + 2.5\n'.format(' + '.join(['1'] * self.terms))
+        self.assertEqual(run(source)['x'], self.terms + 2.5)
+
+    def test_in_function(self):
+        source = 'def f(a: int) -> int:\n    return {}\nx: int = f(2)\n'
+        self.assertEqual(run(source.format(' + '.join(['a'] * self.terms)))['x'],
+                         2 * self.terms)
+
+    def test_error(self):
+        source = "x: int = {} + 'a'\n".format(' + '.join(['1'] * self.terms))
+        with self.assertRaises(garter.GarterError) as cm:
+            garter.gcompile(source, '<test>', 'exec')
+        self.assertEqual(cm.exception.lineno, 1)
+        with self.assertRaises(garter.GarterErrors) as cm:
+            garter.gcompile(source + 'y: int = 1.5\n', '<test>', 'exec',
+                            collect_errors=True)
+        self.assertEqual([err.lineno for err in cm.exception.errors], [1, 2])
+
+    def test_types_recorded(self):
+        source = 'x: int = {}\n'.format(' + '.join(['1'] * self.terms))
+        code, table = garter.gcompile(source, '<test>', 'exec',
+                                      return_types=True)
+        tree = ast.parse(source)
+        types = table.annotate(tree)
+        self.assertIs(types[tree.body[0].value], garter.TY_INT)
+
+
+class KeywordTests(unittest.TestCase):
+
+    def test_names_starting_with_keywords(self):
+        ns = run("""
+            length: int = 1
+            printer: str = 'p'
+            int2: int = length + 1
+            def lenient(interval: int) -> int:
+                return interval
+            class strict:
+                boolean: bool = True
+            __x: int = 3
+        """)
+        self.assertEqual((ns['length'], ns['printer'], ns['int2']),
+                         (1, 'p', 2))
+        self.assertEqual(ns['lenient'](4), 4)
+        self.assertIs(ns['strict']().boolean, True)
+
+    def test_keywords(self):
+        for name in ('int', 'float', 'bool', 'str', 'len', 'range', 'print',
+                     '__x__', '__init__'):
+            for source in (f'{name}: int = 1', f'def {name}() -> int:\n'
+                           '    return 1', f'import math as {name}'):
+                with self.subTest(source=source):
+                    with self.assertRaises(garter.GarterError) as cm:
+                        run(source)
+                    self.assertIn('keyword', cm.exception.msg)
+        self.assertTrue(garter.is_keyword('__all__'))
+        self.assertFalse(garter.is_keyword('__'))
+        self.assertFalse(garter.is_keyword('____'))
+
+
+class CompileTests(unittest.TestCase):
+
+    def test_only_ast(self):
+        tree = _garter.compile('x: int = 1\n', '<test>', 'exec',
+                               ast.PyCF_ONLY_AST)
+        self.assertIsInstance(tree, ast.Module)
+        self.assertEqual(ast.dump(tree.body[0].value), 'Num(n=1)')
+        # The tree is validated all the same
+        with self.assertRaises(garter.GarterError):
+            _garter.compile("x: int = 'a'\n", '<test>', 'exec',
+                            ast.PyCF_ONLY_AST)
+
+    def test_single(self):
+        scope = garter.new_global_scope()
+        ns = {}
+        with support.captured_stdout() as stdout:
+            exec(_garter.compile('x: int = 2\n', '<test>', 'single', 0,
+                                 False, -1, scope), ns)
+            exec(_garter.compile('x * 3\n', '<test>', 'single', 0, False,
+                                 -1, scope), ns)
+        self.assertEqual(stdout.getvalue(), '6\n')
+        with self.assertRaises(garter.GarterError):
+            _garter.compile("x = 'a'\n", '<test>', 'single', 0, False, -1,
+                            scope)
+        with self.assertRaises(SyntaxError):
+            _garter.compile('x = 1\ny = 2\n', '<test>', 'single')
+
+    def test_dont_inherit(self):
+        # The future statements of the caller are applied unless
+        # dont_inherit is true, as they are by compile()
+        ns = {'garter': garter, '_garter': _garter}
+        exec(textwrap.dedent("""
+            from __future__ import barry_as_FLUFL
+            def gcompile(dont_inherit):
+                return garter.gcompile('b: bool = 1 <> 2\\n', '<test>',
+                                       'exec', dont_inherit=dont_inherit)
+            def compile(dont_inherit):
+                return _garter.compile('b: bool = 1 <> 2\\n', '<test>',
+                                       'exec', 0, dont_inherit)
+        """), ns)
+        for name in ('gcompile', 'compile'):
+            ns[name](False)
+            with self.assertRaises(SyntaxError):
+                ns[name](True)
+        with self.assertRaises(SyntaxError):
+            garter.gcompile('b: bool = 1 <> 2\n', '<test>', 'exec')
+
+    @unittest.skipUnless(threading, 'requires threading')
+    @support.reap_threads
+    def test_threads(self):
+        # Each check keeps its own filename, so errors found by concurrent
+        # checks are located in the right file
+        def worker(i):
+            filename = '<thread {}>'.format(i)
+            sources = ['\n' * i + "x: int = 'a'\n",
+                       'def f() -> int:\n' + '    print(1)\n' * i +
+                       "    return 'a'\n"]
+            barrier.wait()
+            for _ in range(20):
+                for source, lineno in zip(sources, (i + 1, i + 2)):
+                    try:
+                        garter.gcompile(source, filename, 'exec')
+                    except garter.GarterError as err:
+                        located.append((err.filename, err.lineno) ==
+                                       (filename, lineno))
+                    else:
+                        located.append(False)
+        nthreads = 8
+        barrier = threading.Barrier(nthreads)
+        located = []
+        threads = [threading.Thread(target=worker, args=(i,))
+                   for i in range(nthreads)]
+        with support.start_threads(threads):
+            pass
+        self.assertEqual(len(located), nthreads * 40)
+        self.assertTrue(all(located))
+
+
+class CollectErrorsTests(unittest.TestCase):
+
+    source = """\
+        x: int = 'a'
+        y: int = x + 1
+        z: str = 1
+        def f(a: int) -> int:
+            return a + undefined
+        w: int = f(1)
+        class C:
+            v: int = 'no'
+        u: int = C().v + 1
+        ok: int = 1
+        bad: bool = ok
+    """
+
+    def gcompile(self, **kwargs):
+        return garter.gcompile(textwrap.dedent(self.source), '<test>', 'exec',
+                               **kwargs)
+
+    def test_collected(self):
+        with self.assertRaises(garter.GarterErrors) as cm:
+            self.gcompile(collect_errors=True)
+        err = cm.exception
+        # The uses of x, f and C.v, whose declarations had errors, don't
+        # report errors of their own
+        self.assertEqual([(e.lineno, e.msg) for e in err.errors], [
+            (1, 'Invalid type in assignment'),
+            (3, 'Invalid type in assignment'),
+            (5, 'No variable with name undefined in scope'),
+            (8, 'Invalid type in assignment'),
+            (11, 'Invalid type in assignment'),
+        ])
+        self.assertEqual({e.filename for e in err.errors}, {'<test>'})
+        self.assertEqual((err.lineno, err.msg),
+                         (1, 'Invalid type in assignment'))
+
+    def test_max_errors(self):
+        with self.assertRaises(garter.GarterErrors) as cm:
+            self.gcompile(collect_errors=True, max_errors=2)
+        self.assertEqual([e.lineno for e in cm.exception.errors], [1, 3])
+
+    def test_first_error(self):
+        with self.assertRaises(garter.GarterError) as cm:
+            self.gcompile()
+        self.assertNotIsInstance(cm.exception, garter.GarterErrors)
+        self.assertEqual(cm.exception.lineno, 1)
+
+
+class TypeTableTests(unittest.TestCase):
+
+    source = textwrap.dedent("""\
+        x: int = 1
+        y: [float] = [1.5, x]
+        z: str = str(x)
+    """)
+
+    def annotated(self, table):
+        tree = ast.parse(self.source)
+        return sorted((ast.dump(node), str(ty))
+                      for node, ty in table.annotate(tree).items())
+
+    def test_annotate(self):
+        code, table = garter.gcompile(self.source, '<test>', 'exec',
+                                      return_types=True)
+        self.assertIsInstance(code, types.CodeType)
+        self.assertEqual(len(table), len(list(ast.walk(ast.parse(
+            self.source)))))
+        self.assertEqual(self.annotated(table), [
+            ("Call(func=Name(id='str', ctx=Load()), args=[Name(id='x', "
+             "ctx=Load())], keywords=[])", 'str'),
+            ("List(elts=[Num(n=1.5), Name(id='x', ctx=Load())], "
+             "ctx=Load())", '[float]'),
+            ("Name(id='x', ctx=Load())", 'int'),
+            ("Name(id='x', ctx=Load())", 'int'),
+            ('Num(n=1)', 'int'),
+            ('Num(n=1.5)', 'float'),
+        ])
+        # Each type is held once
+        self.assertEqual(len(table.types), 4)
+        self.assertIs(table.types[0], garter.TY_INT)
+
+    def test_round_trip(self):
+        code, table = garter.gcompile(self.source, '<test>', 'exec',
+                                      return_types=True)
+        loaded = garter.TypeTable.loads(table.dumps())
+        self.assertEqual(loaded.types, [str(ty) for ty in table.types])
+        self.assertEqual(loaded.ids, table.ids)
+        self.assertEqual(self.annotated(loaded), self.annotated(table))
+        self.assertEqual([loaded.get(n) for n in range(len(loaded))],
+                         [table.get(n) and str(table.get(n))
+                          for n in range(len(table))])
+
+    def test_only_ast(self):
+        tree, table = garter.gcompile(self.source, '<test>', 'exec',
+                                      ast.PyCF_ONLY_AST, return_types=True)
+        self.assertIsInstance(tree, ast.Module)
+        self.assertEqual(self.annotated(table),
+                         sorted((ast.dump(node), str(ty)) for node, ty in
+                                table.annotate(tree).items()))
+
+
+class TypeTests(unittest.TestCase):
+
+    def test_interned(self):
+        self.assertIs(garter.TyList(garter.TY_INT), garter.TyList(garter.TY_INT))
+        self.assertIs(garter.TyDict(garter.TY_STR, garter.TyList(garter.TY_INT)),
+                      garter.TyDict(garter.TY_STR, garter.TyList(garter.TY_INT)))
+        self.assertIs(garter.TyFunc(garter.TY_INT, [garter.TY_FLOAT]),
+                      garter.TyFunc(garter.TY_INT, (garter.TY_FLOAT,)))
+        self.assertIsNot(garter.TyList(garter.TY_INT),
+                         garter.TyList(garter.TY_FLOAT))
+        # Equal types are the same type, so equality is identity
+        self.assertEqual(len({garter.TyList(garter.TY_INT),
+                              garter.TyList(garter.TY_INT)}), 1)
+
+    def test_cache_hits(self):
+        garter.subsume_cache_clear()
+        self.addCleanup(garter.subsume_cache_clear)
+        a = garter.TyFunc(garter.TY_FLOAT, [garter.TY_INT])
+        b = garter.TyFunc(garter.TY_INT, [garter.TY_FLOAT])
+        self.assertTrue(a.subsumes(b))
+        info = garter.subsume_cache_info()
+        self.assertGreater(info.misses, 0)
+        # Asked again, the answer comes straight from the cache
+        self.assertTrue(a.subsumes(b))
+        after = garter.subsume_cache_info()
+        self.assertEqual(after.hits, info.hits + 1)
+        self.assertEqual(after.misses, info.misses)
+
+    def test_released(self):
+        garter.subsume_cache_clear()
+        self.addCleanup(garter.subsume_cache_clear)
+        ty = garter.TyFunc(garter.TY_BOOL, [garter.TY_BOOL] * 9)
+        ty.subsumes(garter.TY_INT)
+        ref = weakref.ref(ty)
+        del ty
+        gc.collect()
+        # The cache holds the types of the pairs it has compared
+        self.assertIsNotNone(ref())
+        garter.subsume_cache_clear()
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+class CheckFileTests(unittest.TestCase):
+
+    def write(self, dirname, name, source):
+        path = os.path.join(dirname, name)
+        with open(path, 'w') as f:
+            f.write(textwrap.dedent(source))
+        return path
+
+    def test_internal_error(self):
+        def boom(scope, expr):
+            raise RuntimeError('boom')
+        with support.temp_dir() as dirname:
+            path = self.write(dirname, 'a.py', 'x: int = 1 if True else 2\n')
+            with support.swap_item(garter.EXPR_VALIDATORS, ast.IfExp, boom):
+                result = gartercheck.check_file(path)
+        self.assertFalse(result.ok)
+        self.assertTrue(result.message.startswith('internal error:'))
+        self.assertEqual(result.errors, [(None, None, result.message)])
+
+    @unittest.skipIf(gartercheck.ProcessPoolExecutor is None,
+                     'requires concurrent.futures')
+    @unittest.skipUnless(multiprocessing.get_start_method() == 'fork',
+                         'workers must inherit the patched validator')
+    def test_internal_error_in_worker(self):
+        def boom(scope, expr):
+            raise RuntimeError('boom')
+        with support.temp_dir() as dirname:
+            self.write(dirname, 'a.py', 'x: int = 1 if True else 2\n')
+            self.write(dirname, 'b.py', 'x: int = 1\n')
+            with support.swap_item(garter.EXPR_VALIDATORS, ast.IfExp, boom):
+                results = sorted(gartercheck.check_many([dirname], workers=2))
+        self.assertEqual([os.path.basename(r.path) for r in results],
+                         ['a.py', 'b.py'])
+        self.assertFalse(results[0].ok)
+        self.assertTrue(results[0].message.startswith('internal error:'))
+        self.assertTrue(results[1].ok)
+
+
+class ScopeTests(unittest.TestCase):
+
+    def test_lookup_after_check(self):
+        scope = garter.new_global_scope()
+        source = 'class C:\n    a: int = 0\nx: int = 1\n'
+        garter.check(ast.parse(source), '<test>', scope)
+        self.assertIsNone(scope.ctx)
+        self.assertIs(scope.lookup('x').ty, garter.TY_INT)
+        self.assertIsNone(scope.lookup('y'))
+        self.assertIsNotNone(scope.lookup_class('C'))
+        self.assertIsNone(scope.lookup_class('D'))
+
+    def test_restore(self):
+        scope = garter.new_global_scope()
+        garter.check(ast.parse('x: int = 1\n'), '<test>', scope)
+        backup = scope.backup()
+        source = ''.join('y{0}: int = {0}\n'.format(i) for i in range(100))
+        garter.check(ast.parse(source + 'class C:\n    a: int = 0\n'),
+                     '<test>', scope)
+        self.assertIsNotNone(scope.lookup('y99'))
+        scope.restore(backup)
+        self.assertIsNone(scope.lookup('y99'))
+        self.assertIsNone(scope.lookup_class('C'))
+        self.assertIs(scope.lookup('x').ty, garter.TY_INT)
+        # Names may be declared again once they have been rolled back
+        garter.check(ast.parse('y0: str = "a"\n'), '<test>', scope)
+        self.assertIs(scope.lookup('y0').ty, garter.TY_STR)
+        # A backup taken after the state which was rolled back is stale
+        later = scope.backup()
+        scope.restore(backup)
+        garter.check(ast.parse('z: int = 1\n'), '<test>', scope)
+        with self.assertRaises(ValueError):
+            scope.restore(later)
+
+
+class IncrementalCheckerTests(unittest.TestCase):
+
+    source = """\
+        x: int = 1
+        def f() -> int:
+            return x
+        y: int = x + 1
+        z: int = 2
+    """
+
+    def setUp(self):
+        self.dirname = support.TESTFN + '_garter'
+        os.mkdir(self.dirname)
+        self.addCleanup(support.rmtree, self.dirname)
+        sys.path.insert(0, self.dirname)
+        self.addCleanup(sys.path.remove, self.dirname)
+        self.checker = garter.IncrementalChecker('<test>')
+
+    def check(self, source):
+        self.checker.gcompile(textwrap.dedent(source))
+        return self.checker.validated, self.checker.reused
+
+    def write_module(self, name, source):
+        path = os.path.join(self.dirname, name + '.gt')
+        mtime = os.stat(path).st_mtime if os.path.exists(path) else 0
+        with open(path, 'w') as f:
+            f.write(source)
+        # Such that the change is seen on filesystems with coarse mtimes
+        os.utime(path, (mtime + 10, mtime + 10))
+
+    def test_unchanged(self):
+        self.assertEqual(self.check(self.source), (5, 0))
+        self.assertEqual(self.check(self.source), (0, 5))
+
+    def test_edit(self):
+        self.check(self.source)
+        # Only the edited statement is revalidated
+        source = self.source.replace('x: int = 1', 'x: int = 5')
+        self.assertEqual(self.check(source), (1, 4))
+
+    def test_changed_type(self):
+        self.check(self.source)
+        # As are the statement and function body which used x
+        source = self.source.replace('x: int = 1', "x: str = 'a'")
+        with self.assertRaises(garter.GarterError) as cm:
+            self.check(source)
+        self.assertEqual(cm.exception.lineno, 3)
+        self.assertEqual((self.checker.validated, self.checker.reused), (3, 2))
+
+    def test_changed_module(self):
+        self.write_module('garter_helper', 'n: int = 1\n')
+        source = """\
+            import garter_helper
+            m: int = garter_helper.n
+            k: int = 2
+        """
+        self.assertEqual(self.check(source), (3, 0))
+        self.assertEqual(self.check(source), (0, 3))
+        self.write_module('garter_helper', "n: str = 'one'\n")
+        with self.assertRaises(garter.GarterError) as cm:
+            self.check(source)
+        self.assertEqual(cm.exception.lineno, 2)
+        self.assertEqual((self.checker.validated, self.checker.reused), (2, 1))
+
+    def test_cache(self):
+        self.write_module('garter_cached', 'n: int = 1\n')
+        source = """\
+            import garter_cached
+            m: int = garter_cached.n
+        """
+        cache = gartercache.ResultCache(os.path.join(self.dirname, 'cache'))
+        with support.swap_attr(sys, 'dont_write_bytecode', False):
+            self.checker = garter.IncrementalChecker('<test>', cache)
+            self.assertEqual(self.check(source), (2, 0))
+            self.assertEqual((cache.hits, cache.misses), (0, 1))
+            # A new checker, such as for the file reopened, uses the cache
+            self.checker = garter.IncrementalChecker('<test>', cache)
+            self.assertEqual(self.check(source), (0, 0))
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+            # Until the imported module changes
+            self.write_module('garter_cached', 'n: int = 2\n')
+            self.assertEqual(self.check(source), (2, 0))
+            self.assertEqual((cache.hits, cache.misses), (1, 2))
+            self.assertEqual(self.check(source), (0, 0))
+            self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
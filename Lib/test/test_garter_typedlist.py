@@ -0,0 +1,240 @@
+"""Tests for the typed lists which Garter code creates, see typedlistobject.h."""
+
+import gc
+import math
+import pickle
+import sys
+import unittest
+import weakref
+from _garter import TypedList
+
+
+class BoxingTests(unittest.TestCase):
+
+    def test_int_overflow(self):
+        big = 2 ** 70
+        t = TypedList('l', [1, 2])
+        t.append(big)
+        self.assertEqual(t, [1, 2, big])
+        self.assertIs(t[2], big)
+        self.assertEqual(t.index(big), 2)
+        t[2] = 3
+        self.assertEqual(t, [1, 2, 3])
+        self.assertEqual(TypedList('l', [-sys.maxsize - 1, sys.maxsize]),
+                         [-sys.maxsize - 1, sys.maxsize])
+
+    def test_nan(self):
+        nan = float('nan')
+        t = TypedList('d', [1.5])
+        t.append(nan)
+        # NaNs are only found by identity, which unboxing would lose
+        self.assertIn(nan, t)
+        self.assertIs(t[1], nan)
+        self.assertEqual(t.index(nan), 1)
+        self.assertEqual(t.count(nan), 1)
+        self.assertNotIn(float('nan'), t)
+        t.remove(nan)
+        self.assertEqual(t, [1.5])
+
+    def test_foreign_objects(self):
+        obj = object()
+        for typecode, items in (('l', [1, 2]), ('d', [1.5, 2.5]),
+                                ('?', [True, False])):
+            t = TypedList(typecode, items)
+            t.insert(1, obj)
+            self.assertEqual(t, [items[0], obj, items[1]])
+            self.assertIs(t[1], obj)
+            self.assertEqual(t.typecode, typecode)
+        # Equal objects of another type are kept as they are
+        t = TypedList('l', [1])
+        t.append(True)
+        t.append(2.0)
+        self.assertEqual([type(x) for x in t], [int, bool, float])
+        t = TypedList('?', [True])
+        t.append(1)
+        self.assertEqual([type(x) for x in t], [bool, int])
+
+    def test_sizeof(self):
+        t = TypedList('?', [True] * 100)
+        unboxed = sys.getsizeof(t)
+        t.append(None)
+        self.assertGreater(sys.getsizeof(t), unboxed)
+
+    def test_not_a_list(self):
+        t = TypedList('l', [1])
+        self.assertIs(type(t), TypedList)
+        self.assertNotIsInstance(t, list)
+        self.assertEqual(list(t), [1])
+
+
+class SlicingTests(unittest.TestCase):
+
+    def test_get(self):
+        t = TypedList('d', [0.5, 1.5, 2.5, 3.5])
+        for s in (slice(None), slice(1, 3), slice(None, None, -1),
+                  slice(3, 0, -2), slice(5, 10)):
+            u = t[s]
+            self.assertIs(type(u), TypedList)
+            self.assertEqual(u.typecode, 'd')
+            self.assertEqual(u, list(t)[s])
+
+    def test_set(self):
+        for s, v in ((slice(1, 3), [7]), (slice(1, 1), [7, 8, 9]),
+                     (slice(None, None, 2), [7, 8]),
+                     (slice(None, None, -1), [5, 6, 7, 8]),
+                     (slice(0, 2), [2 ** 70, None])):
+            t = TypedList('l', [1, 2, 3, 4])
+            l = [1, 2, 3, 4]
+            t[s] = v
+            l[s] = v
+            self.assertEqual(t, l)
+        t = TypedList('l', [1, 2, 3])
+        with self.assertRaises(ValueError):
+            t[::2] = [1]
+        with self.assertRaises(TypeError):
+            t[:] = 1
+        t[:] = t
+        self.assertEqual(t, [1, 2, 3])
+        t[1:] = (x * 10 for x in t)
+        self.assertEqual(t, [1, 10, 20, 30])
+
+    def test_delete(self):
+        for s in (slice(1, 3), slice(None, None, 2), slice(None, None, -2),
+                  slice(None), slice(5, 10)):
+            t = TypedList('l', [1, 2, 3, 4, 5])
+            l = [1, 2, 3, 4, 5]
+            del t[s]
+            del l[s]
+            self.assertEqual(t, l)
+
+
+class SortTests(unittest.TestCase):
+
+    def test_unboxed(self):
+        t = TypedList('l', [3, -1, 2, 0])
+        t.sort()
+        self.assertEqual(t, [-1, 0, 2, 3])
+        t.sort(reverse=True)
+        self.assertEqual(t, [3, 2, 0, -1])
+        t = TypedList('?', [True, False, True])
+        t.sort()
+        self.assertEqual(t, [False, True, True])
+
+    def test_floats_stable(self):
+        t = TypedList('d', [0.0, -0.0, 1.0, -0.0])
+        t.sort()
+        self.assertEqual([math.copysign(1, x) for x in t], [1, -1, -1, 1])
+        t = TypedList('d', [0.0, -0.0, 1.0, -0.0])
+        t.sort(reverse=True)
+        self.assertEqual([math.copysign(1, x) for x in t], [1, 1, -1, -1])
+
+    def test_key(self):
+        t = TypedList('l', [3, -4, 1])
+        t.sort(key=abs)
+        self.assertEqual(t, [1, 3, -4])
+        t.sort(key=abs, reverse=True)
+        self.assertEqual(t, [-4, 3, 1])
+        self.assertEqual(t.typecode, 'l')
+        with self.assertRaises(TypeError):
+            t.sort(abs)
+
+    def test_boxed(self):
+        t = TypedList('l', [3, 2 ** 70, 1])
+        t.sort()
+        self.assertEqual(t, [1, 3, 2 ** 70])
+        t.append('x')
+        with self.assertRaises(TypeError):
+            t.sort()
+        self.assertEqual(sorted(t, key=str), sorted([1, 3, 2 ** 70, 'x'],
+                                                    key=str))
+
+    def test_modified_during_sort(self):
+        t = TypedList('l', [3, 1, 2])
+        def key(x):
+            t.append(4)
+            return x
+        with self.assertRaises(ValueError):
+            t.sort(key=key)
+        self.assertEqual(sorted(t), [1, 2, 3])
+        def key(x):
+            t.clear()
+            return x
+        with self.assertRaises(ValueError):
+            t.sort(key=key)
+        self.assertEqual(sorted(t), [1, 2, 3])
+
+    def test_modified_during_search(self):
+        t = TypedList('l', [1, 2, 3])
+        class Clearing:
+            def __eq__(self, other):
+                t.clear()
+                return False
+        self.assertEqual(t.count(Clearing()), 0)
+        self.assertEqual(t, [])
+
+
+class ComparisonTests(unittest.TestCase):
+
+    def test_equality(self):
+        self.assertEqual(TypedList('l', [1, 2]), [1, 2])
+        self.assertEqual([1, 2], TypedList('l', [1, 2]))
+        self.assertEqual(TypedList('l', [1, 2]), TypedList('d', [1.0, 2.0]))
+        self.assertEqual(TypedList('l', [1, 0]), TypedList('?', [True, False]))
+        self.assertNotEqual(TypedList('l', [1, 2]), TypedList('l', [1]))
+        self.assertNotEqual(TypedList('l', [1, 2]), (1, 2))
+        self.assertEqual(TypedList('l', [1, 2 ** 70]), [1, 2 ** 70])
+
+    def test_ordering(self):
+        self.assertLess(TypedList('l', [1, 2]), TypedList('l', [1, 3]))
+        self.assertLess(TypedList('l', [1, 2]), [1, 2, 0])
+        self.assertGreater([2], TypedList('d', [1.5, 9.0]))
+        with self.assertRaises(TypeError):
+            TypedList('l', [1]) < (1,)
+
+    def test_unhashable(self):
+        with self.assertRaises(TypeError):
+            hash(TypedList('l'))
+
+
+class GCTests(unittest.TestCase):
+
+    def test_self_cycle(self):
+        t = TypedList('l', [1])
+        t.append(t)
+        self.assertEqual(repr(t), '[1, [...]]')
+        self.assertTrue(gc.is_tracked(t))
+        holder = Holder()
+        holder.items = t
+        t.append(holder)
+        ref = weakref.ref(holder)
+        del t, holder
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_cycle_through_iterator(self):
+        holder = Holder()
+        holder.it = iter(TypedList('d', [1.5, holder]))
+        ref = weakref.ref(holder)
+        del holder
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+class Holder:
+    pass
+
+
+class PickleTests(unittest.TestCase):
+
+    def test_roundtrip(self):
+        for t in (TypedList('l', [1, 2]), TypedList('d', [1.5]),
+                  TypedList('?', [True]), TypedList('l', [1, None])):
+            for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+                u = pickle.loads(pickle.dumps(t, proto))
+                self.assertIs(type(u), TypedList)
+                self.assertEqual(u.typecode, t.typecode)
+                self.assertEqual(u, t)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+   Test cases for gartercodeop.py, after those for codeop.py
+"""
+import unittest
+
+from gartercodeop import CommandCompiler
+
+COMPLETE, INCOMPLETE, ERROR = 'complete', 'incomplete', 'error'
+
+# Each input, and whether it is a complete command, the start of one, or
+# an error which no more input can fix
+VERDICTS = [
+    ('', COMPLETE),
+    ('\n', COMPLETE),
+    ('# comment', COMPLETE),
+    ('x: int = 1', COMPLETE),
+    ('x: int = 1\n', COMPLETE),
+    ('\n\nx := 1\n\n', COMPLETE),
+    ('x: int = 1 # comment \\', COMPLETE),
+    ("x: str = 'a\\\\'", COMPLETE),
+    ('x: int = 1 + \\\n2', COMPLETE),
+    ('x: str = """a"""', COMPLETE),
+    ('print(1)', COMPLETE),
+    ('if True:\n    pass\n', COMPLETE),
+    ('for i in range(3):\n    print(i)\n', COMPLETE),
+    ('def f() -> int:\n    return 1\n', COMPLETE),
+    ('x: int = 1 + \\', INCOMPLETE),
+    ('x: int = (1 +', INCOMPLETE),
+    ('x: [int] = [1,\n 2', INCOMPLETE),
+    ('x: str = """a', INCOMPLETE),
+    ('if True:', INCOMPLETE),
+    ('if True:\n    pass', INCOMPLETE),
+    ('if True:\n    x: int = 1\nelse:', INCOMPLETE),
+    ('def f() -> int:\n    return 1', INCOMPLETE),
+    ('@decorator', INCOMPLETE),
+    ('x: int = )', ERROR),
+    ('x: int = (1 + ]', ERROR),
+    ('x: int = 1 +', ERROR),
+    ('if True:\n  pass\n    pass', ERROR),
+    ('if True pass', ERROR),
+    ('print(undefined)', ERROR),
+    ("x: int = 'a'", ERROR),
+    ('x := 1\nx := 2', ERROR),
+]
+
+
+class CommandCompilerTests(unittest.TestCase):
+
+    def verdict(self, source):
+        try:
+            code = CommandCompiler()(source)
+        except SyntaxError:
+            return ERROR
+        return INCOMPLETE if code is None else COMPLETE
+
+    def test_verdicts(self):
+        for source, expected in VERDICTS:
+            with self.subTest(source=source):
+                self.assertEqual(self.verdict(source), expected)
+
+    def test_eval(self):
+        compiler = CommandCompiler()
+        self.assertEqual(eval(compiler('1 + 2', symbol='eval')), 3)
+        self.assertIsNone(compiler('(1 +', symbol='eval'))
+        with self.assertRaises(SyntaxError):
+            compiler('1 +', symbol='eval')
+
+    def test_declarations_remembered(self):
+        compiler = CommandCompiler()
+        ns = {}
+        exec(compiler('x: int = 1'), ns)
+        exec(compiler('y: int = x + 1'), ns)
+        self.assertEqual(ns['y'], 2)
+        with self.assertRaises(SyntaxError):
+            compiler('x: int = 3')
+        compiler.reset()
+        self.assertIsNotNone(compiler('x: int = 3'))
+
+    def test_lazy_rollback(self):
+        compiler = CommandCompiler(lazy=True)
+        # g is only declared once the body of f is demanded
+        self.assertIsNotNone(compiler('def f() -> int:\n    return g\n'))
+        with self.assertRaises(SyntaxError):
+            compiler("g: int = 1\nx: int = f()\ny: int = 'a'\n",
+                     symbol='exec')
+        # The failed command is forgotten, including checking the body of f,
+        # which must be checked again against the new declaration of g
+        self.assertIsNotNone(compiler("g: str = 'a'"))
+        with self.assertRaises(SyntaxError) as cm:
+            compiler.check_deferred()
+        self.assertEqual(cm.exception.lineno, 2)
+        compiler.reset()
+        compiler('def f() -> int:\n    return g\n')
+        compiler('g: int = 1')
+        compiler.check_deferred()
+
+
+if __name__ == "__main__":
+    unittest.main()
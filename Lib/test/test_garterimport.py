@@ -0,0 +1,93 @@
+"""Tests for importing .gt modules from python, see garterimport.py."""
+
+import garter
+import garterimport
+import importlib
+import os
+import sys
+import unittest
+from test import support
+
+
+class ImportTests(unittest.TestCase):
+
+    def setUp(self):
+        self.dirname = os.path.abspath(support.TESTFN + '_garterimport')
+        os.mkdir(self.dirname)
+        self.addCleanup(support.rmtree, self.dirname)
+        self.addCleanup(sys.path_importer_cache.clear)
+        for obj, attr, value in ((sys, 'path', [self.dirname] + sys.path),
+                                 (sys, 'path_hooks', sys.path_hooks[:]),
+                                 (sys, 'dont_write_bytecode', False),
+                                 (garterimport, '_path_hook', None)):
+            swap = support.swap_attr(obj, attr, value)
+            swap.__enter__()
+            self.addCleanup(swap.__exit__, None, None, None)
+        self.addCleanup(support.forget, 'garter_mod')
+        garterimport.install()
+
+    def write(self, source):
+        path = os.path.join(self.dirname, 'garter_mod.gt')
+        with open(path, 'w') as f:
+            f.write(source)
+        importlib.invalidate_caches()
+        return path
+
+    def load(self):
+        """ Import garter_mod afresh, returning it and whether it was checked """
+        checked = []
+        def source_to_code(loader, data, path, *, _optimize=-1):
+            checked.append(path)
+            return garter.gcompile(data, path, 'exec', optimize=_optimize)
+        support.forget('garter_mod')
+        with support.swap_attr(garterimport.GarterLoader, 'source_to_code',
+                               source_to_code):
+            module = importlib.import_module('garter_mod')
+        return module, bool(checked)
+
+    def test_bytecode_cached(self):
+        path = self.write('n: int = 1\n')
+        module, checked = self.load()
+        self.assertEqual(module.n, 1)
+        self.assertTrue(checked)
+        self.assertIsInstance(module.__loader__, garterimport.GarterLoader)
+        bytecode = garterimport.cache_from_source(path)
+        self.assertEqual(os.listdir(os.path.dirname(bytecode)),
+                         ['garter_mod.garter-{}{}.pyc'.format(
+                             *sys.version_info[:2])])
+        # Reused rather than checked again
+        module, checked = self.load()
+        self.assertEqual(module.n, 1)
+        self.assertFalse(checked)
+
+    def test_source_changed(self):
+        path = self.write('n: int = 1\n')
+        self.load()
+        self.write('n: int = 22\n')
+        mtime = os.stat(path).st_mtime + 10
+        os.utime(path, (mtime, mtime))
+        module, checked = self.load()
+        self.assertEqual(module.n, 22)
+        self.assertTrue(checked)
+
+    def test_checker_changed(self):
+        path = self.write('n: int = 1\n')
+        self.load()
+        # Bytecode older than the checker may no longer be valid garter code
+        mtime = os.stat(garterimport.cache_from_source(path)).st_mtime
+        with support.swap_attr(garterimport, '_checker_mtime', mtime + 10):
+            module, checked = self.load()
+        self.assertEqual(module.n, 1)
+        self.assertTrue(checked)
+
+    def test_invalid(self):
+        path = self.write("n: int = 'a'\n")
+        with self.assertRaises(garter.GarterError) as cm:
+            self.load()
+        self.assertEqual((cm.exception.filename, cm.exception.lineno),
+                         (path, 1))
+        self.assertFalse(os.path.exists(garterimport.cache_from_source(path)))
+
+
+if __name__ == '__main__':
+    unittest.main()
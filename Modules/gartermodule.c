@@ -0,0 +1,281 @@
+#include "Python.h"
+#include "structmember.h"
+
+static PyObject *
+garter_compile(PyObject *self, PyObject *args)
+{
+    PyObject *source, *filename, *scope = Py_None, *result;
+    const char *str;
+    char *startstr;
+    int flags = 0, dont_inherit = 0, optimize = -1, start;
+    Py_ssize_t size;
+    PyCompilerFlags cf;
+
+    if (!PyArg_ParseTuple(args, "OO&s|iiiO:compile",
+                          &source, PyUnicode_FSDecoder, &filename, &startstr,
+                          &flags, &dont_inherit, &optimize, &scope))
+        return NULL;
+
+    cf.cf_flags = flags | PyCF_SOURCE_IS_UTF8;
+    if (flags &
+        ~(PyCF_MASK | PyCF_MASK_OBSOLETE | PyCF_DONT_IMPLY_DEDENT | PyCF_ONLY_AST))
+    {
+        PyErr_SetString(PyExc_ValueError,
+                        "compile(): unrecognised flags");
+        goto error;
+    }
+    if (optimize < -1 || optimize > 2) {
+        PyErr_SetString(PyExc_ValueError,
+                        "compile(): invalid optimize value");
+        goto error;
+    }
+
+    /* Inherit the future statements of the caller, as compile() does */
+    if (!dont_inherit) {
+        PyEval_MergeCompilerFlags(&cf);
+    }
+
+    if (strcmp(startstr, "exec") == 0)
+        start = Py_file_input;
+    else if (strcmp(startstr, "eval") == 0)
+        start = Py_eval_input;
+    else if (strcmp(startstr, "single") == 0)
+        start = Py_single_input;
+    else {
+        PyErr_SetString(PyExc_ValueError,
+                        "compile() mode must be 'exec', 'eval' or 'single'");
+        goto error;
+    }
+
+    if (PyUnicode_Check(source)) {
+        cf.cf_flags |= PyCF_IGNORE_COOKIE;
+        str = PyUnicode_AsUTF8AndSize(source, &size);
+        if (str == NULL)
+            goto error;
+    }
+    else if (PyBytes_Check(source)) {
+        str = PyBytes_AS_STRING(source);
+        size = PyBytes_GET_SIZE(source);
+    }
+    else {
+        PyErr_SetString(PyExc_TypeError,
+                        "compile() arg 1 must be a string or bytes object");
+        goto error;
+    }
+    if (strlen(str) != (size_t)size) {
+        PyErr_SetString(PyExc_ValueError,
+                        "source code string cannot contain null bytes");
+        goto error;
+    }
+
+    result = Garter_CompileStringObject(str, filename, start, &cf, optimize,
+                                        scope);
+    Py_DECREF(filename);
+    return result;
+
+error:
+    Py_DECREF(filename);
+    return NULL;
+}
+
+static PyObject *
+garter_compile_checked(PyObject *self, PyObject *args)
+{
+    PyObject *tree, *filename, *result;
+    char *startstr;
+    int flags = 0, optimize = -1, mode;
+    PyCompilerFlags cf;
+
+    if (!PyArg_ParseTuple(args, "OO&s|ii:compile_checked",
+                          &tree, PyUnicode_FSDecoder, &filename, &startstr,
+                          &flags, &optimize))
+        return NULL;
+
+    cf.cf_flags = flags | PyCF_SOURCE_IS_UTF8;
+    if (flags & ~(PyCF_MASK | PyCF_MASK_OBSOLETE | PyCF_DONT_IMPLY_DEDENT)) {
+        PyErr_SetString(PyExc_ValueError,
+                        "compile_checked(): unrecognised flags");
+        goto error;
+    }
+    if (optimize < -1 || optimize > 2) {
+        PyErr_SetString(PyExc_ValueError,
+                        "compile_checked(): invalid optimize value");
+        goto error;
+    }
+
+    /* The modes of PyAST_obj2mod */
+    if (strcmp(startstr, "exec") == 0)
+        mode = 0;
+    else if (strcmp(startstr, "eval") == 0)
+        mode = 1;
+    else if (strcmp(startstr, "single") == 0)
+        mode = 2;
+    else {
+        PyErr_SetString(PyExc_ValueError,
+                        "compile_checked() mode must be 'exec', 'eval' or "
+                        "'single'");
+        goto error;
+    }
+
+    result = Garter_CompileASTObject(tree, filename, mode, &cf, optimize);
+    Py_DECREF(filename);
+    return result;
+
+error:
+    Py_DECREF(filename);
+    return NULL;
+}
+
+/* Record, the base of Garter classes laid out with a slot for each field, see
+   compiler_class_slots in compile.c */
+
+static PyTypeObject Record_Type;
+
+static PyObject *
+record_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    _Py_IDENTIFIER(__garter_defaults__);
+    PyTypeObject *base = type;
+    PyObject *self, *defaults;
+    PyMemberDef *mp;
+    Py_ssize_t i, n;
+
+    /* The fields are those of the Garter class itself, which derives
+       directly from Record, even if it has been subclassed in Python */
+    while (base->tp_base != &Record_Type) {
+        base = base->tp_base;
+        if (base == NULL) {
+            PyErr_SetString(PyExc_TypeError,
+                            "_garter.Record can't be instantiated");
+            return NULL;
+        }
+    }
+    defaults = _PyDict_GetItemId(base->tp_dict, &PyId___garter_defaults__);
+    n = Py_SIZE(base);
+    if (defaults == NULL || !PyTuple_Check(defaults) ||
+        PyTuple_GET_SIZE(defaults) != n) {
+        PyErr_Format(PyExc_TypeError,
+                     "%.200s doesn't have a default for each slot",
+                     base->tp_name);
+        return NULL;
+    }
+
+    self = type->tp_alloc(type, 0);
+    if (self == NULL)
+        return NULL;
+    mp = PyHeapType_GET_MEMBERS((PyHeapTypeObject *)base);
+    for (i = 0; i < n; i++, mp++) {
+        PyObject *v = PyTuple_GET_ITEM(defaults, i);
+        Py_INCREF(v);
+        *(PyObject **)((char *)self + mp->offset) = v;
+    }
+    return self;
+}
+
+PyDoc_STRVAR(record_doc,
+"Base of Garter classes whose instances have a slot for each field,\n\
+initialized to the value in the declaration of the field.");
+
+static PyTypeObject Record_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_garter.Record",                   /* tp_name */
+    sizeof(PyObject),                   /* tp_basicsize */
+    0,                                  /* tp_itemsize */
+    0,                                  /* tp_dealloc */
+    0,                                  /* tp_print */
+    0,                                  /* tp_getattr */
+    0,                                  /* tp_setattr */
+    0,                                  /* tp_reserved */
+    0,                                  /* tp_repr */
+    0,                                  /* tp_as_number */
+    0,                                  /* tp_as_sequence */
+    0,                                  /* tp_as_mapping */
+    0,                                  /* tp_hash */
+    0,                                  /* tp_call */
+    0,                                  /* tp_str */
+    0,                                  /* tp_getattro */
+    0,                                  /* tp_setattro */
+    0,                                  /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE, /* tp_flags */
+    record_doc,                         /* tp_doc */
+    0,                                  /* tp_traverse */
+    0,                                  /* tp_clear */
+    0,                                  /* tp_richcompare */
+    0,                                  /* tp_weaklistoffset */
+    0,                                  /* tp_iter */
+    0,                                  /* tp_iternext */
+    0,                                  /* tp_methods */
+    0,                                  /* tp_members */
+    0,                                  /* tp_getset */
+    0,                                  /* tp_base */
+    0,                                  /* tp_dict */
+    0,                                  /* tp_descr_get */
+    0,                                  /* tp_descr_set */
+    0,                                  /* tp_dictoffset */
+    0,                                  /* tp_init */
+    0,                                  /* tp_alloc */
+    record_new,                         /* tp_new */
+};
+
+static PyMethodDef garter_methods[] = {
+    {"compile",         garter_compile,         METH_VARARGS,
+     PyDoc_STR("compile(source, filename, mode, flags=0, dont_inherit=False, "
+               "optimize=-1,\n        scope=None)\n\n"
+               "Parse, validate and compile Garter source code, emitting "
+               "opcodes\nspecialized for the types proven by validation.")},
+    {"compile_checked", garter_compile_checked, METH_VARARGS,
+     PyDoc_STR("compile_checked(tree, filename, mode, flags=0, optimize=-1)\n\n"
+               "Compile an AST which garter.check() has validated, emitting "
+               "opcodes\nspecialized for the types it has recorded.")},
+    {NULL,              NULL}           /* sentinel */
+};
+
+static struct PyModuleDef gartermodule = {
+    PyModuleDef_HEAD_INIT,
+    "_garter",
+    NULL,
+    -1,
+    garter_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+PyMODINIT_FUNC
+PyInit__garter(void)
+{
+    PyObject *m = PyModule_Create(&gartermodule);
+    if (m == NULL)
+        return NULL;
+    /* The values of the spec attributes of AST nodes, see compile.h */
+    if (PyModule_AddIntConstant(m, "SPEC_NONE", Garter_SPEC_NONE) ||
+        PyModule_AddIntConstant(m, "SPEC_INT", Garter_SPEC_INT) ||
+        PyModule_AddIntConstant(m, "SPEC_FLOAT", Garter_SPEC_FLOAT) ||
+        PyModule_AddIntConstant(m, "SPEC_LIST", Garter_SPEC_LIST) ||
+        PyModule_AddIntConstant(m, "SPEC_BOOL", Garter_SPEC_BOOL) ||
+        PyModule_AddIntConstant(m, "SPEC_BOUND", Garter_SPEC_BOUND) ||
+        PyModule_AddIntConstant(m, "SPEC_DIRECT", Garter_SPEC_DIRECT) ||
+        PyModule_AddIntConstant(m, "SPEC_SLOTS", Garter_SPEC_SLOTS)) {
+        Py_DECREF(m);
+        return NULL;
+    }
+    if (PyType_Ready(&Record_Type) < 0) {
+        Py_DECREF(m);
+        return NULL;
+    }
+    Py_INCREF(&Record_Type);
+    if (PyModule_AddObject(m, "Record", (PyObject *)&Record_Type) < 0) {
+        Py_DECREF(m);
+        return NULL;
+    }
+    /* The type of the lists of ints, floats and bools which Garter code
+       creates, see typedlistobject.h */
+    Py_INCREF(&PyTypedList_Type);
+    if (PyModule_AddObject(m, "TypedList",
+                           (PyObject *)&PyTypedList_Type) < 0) {
+        Py_DECREF(m);
+        return NULL;
+    }
+    return m;
+}
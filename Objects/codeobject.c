@@ -151,6 +151,7 @@ PyCode_New(int argcount, int kwonlyargcount,
     Py_INCREF(lnotab);
     co->co_lnotab = lnotab;
     co->co_zombieframe = NULL;
+    co->co_globalhints = NULL;
     co->co_weakreflist = NULL;
     return co;
 }
@@ -374,6 +375,8 @@ code_dealloc(PyCodeObject *co)
         PyMem_FREE(co->co_cell2arg);
     if (co->co_zombieframe != NULL)
         PyObject_GC_Del(co->co_zombieframe);
+    if (co->co_globalhints != NULL)
+        PyMem_FREE(co->co_globalhints);
     if (co->co_weakreflist != NULL)
         PyObject_ClearWeakRefs((PyObject*)co);
     PyObject_DEL(co);
@@ -387,6 +390,8 @@ code_sizeof(PyCodeObject *co, void *unused)
     res = sizeof(PyCodeObject);
     if (co->co_cell2arg != NULL && co->co_cellvars != NULL)
         res += PyTuple_GET_SIZE(co->co_cellvars) * sizeof(unsigned char);
+    if (co->co_globalhints != NULL)
+        res += PyTuple_GET_SIZE(co->co_names) * sizeof(Py_ssize_t);
     return PyLong_FromSsize_t(res);
 }
 
@@ -1200,6 +1200,45 @@ _PyDict_LoadGlobal(PyDictObject *globals, PyDictObject *builtins, PyObject *key)
     return PyDict_GetItemWithError((PyObject *)builtins, key);
 }
 
+/* Like _PyDict_LoadGlobal, but first tries the entry of the globals with the
+ * index *hint, and stores in *hint the index of the entry in which the key is
+ * found. The entry is only used if it still holds the key: the hint is
+ * invalidated by deleting the key, or by the globals being resized, and
+ * needn't be a valid index at all.
+ */
+PyObject *
+_PyDict_LoadGlobalHint(PyDictObject *globals, PyDictObject *builtins,
+                       PyObject *key, Py_ssize_t *hint)
+{
+    PyDictKeysObject *keys = globals->ma_keys;
+    Py_ssize_t i = *hint;
+    PyObject *x;
+
+    if (globals->ma_values == NULL && (size_t)i < (size_t)DK_SIZE(keys)) {
+        PyDictKeyEntry *ep = &keys->dk_entries[i];
+        if (ep->me_key == key && ep->me_value != NULL)
+            return ep->me_value;
+    }
+    if (PyUnicode_CheckExact(key)) {
+        PyObject **value_addr;
+        Py_hash_t hash = ((PyASCIIObject *)key)->hash;
+        if (hash != -1) {
+            PyDictKeyEntry *e;
+            e = keys->dk_lookup(globals, key, hash, &value_addr);
+            if (e == NULL)
+                return NULL;
+            x = *value_addr;
+            if (x != NULL) {
+                /* The lookup may have resized the globals */
+                if (globals->ma_values == NULL)
+                    *hint = e - globals->ma_keys->dk_entries;
+                return x;
+            }
+        }
+    }
+    return _PyDict_LoadGlobal(globals, builtins, key);
+}
+
 /* CAUTION: PyDict_SetItem() must guarantee that it won't resize the
  * dictionary if it's merely replacing the value for an existing key.
  * This means that it's safe to loop over a dictionary with PyDict_Next()
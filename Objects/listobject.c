@@ -474,6 +474,15 @@ list_concat(PyListObject *a, PyObject *bb)
     Py_ssize_t i;
     PyObject **src, **dest;
     PyListObject *np;
+    if (PyTypedList_CheckExact(bb)) {
+        /* Typed lists are concatenated to lists as the lists they act as */
+        PyObject *list = PySequence_List(bb);
+        if (list == NULL)
+            return NULL;
+        np = (PyListObject *)list_concat(a, list);
+        Py_DECREF(list);
+        return (PyObject *)np;
+    }
     if (!PyList_Check(bb)) {
         PyErr_Format(PyExc_TypeError,
                   "can only concatenate list (not \"%.200s\") to list",
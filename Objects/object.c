@@ -1588,6 +1588,9 @@ _Py_ReadyTypes(void)
     if (PyType_Ready(&PyList_Type) < 0)
         Py_FatalError("Can't initialize list type");
 
+    if (PyType_Ready(&PyTypedList_Type) < 0)
+        Py_FatalError("Can't initialize typed list type");
+
     if (PyType_Ready(&_PyNone_Type) < 0)
         Py_FatalError("Can't initialize None type");
 
@@ -0,0 +1,1428 @@
+/* Typed list object implementation */
+
+#include "Python.h"
+
+/* The items of a typed list are stored unboxed as long as they fit its
+ * typecode, see typedlistobject.h. The methods work on the unboxed items
+ * directly, boxing them only when they are compared with objects of another
+ * type, passed to a key function, or formatted.
+ */
+
+#define ITEMSIZE(storage) \
+    ((storage) == 'l' ? sizeof(long) : \
+     (storage) == 'd' ? sizeof(double) : \
+     (storage) == '?' ? sizeof(char) : sizeof(PyObject *))
+
+#define ITEMS(a, type) ((type *)(a)->ob_items)
+
+/* Whether v can be stored unboxed in items of type storage */
+static int
+fits(char storage, PyObject *v)
+{
+    int overflow;
+
+    switch (storage) {
+    case 'l':
+        if (!PyLong_CheckExact(v))
+            return 0;
+        (void)PyLong_AsLongAndOverflow(v, &overflow);
+        return !overflow;
+    case 'd':
+        /* NaNs are left boxed, as lists find items by identity as well as
+           equality, and a NaN is only found by its identity */
+        return PyFloat_CheckExact(v) && !Py_IS_NAN(PyFloat_AS_DOUBLE(v));
+    case '?':
+        return PyBool_Check(v);
+    }
+    return 1;
+}
+
+/* Store v, which must fit storage, at index i of the vector items, which
+   must not hold an item yet */
+static void
+store(char storage, void *items, Py_ssize_t i, PyObject *v)
+{
+    switch (storage) {
+    case 'l':
+        ((long *)items)[i] = PyLong_AsLong(v);
+        break;
+    case 'd':
+        ((double *)items)[i] = PyFloat_AS_DOUBLE(v);
+        break;
+    case '?':
+        ((char *)items)[i] = v == Py_True;
+        break;
+    default:
+        Py_INCREF(v);
+        ((PyObject **)items)[i] = v;
+    }
+}
+
+/* The item at index i of the vector items, as a new reference */
+static PyObject *
+load(char storage, void *items, Py_ssize_t i)
+{
+    PyObject *v;
+
+    switch (storage) {
+    case 'l':
+        return PyLong_FromLong(((long *)items)[i]);
+    case 'd':
+        return PyFloat_FromDouble(((double *)items)[i]);
+    case '?':
+        return PyBool_FromLong(((char *)items)[i]);
+    }
+    v = ((PyObject **)items)[i];
+    Py_INCREF(v);
+    return v;
+}
+
+/* Release a vector of n items, as typedlist_clear does */
+static void
+release(char storage, void *items, Py_ssize_t n)
+{
+    if (storage == 'O') {
+        while (--n >= 0)
+            Py_XDECREF(((PyObject **)items)[n]);
+    }
+    PyMem_FREE(items);
+}
+
+/* Ensure ob_items has room for at least newsize items, and set ob_size to
+   newsize, over-allocating as list_resize does. New items are trash, which
+   the caller must overwrite, and removed items must have been released. */
+static int
+typedlist_resize(PyTypedListObject *self, Py_ssize_t newsize)
+{
+    void *items;
+    size_t new_allocated;
+    size_t itemsize = ITEMSIZE(self->ob_storage);
+    Py_ssize_t allocated = self->allocated;
+
+    if (allocated >= newsize && newsize >= (allocated >> 1)) {
+        assert(self->ob_items != NULL || newsize == 0);
+        Py_SIZE(self) = newsize;
+        return 0;
+    }
+
+    new_allocated = (newsize >> 3) + (newsize < 9 ? 3 : 6);
+    if (new_allocated > PY_SIZE_MAX - newsize) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    new_allocated += newsize;
+    if (newsize == 0)
+        new_allocated = 0;
+    if (new_allocated > PY_SIZE_MAX / itemsize) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    items = PyMem_REALLOC(self->ob_items, new_allocated * itemsize);
+    if (items == NULL && new_allocated != 0) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    self->ob_items = items;
+    Py_SIZE(self) = newsize;
+    self->allocated = new_allocated;
+    return 0;
+}
+
+/* Box all of the items of a, if they aren't already */
+static int
+typedlist_box(PyTypedListObject *a)
+{
+    PyObject **items;
+    Py_ssize_t i, n = Py_SIZE(a);
+
+    if (a->ob_storage == 'O')
+        return 0;
+    /* allocated is -1 while a is being sorted, see typedlist_sort */
+    items = PyMem_NEW(PyObject *, a->allocated > 0 ? a->allocated : 1);
+    if (items == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    for (i = 0; i < n; i++) {
+        items[i] = load(a->ob_storage, a->ob_items, i);
+        if (items[i] == NULL) {
+            release('O', items, i);
+            return -1;
+        }
+    }
+    PyMem_FREE(a->ob_items);
+    a->ob_items = items;
+    a->ob_storage = 'O';
+    return 0;
+}
+
+/* Replace the items of a with the n objects in src, unboxed if they all fit
+   the typecode of a */
+static int
+typedlist_assign(PyTypedListObject *a, PyObject **src, Py_ssize_t n)
+{
+    char storage = a->ob_typecode, old_storage = a->ob_storage;
+    void *items, *old_items = a->ob_items;
+    Py_ssize_t i, old_size = Py_SIZE(a);
+
+    for (i = 0; i < n; i++) {
+        if (!fits(storage, src[i])) {
+            storage = 'O';
+            break;
+        }
+    }
+    if ((size_t)n > PY_SIZE_MAX / ITEMSIZE(storage)) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    items = PyMem_MALLOC(n ? n * ITEMSIZE(storage) : 1);
+    if (items == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    for (i = 0; i < n; i++)
+        store(storage, items, i, src[i]);
+
+    /* The old items are released last, as that may run arbitrary code */
+    a->ob_items = items;
+    a->ob_storage = storage;
+    Py_SIZE(a) = n;
+    a->allocated = n;
+    release(old_storage, old_items, old_size);
+    return 0;
+}
+
+static PyObject *
+typedlist_alloc(PyTypeObject *type, char typecode)
+{
+    PyTypedListObject *op;
+
+    op = (PyTypedListObject *)type->tp_alloc(type, 0);
+    if (op == NULL)
+        return NULL;
+    op->ob_typecode = op->ob_storage = typecode;
+    op->ob_items = NULL;
+    op->allocated = 0;
+    return (PyObject *)op;
+}
+
+PyObject *
+_PyTypedList_FromArray(char typecode, PyObject **items, Py_ssize_t n)
+{
+    PyObject *op = typedlist_alloc(&PyTypedList_Type, typecode);
+
+    if (op == NULL)
+        return NULL;
+    if (typedlist_assign((PyTypedListObject *)op, items, n) < 0) {
+        Py_DECREF(op);
+        return NULL;
+    }
+    return op;
+}
+
+PyObject *
+_PyTypedList_GetItem(PyObject *op, Py_ssize_t i)
+{
+    PyTypedListObject *a = (PyTypedListObject *)op;
+
+    assert(i >= 0 && i < Py_SIZE(a));
+    return load(a->ob_storage, a->ob_items, i);
+}
+
+int
+_PyTypedList_SetItem(PyObject *op, Py_ssize_t i, PyObject *v)
+{
+    PyTypedListObject *a = (PyTypedListObject *)op;
+    PyObject *old;
+
+    assert(i >= 0 && i < Py_SIZE(a));
+    if (a->ob_storage != 'O') {
+        if (fits(a->ob_storage, v)) {
+            store(a->ob_storage, a->ob_items, i, v);
+            return 0;
+        }
+        if (typedlist_box(a) < 0)
+            return -1;
+    }
+    old = ITEMS(a, PyObject *)[i];
+    Py_INCREF(v);
+    ITEMS(a, PyObject *)[i] = v;
+    Py_DECREF(old);
+    return 0;
+}
+
+/* A list of the items of a */
+static PyObject *
+typedlist_as_list(PyTypedListObject *a)
+{
+    Py_ssize_t i, n = Py_SIZE(a);
+    PyObject *list = PyList_New(n);
+
+    if (list == NULL)
+        return NULL;
+    for (i = 0; i < n; i++) {
+        PyObject *v = load(a->ob_storage, a->ob_items, i);
+        if (v == NULL) {
+            Py_DECREF(list);
+            return NULL;
+        }
+        PyList_SET_ITEM(list, i, v);
+    }
+    return list;
+}
+
+static int
+typedlist_append_item(PyTypedListObject *a, PyObject *v)
+{
+    Py_ssize_t n = Py_SIZE(a);
+
+    if (n == PY_SSIZE_T_MAX) {
+        PyErr_SetString(PyExc_OverflowError,
+                        "cannot add more objects to list");
+        return -1;
+    }
+    if (!fits(a->ob_storage, v) && typedlist_box(a) < 0)
+        return -1;
+    if (typedlist_resize(a, n + 1) < 0)
+        return -1;
+    store(a->ob_storage, a->ob_items, n, v);
+    return 0;
+}
+
+static int
+typedlist_extend_items(PyTypedListObject *a, PyObject *iterable)
+{
+    PyObject *seq;
+    Py_ssize_t i, n;
+
+    /* PySequence_Fast copies a into a list if it is extended with itself */
+    seq = PySequence_Fast(iterable, "argument must be iterable");
+    if (seq == NULL)
+        return -1;
+    n = PySequence_Fast_GET_SIZE(seq);
+    for (i = 0; i < n; i++) {
+        if (typedlist_append_item(a, PySequence_Fast_GET_ITEM(seq, i)) < 0) {
+            Py_DECREF(seq);
+            return -1;
+        }
+    }
+    Py_DECREF(seq);
+    return 0;
+}
+
+/* A new typed list of slicelength items of a, from start in steps of step */
+static PyObject *
+typedlist_slice(PyTypedListObject *a, Py_ssize_t start, Py_ssize_t step,
+                Py_ssize_t slicelength)
+{
+    PyTypedListObject *np;
+    size_t itemsize = ITEMSIZE(a->ob_storage);
+    Py_ssize_t i, cur;
+
+    np = (PyTypedListObject *)typedlist_alloc(&PyTypedList_Type,
+                                              a->ob_typecode);
+    if (np == NULL)
+        return NULL;
+    np->ob_storage = a->ob_storage;
+    if (typedlist_resize(np, slicelength) < 0) {
+        Py_DECREF(np);
+        return NULL;
+    }
+    for (cur = start, i = 0; i < slicelength; cur += step, i++) {
+        memcpy((char *)np->ob_items + i * itemsize,
+               (char *)a->ob_items + cur * itemsize, itemsize);
+        if (np->ob_storage == 'O')
+            Py_INCREF(ITEMS(np, PyObject *)[i]);
+    }
+    return (PyObject *)np;
+}
+
+static void
+typedlist_dealloc(PyTypedListObject *op)
+{
+    PyObject_GC_UnTrack(op);
+    Py_TRASHCAN_SAFE_BEGIN(op)
+    if (op->ob_items != NULL)
+        release(op->ob_storage, op->ob_items, Py_SIZE(op));
+    Py_TYPE(op)->tp_free((PyObject *)op);
+    Py_TRASHCAN_SAFE_END(op)
+}
+
+static int
+typedlist_traverse(PyTypedListObject *o, visitproc visit, void *arg)
+{
+    Py_ssize_t i;
+
+    if (o->ob_storage == 'O') {
+        for (i = Py_SIZE(o); --i >= 0; )
+            Py_VISIT(ITEMS(o, PyObject *)[i]);
+    }
+    return 0;
+}
+
+static int
+typedlist_clear(PyTypedListObject *a)
+{
+    void *items = a->ob_items;
+    char storage = a->ob_storage;
+    Py_ssize_t n = Py_SIZE(a);
+
+    /* Releasing the items may run arbitrary code, which must find the typed
+       list already emptied */
+    a->ob_items = NULL;
+    a->ob_storage = a->ob_typecode;
+    Py_SIZE(a) = 0;
+    a->allocated = 0;
+    if (items != NULL)
+        release(storage, items, n);
+    return 0;
+}
+
+static PyObject *
+typedlist_repr(PyTypedListObject *v)
+{
+    PyObject *list, *res;
+    int i;
+
+    if (Py_SIZE(v) == 0)
+        return PyUnicode_FromString("[]");
+    i = Py_ReprEnter((PyObject *)v);
+    if (i != 0)
+        return i > 0 ? PyUnicode_FromString("[...]") : NULL;
+    list = typedlist_as_list(v);
+    res = list ? PyObject_Repr(list) : NULL;
+    Py_XDECREF(list);
+    Py_ReprLeave((PyObject *)v);
+    return res;
+}
+
+static Py_ssize_t
+typedlist_length(PyTypedListObject *a)
+{
+    return Py_SIZE(a);
+}
+
+static int
+typedlist_contains(PyTypedListObject *a, PyObject *el)
+{
+    Py_ssize_t i;
+    int cmp;
+
+    /* The unboxed items can only equal objects of their own type, with
+       which they are compared directly */
+    if (a->ob_storage == 'l' && PyLong_CheckExact(el)) {
+        int overflow;
+        long x = PyLong_AsLongAndOverflow(el, &overflow);
+        if (overflow)
+            return 0;
+        for (i = 0; i < Py_SIZE(a); i++) {
+            if (ITEMS(a, long)[i] == x)
+                return 1;
+        }
+        return 0;
+    }
+    if (a->ob_storage == 'd' && PyFloat_CheckExact(el)) {
+        double x = PyFloat_AS_DOUBLE(el);
+        for (i = 0; i < Py_SIZE(a); i++) {
+            if (ITEMS(a, double)[i] == x)
+                return 1;
+        }
+        return 0;
+    }
+
+    for (i = 0, cmp = 0; cmp == 0 && i < Py_SIZE(a); ++i) {
+        PyObject *v = load(a->ob_storage, a->ob_items, i);
+        if (v == NULL)
+            return -1;
+        cmp = PyObject_RichCompareBool(el, v, Py_EQ);
+        Py_DECREF(v);
+    }
+    return cmp;
+}
+
+static PyObject *
+typedlist_item(PyTypedListObject *a, Py_ssize_t i)
+{
+    if (i < 0 || i >= Py_SIZE(a)) {
+        PyErr_SetString(PyExc_IndexError, "list index out of range");
+        return NULL;
+    }
+    return load(a->ob_storage, a->ob_items, i);
+}
+
+static PyObject *
+typedlist_concat(PyTypedListObject *a, PyObject *bb)
+{
+    PyObject *np;
+
+    if (!PyList_Check(bb) && !PyTypedList_CheckExact(bb)) {
+        PyErr_Format(PyExc_TypeError,
+                  "can only concatenate list (not \"%.200s\") to list",
+                  bb->ob_type->tp_name);
+        return NULL;
+    }
+    np = typedlist_slice(a, 0, 1, Py_SIZE(a));
+    if (np == NULL)
+        return NULL;
+    if (typedlist_extend_items((PyTypedListObject *)np, bb) < 0) {
+        Py_DECREF(np);
+        return NULL;
+    }
+    return np;
+}
+
+/* Repeat the first size items of a until there are n copies of them, which
+   there must be room for */
+static void
+typedlist_fill(PyTypedListObject *a, Py_ssize_t size, Py_ssize_t n)
+{
+    size_t itemsize = ITEMSIZE(a->ob_storage);
+    Py_ssize_t i, j;
+
+    for (i = 1; i < n; i++) {
+        memcpy((char *)a->ob_items + i * size * itemsize, a->ob_items,
+               size * itemsize);
+        if (a->ob_storage == 'O') {
+            for (j = 0; j < size; j++)
+                Py_INCREF(ITEMS(a, PyObject *)[j]);
+        }
+    }
+}
+
+static PyObject *
+typedlist_repeat(PyTypedListObject *a, Py_ssize_t n)
+{
+    PyTypedListObject *np;
+    Py_ssize_t size = Py_SIZE(a);
+
+    if (n < 0)
+        n = 0;
+    if (n > 0 && size > PY_SSIZE_T_MAX / n)
+        return PyErr_NoMemory();
+    np = (PyTypedListObject *)typedlist_slice(a, 0, 1, size);
+    if (np == NULL)
+        return NULL;
+    if (n == 0) {
+        typedlist_clear(np);
+        return (PyObject *)np;
+    }
+    if (typedlist_resize(np, size * n) < 0) {
+        Py_DECREF(np);
+        return NULL;
+    }
+    typedlist_fill(np, size, n);
+    return (PyObject *)np;
+}
+
+static int
+typedlist_ass_item(PyTypedListObject *a, Py_ssize_t i, PyObject *v)
+{
+    size_t itemsize = ITEMSIZE(a->ob_storage);
+    PyObject *old = NULL;
+
+    if (i < 0 || i >= Py_SIZE(a)) {
+        PyErr_SetString(PyExc_IndexError,
+                        "list assignment index out of range");
+        return -1;
+    }
+    if (v != NULL)
+        return _PyTypedList_SetItem((PyObject *)a, i, v);
+    if (a->ob_storage == 'O')
+        old = ITEMS(a, PyObject *)[i];
+    memmove((char *)a->ob_items + i * itemsize,
+            (char *)a->ob_items + (i + 1) * itemsize,
+            (Py_SIZE(a) - i - 1) * itemsize);
+    typedlist_resize(a, Py_SIZE(a) - 1); /* Can't fail when shrinking */
+    Py_XDECREF(old);
+    return 0;
+}
+
+static PyObject *
+typedlist_inplace_concat(PyTypedListObject *self, PyObject *other)
+{
+    if (typedlist_extend_items(self, other) < 0)
+        return NULL;
+    Py_INCREF(self);
+    return (PyObject *)self;
+}
+
+static PyObject *
+typedlist_inplace_repeat(PyTypedListObject *self, Py_ssize_t n)
+{
+    Py_ssize_t size = Py_SIZE(self);
+
+    if (size == 0 || n == 1) {
+        Py_INCREF(self);
+        return (PyObject *)self;
+    }
+    if (n < 1) {
+        typedlist_clear(self);
+        Py_INCREF(self);
+        return (PyObject *)self;
+    }
+    if (size > PY_SSIZE_T_MAX / n)
+        return PyErr_NoMemory();
+    if (typedlist_resize(self, size * n) < 0)
+        return NULL;
+    typedlist_fill(self, size, n);
+    Py_INCREF(self);
+    return (PyObject *)self;
+}
+
+static PyObject *
+typedlist_append(PyTypedListObject *self, PyObject *v)
+{
+    if (typedlist_append_item(self, v) < 0)
+        return NULL;
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+typedlist_extend(PyTypedListObject *self, PyObject *iterable)
+{
+    if (typedlist_extend_items(self, iterable) < 0)
+        return NULL;
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+typedlist_insert(PyTypedListObject *self, PyObject *args)
+{
+    Py_ssize_t i, n = Py_SIZE(self);
+    size_t itemsize;
+    PyObject *v;
+
+    if (!PyArg_ParseTuple(args, "nO:insert", &i, &v))
+        return NULL;
+    if (!fits(self->ob_storage, v) && typedlist_box(self) < 0)
+        return NULL;
+    if (typedlist_resize(self, n + 1) < 0)
+        return NULL;
+    if (i < 0) {
+        i += n;
+        if (i < 0)
+            i = 0;
+    }
+    if (i > n)
+        i = n;
+    itemsize = ITEMSIZE(self->ob_storage);
+    memmove((char *)self->ob_items + (i + 1) * itemsize,
+            (char *)self->ob_items + i * itemsize, (n - i) * itemsize);
+    store(self->ob_storage, self->ob_items, i, v);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+typedlist_pop(PyTypedListObject *self, PyObject *args)
+{
+    Py_ssize_t i = -1;
+    PyObject *v;
+
+    if (!PyArg_ParseTuple(args, "|n:pop", &i))
+        return NULL;
+    if (Py_SIZE(self) == 0) {
+        PyErr_SetString(PyExc_IndexError, "pop from empty list");
+        return NULL;
+    }
+    if (i < 0)
+        i += Py_SIZE(self);
+    if (i < 0 || i >= Py_SIZE(self)) {
+        PyErr_SetString(PyExc_IndexError, "pop index out of range");
+        return NULL;
+    }
+    v = load(self->ob_storage, self->ob_items, i);
+    if (v == NULL)
+        return NULL;
+    typedlist_ass_item(self, i, NULL);
+    return v;
+}
+
+/* Find the items of a from start up to stop which equal v, comparing them
+   as list.index does. Returns the index of the first of them, or -1 if there
+   is none, unless count isn't NULL, in which case all of them are found, and
+   the number of them is stored in count. Returns -2 on error. */
+static Py_ssize_t
+typedlist_find(PyTypedListObject *a, PyObject *v, Py_ssize_t start,
+               Py_ssize_t stop, Py_ssize_t *count)
+{
+    Py_ssize_t i, n = 0;
+    int cmp;
+
+#define FIND_UNBOXED(type, x) \
+    for (i = start; i < stop && i < Py_SIZE(a); i++) { \
+        if (ITEMS(a, type)[i] == (x)) { \
+            if (count == NULL) \
+                return i; \
+            n++; \
+        } \
+    }
+
+    /* The unboxed items are compared directly with objects of their own
+       type, which runs no Python code. Those don't include NaNs, which are
+       only equal to themselves by identity, see fits(). */
+    if (a->ob_storage == 'l' && PyLong_CheckExact(v)) {
+        int overflow;
+        long x = PyLong_AsLongAndOverflow(v, &overflow);
+        if (!overflow)
+            FIND_UNBOXED(long, x)
+    }
+    else if (a->ob_storage == 'd' && PyFloat_CheckExact(v)) {
+        double x = PyFloat_AS_DOUBLE(v);
+        FIND_UNBOXED(double, x)
+    }
+    else if (a->ob_storage == '?' && PyBool_Check(v)) {
+        char x = v == Py_True;
+        FIND_UNBOXED(char, x)
+    }
+    else {
+        /* The comparisons may modify a, so its size and storage are
+           checked for each item */
+        for (i = start; i < stop && i < Py_SIZE(a); i++) {
+            PyObject *item = load(a->ob_storage, a->ob_items, i);
+            if (item == NULL)
+                return -2;
+            cmp = PyObject_RichCompareBool(item, v, Py_EQ);
+            Py_DECREF(item);
+            if (cmp < 0)
+                return -2;
+            if (cmp > 0) {
+                if (count == NULL)
+                    return i;
+                n++;
+            }
+        }
+    }
+#undef FIND_UNBOXED
+
+    if (count != NULL)
+        *count = n;
+    return -1;
+}
+
+static PyObject *
+typedlist_remove(PyTypedListObject *self, PyObject *v)
+{
+    Py_ssize_t i = typedlist_find(self, v, 0, PY_SSIZE_T_MAX, NULL);
+
+    if (i == -2)
+        return NULL;
+    if (i == -1) {
+        PyErr_SetString(PyExc_ValueError, "list.remove(x): x not in list");
+        return NULL;
+    }
+    if (typedlist_ass_item(self, i, NULL) < 0)
+        return NULL;
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+typedlist_index(PyTypedListObject *self, PyObject *args)
+{
+    Py_ssize_t i, start = 0, stop = Py_SIZE(self);
+    PyObject *v;
+
+    if (!PyArg_ParseTuple(args, "O|O&O&:index", &v,
+                                _PyEval_SliceIndex, &start,
+                                _PyEval_SliceIndex, &stop))
+        return NULL;
+    if (start < 0) {
+        start += Py_SIZE(self);
+        if (start < 0)
+            start = 0;
+    }
+    if (stop < 0) {
+        stop += Py_SIZE(self);
+        if (stop < 0)
+            stop = 0;
+    }
+    i = typedlist_find(self, v, start, stop, NULL);
+    if (i == -2)
+        return NULL;
+    if (i == -1) {
+        PyErr_Format(PyExc_ValueError, "%R is not in list", v);
+        return NULL;
+    }
+    return PyLong_FromSsize_t(i);
+}
+
+static PyObject *
+typedlist_count(PyTypedListObject *self, PyObject *v)
+{
+    Py_ssize_t count;
+
+    if (typedlist_find(self, v, 0, PY_SSIZE_T_MAX, &count) == -2)
+        return NULL;
+    return PyLong_FromSsize_t(count);
+}
+
+static void
+reverse_items(PyTypedListObject *a)
+{
+    size_t itemsize = ITEMSIZE(a->ob_storage);
+    char tmp[sizeof(double) > sizeof(void *) ? sizeof(double) :
+                                               sizeof(void *)];
+    char *lo, *hi;
+
+    if (Py_SIZE(a) < 2)
+        return;
+    lo = (char *)a->ob_items;
+    hi = lo + (Py_SIZE(a) - 1) * itemsize;
+    for (; lo < hi; lo += itemsize, hi -= itemsize) {
+        memcpy(tmp, lo, itemsize);
+        memcpy(lo, hi, itemsize);
+        memcpy(hi, tmp, itemsize);
+    }
+}
+
+static PyObject *
+typedlist_reverse(PyTypedListObject *self)
+{
+    reverse_items(self);
+    Py_RETURN_NONE;
+}
+
+static int
+compare_longs(const void *a, const void *b)
+{
+    long x = *(const long *)a, y = *(const long *)b;
+    return (x > y) - (x < y);
+}
+
+static int
+compare_chars(const void *a, const void *b)
+{
+    return *(const char *)a - *(const char *)b;
+}
+
+/* A float and its index, by which equal floats are ordered, such that they
+   are sorted stably, as 0.0 and -0.0 are equal but can be told apart */
+typedef struct {
+    double value;
+    Py_ssize_t index;
+} indexed_double;
+
+static int
+compare_indexed_doubles(const void *a, const void *b)
+{
+    const indexed_double *x = (const indexed_double *)a;
+    const indexed_double *y = (const indexed_double *)b;
+
+    if (x->value != y->value)
+        return x->value < y->value ? -1 : 1;
+    return (x->index > y->index) - (x->index < y->index);
+}
+
+/* Sort the unboxed items of a stably, which runs no Python code */
+static int
+typedlist_sort_unboxed(PyTypedListObject *a, int reverse)
+{
+    Py_ssize_t i, n = Py_SIZE(a);
+    indexed_double *pairs = NULL;
+
+    if (a->ob_storage == 'd') {
+        pairs = PyMem_NEW(indexed_double, n ? n : 1);
+        if (pairs == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+    }
+    /* Reversed before and after sorting, as list.sort does, such that equal
+       items keep their order */
+    if (reverse)
+        reverse_items(a);
+    switch (a->ob_storage) {
+    case 'l':
+        qsort(a->ob_items, n, sizeof(long), compare_longs);
+        break;
+    case '?':
+        qsort(a->ob_items, n, sizeof(char), compare_chars);
+        break;
+    case 'd':
+        for (i = 0; i < n; i++) {
+            pairs[i].value = ITEMS(a, double)[i];
+            pairs[i].index = i;
+        }
+        qsort(pairs, n, sizeof(indexed_double), compare_indexed_doubles);
+        for (i = 0; i < n; i++)
+            ITEMS(a, double)[i] = pairs[i].value;
+        PyMem_FREE(pairs);
+        break;
+    }
+    if (reverse)
+        reverse_items(a);
+    return 0;
+}
+
+static PyObject *
+typedlist_sort(PyTypedListObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"key", "reverse", 0};
+    PyObject *keyfunc = NULL, *list, *method, *res;
+    void *saved_items, *final_items;
+    char saved_storage, final_storage;
+    Py_ssize_t saved_size, saved_allocated, final_size;
+    int reverse = 0;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|Oi:sort",
+                                     kwlist, &keyfunc, &reverse))
+        return NULL;
+    if (Py_SIZE(args) > 0) {
+        PyErr_SetString(PyExc_TypeError,
+                        "must use keyword argument for key function");
+        return NULL;
+    }
+    if (keyfunc == Py_None)
+        keyfunc = NULL;
+    if (keyfunc == NULL && self->ob_storage != 'O') {
+        if (typedlist_sort_unboxed(self, reverse) < 0)
+            return NULL;
+        Py_RETURN_NONE;
+    }
+
+    /* The boxed items are sorted as a list, while self is emptied, as
+       listsort empties a list, such that the comparisons and the key
+       function can't affect the items being sorted, and any operation on
+       self resets allocated, so that its modification is detected */
+    list = typedlist_as_list(self);
+    if (list == NULL)
+        return NULL;
+    saved_items = self->ob_items;
+    saved_storage = self->ob_storage;
+    saved_size = Py_SIZE(self);
+    saved_allocated = self->allocated;
+    self->ob_items = NULL;
+    self->ob_storage = self->ob_typecode;
+    Py_SIZE(self) = 0;
+    self->allocated = -1;
+
+    method = PyObject_GetAttrString(list, "sort");
+    res = method ? PyObject_Call(method, args, kwds) : NULL;
+    Py_XDECREF(method);
+    if (self->allocated != -1 && res != NULL) {
+        PyErr_SetString(PyExc_ValueError, "list modified during sort");
+        Py_CLEAR(res);
+    }
+
+    /* The items stored in self during the sort are released last, as that
+       may run arbitrary code, and the sorted items replace the saved ones,
+       unless storing them fails, in which case self is left unsorted */
+    final_items = self->ob_items;
+    final_storage = self->ob_storage;
+    final_size = Py_SIZE(self);
+    self->ob_items = saved_items;
+    self->ob_storage = saved_storage;
+    Py_SIZE(self) = saved_size;
+    self->allocated = saved_allocated;
+    if (typedlist_assign(self, ((PyListObject *)list)->ob_item,
+                         PyList_GET_SIZE(list)) < 0)
+        Py_CLEAR(res);
+    Py_DECREF(list);
+    if (final_items != NULL)
+        release(final_storage, final_items, final_size);
+    return res;
+}
+
+static PyObject *
+typedlist_clear_method(PyTypedListObject *self)
+{
+    typedlist_clear(self);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+typedlist_copy(PyTypedListObject *self)
+{
+    return typedlist_slice(self, 0, 1, Py_SIZE(self));
+}
+
+static PyObject *
+typedlist_reduce(PyTypedListObject *self)
+{
+    PyObject *list = typedlist_as_list(self);
+
+    if (list == NULL)
+        return NULL;
+    return Py_BuildValue("O(CN)", Py_TYPE(self), self->ob_typecode, list);
+}
+
+static PyObject *
+typedlist_sizeof(PyTypedListObject *self)
+{
+    Py_ssize_t res;
+
+    res = _PyObject_SIZE(Py_TYPE(self)) +
+        self->allocated * ITEMSIZE(self->ob_storage);
+    return PyLong_FromSsize_t(res);
+}
+
+static PyObject *
+typedlist_richcompare(PyObject *v, PyObject *w, int op)
+{
+    PyTypedListObject *a = (PyTypedListObject *)v, *b = (PyTypedListObject *)w;
+    PyObject *vl, *wl, *res;
+
+    if (!(PyList_Check(v) || PyTypedList_CheckExact(v)) ||
+        !(PyList_Check(w) || PyTypedList_CheckExact(w)))
+        Py_RETURN_NOTIMPLEMENTED;
+
+    /* Typed lists of unboxed ints or bools are equal if their items are */
+    if ((op == Py_EQ || op == Py_NE) &&
+        PyTypedList_CheckExact(v) && PyTypedList_CheckExact(w) &&
+        a->ob_storage == b->ob_storage &&
+        (a->ob_storage == 'l' || a->ob_storage == '?')) {
+        int eq = Py_SIZE(a) == Py_SIZE(b) &&
+            memcmp(a->ob_items, b->ob_items,
+                   Py_SIZE(a) * ITEMSIZE(a->ob_storage)) == 0;
+        if (eq == (op == Py_EQ))
+            Py_RETURN_TRUE;
+        Py_RETURN_FALSE;
+    }
+
+    vl = PyTypedList_CheckExact(v) ? typedlist_as_list(a) : (Py_INCREF(v), v);
+    if (vl == NULL)
+        return NULL;
+    wl = PyTypedList_CheckExact(w) ? typedlist_as_list(b) : (Py_INCREF(w), w);
+    if (wl == NULL) {
+        Py_DECREF(vl);
+        return NULL;
+    }
+    res = PyObject_RichCompare(vl, wl, op);
+    Py_DECREF(vl);
+    Py_DECREF(wl);
+    return res;
+}
+
+static PyObject *
+typedlist_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    PyObject *op, *iterable = NULL;
+    int c;
+
+    if (!_PyArg_NoKeywords("TypedList()", kwds))
+        return NULL;
+    if (!PyArg_ParseTuple(args, "C|O:TypedList", &c, &iterable))
+        return NULL;
+    if (c != 'l' && c != 'd' && c != '?') {
+        PyErr_SetString(PyExc_ValueError,
+                        "typecode must be one of 'l', 'd' or '?'");
+        return NULL;
+    }
+    op = typedlist_alloc(type, (char)c);
+    if (op == NULL)
+        return NULL;
+    if (iterable != NULL &&
+        typedlist_extend_items((PyTypedListObject *)op, iterable) < 0) {
+        Py_DECREF(op);
+        return NULL;
+    }
+    return op;
+}
+
+static PyObject *
+typedlist_get_typecode(PyTypedListObject *self, void *closure)
+{
+    return PyUnicode_FromOrdinal(self->ob_typecode);
+}
+
+static PyObject *
+typedlist_subscript(PyTypedListObject *self, PyObject *item)
+{
+    if (PyIndex_Check(item)) {
+        Py_ssize_t i = PyNumber_AsSsize_t(item, PyExc_IndexError);
+        if (i == -1 && PyErr_Occurred())
+            return NULL;
+        if (i < 0)
+            i += Py_SIZE(self);
+        return typedlist_item(self, i);
+    }
+    else if (PySlice_Check(item)) {
+        Py_ssize_t start, stop, step, slicelength;
+        if (PySlice_GetIndicesEx(item, Py_SIZE(self),
+                                 &start, &stop, &step, &slicelength) < 0)
+            return NULL;
+        return typedlist_slice(self, start, step, slicelength);
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "list indices must be integers or slices, not %.200s",
+                 item->ob_type->tp_name);
+    return NULL;
+}
+
+/* Delete the slicelength items of a from start in steps of step */
+static int
+typedlist_del_slice(PyTypedListObject *a, Py_ssize_t start, Py_ssize_t step,
+                    Py_ssize_t slicelength)
+{
+    size_t itemsize = ITEMSIZE(a->ob_storage);
+    PyObject **garbage = NULL;
+    Py_ssize_t i, j, k, n = Py_SIZE(a);
+
+    if (slicelength <= 0)
+        return 0;
+    if (step < 0) {
+        start += step * (slicelength - 1);
+        step = -step;
+    }
+    if (a->ob_storage == 'O') {
+        garbage = PyMem_NEW(PyObject *, slicelength);
+        if (garbage == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+    }
+    /* The items which are kept are moved down over the deleted ones */
+    for (i = j = start, k = 0; i < n; i++) {
+        if (k < slicelength && i == start + k * step) {
+            if (garbage != NULL)
+                garbage[k] = ITEMS(a, PyObject *)[i];
+            k++;
+            continue;
+        }
+        memcpy((char *)a->ob_items + j * itemsize,
+               (char *)a->ob_items + i * itemsize, itemsize);
+        j++;
+    }
+    typedlist_resize(a, n - slicelength); /* Can't fail when shrinking */
+
+    /* The deleted items are released last, as that may run arbitrary code */
+    if (garbage != NULL) {
+        for (k = 0; k < slicelength; k++)
+            Py_DECREF(garbage[k]);
+        PyMem_FREE(garbage);
+    }
+    return 0;
+}
+
+/* Replace the slicelength items of a from start in steps of step with the
+   items of seq, a list or tuple, whose length must match unless step is 1 */
+static int
+typedlist_set_slice(PyTypedListObject *a, Py_ssize_t start, Py_ssize_t step,
+                    Py_ssize_t slicelength, PyObject *seq)
+{
+    PyObject **src = PySequence_Fast_ITEMS(seq), **garbage = NULL;
+    Py_ssize_t i, cur, n = Py_SIZE(a), m = PySequence_Fast_GET_SIZE(seq);
+    size_t itemsize;
+
+    if (slicelength < 0)
+        slicelength = 0;
+    if (step != 1 && m != slicelength) {
+        PyErr_Format(PyExc_ValueError,
+            "attempt to assign sequence of size %zd "
+            "to extended slice of size %zd", m, slicelength);
+        return -1;
+    }
+    for (i = 0; i < m; i++) {
+        if (!fits(a->ob_storage, src[i])) {
+            if (typedlist_box(a) < 0)
+                return -1;
+            break;
+        }
+    }
+    itemsize = ITEMSIZE(a->ob_storage);
+    if (a->ob_storage == 'O' && slicelength > 0) {
+        garbage = PyMem_NEW(PyObject *, slicelength);
+        if (garbage == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        for (i = 0, cur = start; i < slicelength; i++, cur += step)
+            garbage[i] = ITEMS(a, PyObject *)[cur];
+    }
+    if (step == 1 && m != slicelength) {
+        /* The items after the slice are moved to follow the new ones */
+        if (m > slicelength && typedlist_resize(a, n + m - slicelength) < 0) {
+            PyMem_FREE(garbage);
+            return -1;
+        }
+        memmove((char *)a->ob_items + (start + m) * itemsize,
+                (char *)a->ob_items + (start + slicelength) * itemsize,
+                (n - start - slicelength) * itemsize);
+        if (m < slicelength)
+            typedlist_resize(a, n + m - slicelength); /* Can't fail */
+    }
+    for (i = 0, cur = start; i < m; i++, cur += step)
+        store(a->ob_storage, a->ob_items, cur, src[i]);
+
+    /* The replaced items are released last, as that may run arbitrary code */
+    if (garbage != NULL) {
+        for (i = 0; i < slicelength; i++)
+            Py_DECREF(garbage[i]);
+        PyMem_FREE(garbage);
+    }
+    return 0;
+}
+
+static int
+typedlist_ass_subscript(PyTypedListObject *self, PyObject *item,
+                        PyObject *value)
+{
+    PyObject *seq = NULL;
+    Py_ssize_t start, stop, step, slicelength;
+    int res;
+
+    if (PyIndex_Check(item)) {
+        Py_ssize_t i = PyNumber_AsSsize_t(item, PyExc_IndexError);
+        if (i == -1 && PyErr_Occurred())
+            return -1;
+        if (i < 0)
+            i += Py_SIZE(self);
+        return typedlist_ass_item(self, i, value);
+    }
+    if (!PySlice_Check(item)) {
+        PyErr_Format(PyExc_TypeError,
+                     "list indices must be integers or slices, not %.200s",
+                     item->ob_type->tp_name);
+        return -1;
+    }
+    /* The items assigned are got first, as iterating value may modify self,
+       which the indices of the slice are then computed for */
+    if (value != NULL) {
+        seq = PySequence_Fast(value, "can only assign an iterable");
+        if (seq == NULL)
+            return -1;
+    }
+    if (PySlice_GetIndicesEx(item, Py_SIZE(self),
+                             &start, &stop, &step, &slicelength) < 0) {
+        Py_XDECREF(seq);
+        return -1;
+    }
+    if (seq == NULL)
+        return typedlist_del_slice(self, start, step, slicelength);
+    res = typedlist_set_slice(self, start, step, slicelength, seq);
+    Py_DECREF(seq);
+    return res;
+}
+
+static PyObject *typedlist_iter(PyObject *seq);
+
+PyDoc_STRVAR(append_doc,
+"L.append(object) -> None -- append object to end");
+PyDoc_STRVAR(extend_doc,
+"L.extend(iterable) -> None -- extend list by appending elements from the\n"
+"iterable");
+PyDoc_STRVAR(insert_doc,
+"L.insert(index, object) -- insert object before index");
+PyDoc_STRVAR(pop_doc,
+"L.pop([index]) -> item -- remove and return item at index (default last).\n"
+"Raises IndexError if list is empty or index is out of range.");
+PyDoc_STRVAR(remove_doc,
+"L.remove(value) -> None -- remove first occurrence of value.\n"
+"Raises ValueError if the value is not present.");
+PyDoc_STRVAR(index_doc,
+"L.index(value, [start, [stop]]) -> integer -- return first index of value.\n"
+"Raises ValueError if the value is not present.");
+PyDoc_STRVAR(count_doc,
+"L.count(value) -> integer -- return number of occurrences of value");
+PyDoc_STRVAR(reverse_doc,
+"L.reverse() -- reverse *IN PLACE*");
+PyDoc_STRVAR(sort_doc,
+"L.sort(key=None, reverse=False) -> None -- stable sort *IN PLACE*");
+PyDoc_STRVAR(clear_doc,
+"L.clear() -> None -- remove all items from L");
+PyDoc_STRVAR(copy_doc,
+"L.copy() -> list -- a shallow copy of L");
+PyDoc_STRVAR(reduce_doc,
+"Return state information for pickling.");
+PyDoc_STRVAR(sizeof_doc,
+"L.__sizeof__() -- size of L in memory, in bytes");
+
+static PyMethodDef typedlist_methods[] = {
+    {"append",      (PyCFunction)typedlist_append,  METH_O, append_doc},
+    {"extend",      (PyCFunction)typedlist_extend,  METH_O, extend_doc},
+    {"insert",      (PyCFunction)typedlist_insert,  METH_VARARGS, insert_doc},
+    {"pop",         (PyCFunction)typedlist_pop,     METH_VARARGS, pop_doc},
+    {"remove",      (PyCFunction)typedlist_remove,  METH_O, remove_doc},
+    {"index",       (PyCFunction)typedlist_index,   METH_VARARGS, index_doc},
+    {"count",       (PyCFunction)typedlist_count,   METH_O, count_doc},
+    {"reverse",     (PyCFunction)typedlist_reverse, METH_NOARGS, reverse_doc},
+    {"sort",        (PyCFunction)typedlist_sort,
+     METH_VARARGS | METH_KEYWORDS, sort_doc},
+    {"clear",       (PyCFunction)typedlist_clear_method,
+     METH_NOARGS, clear_doc},
+    {"copy",        (PyCFunction)typedlist_copy,    METH_NOARGS, copy_doc},
+    {"__reduce__",  (PyCFunction)typedlist_reduce,  METH_NOARGS, reduce_doc},
+    {"__sizeof__",  (PyCFunction)typedlist_sizeof,  METH_NOARGS, sizeof_doc},
+    {NULL,              NULL}           /* sentinel */
+};
+
+static PyGetSetDef typedlist_getsets[] = {
+    {"typecode", (getter)typedlist_get_typecode, NULL,
+     "the typecode of the items: 'l', 'd' or '?'"},
+    {NULL}
+};
+
+static PySequenceMethods typedlist_as_sequence = {
+    (lenfunc)typedlist_length,                  /* sq_length */
+    (binaryfunc)typedlist_concat,               /* sq_concat */
+    (ssizeargfunc)typedlist_repeat,             /* sq_repeat */
+    (ssizeargfunc)typedlist_item,               /* sq_item */
+    0,                                          /* sq_slice */
+    (ssizeobjargproc)typedlist_ass_item,        /* sq_ass_item */
+    0,                                          /* sq_ass_slice */
+    (objobjproc)typedlist_contains,             /* sq_contains */
+    (binaryfunc)typedlist_inplace_concat,       /* sq_inplace_concat */
+    (ssizeargfunc)typedlist_inplace_repeat,     /* sq_inplace_repeat */
+};
+
+static PyMappingMethods typedlist_as_mapping = {
+    (lenfunc)typedlist_length,
+    (binaryfunc)typedlist_subscript,
+    (objobjargproc)typedlist_ass_subscript
+};
+
+PyDoc_STRVAR(typedlist_doc,
+"TypedList(typecode, iterable=()) -> new typed list\n\
+\n\
+A list whose items are ints, floats or bools, as given by the typecode\n\
+'l', 'd' or '?', and are stored unboxed while they fit it. Any object may\n\
+be stored, however, and a typed list supports the operations and methods\n\
+of a list, but isn't one.");
+
+PyTypeObject PyTypedList_Type = {
+    PyVarObject_HEAD_INIT(&PyType_Type, 0)
+    "_garter.TypedList",
+    sizeof(PyTypedListObject),
+    0,
+    (destructor)typedlist_dealloc,              /* tp_dealloc */
+    0,                                          /* tp_print */
+    0,                                          /* tp_getattr */
+    0,                                          /* tp_setattr */
+    0,                                          /* tp_reserved */
+    (reprfunc)typedlist_repr,                   /* tp_repr */
+    0,                                          /* tp_as_number */
+    &typedlist_as_sequence,                     /* tp_as_sequence */
+    &typedlist_as_mapping,                      /* tp_as_mapping */
+    PyObject_HashNotImplemented,                /* tp_hash */
+    0,                                          /* tp_call */
+    0,                                          /* tp_str */
+    PyObject_GenericGetAttr,                    /* tp_getattro */
+    0,                                          /* tp_setattro */
+    0,                                          /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,    /* tp_flags */
+    typedlist_doc,                              /* tp_doc */
+    (traverseproc)typedlist_traverse,           /* tp_traverse */
+    (inquiry)typedlist_clear,                   /* tp_clear */
+    typedlist_richcompare,                      /* tp_richcompare */
+    0,                                          /* tp_weaklistoffset */
+    typedlist_iter,                             /* tp_iter */
+    0,                                          /* tp_iternext */
+    typedlist_methods,                          /* tp_methods */
+    0,                                          /* tp_members */
+    typedlist_getsets,                          /* tp_getset */
+    0,                                          /* tp_base */
+    0,                                          /* tp_dict */
+    0,                                          /* tp_descr_get */
+    0,                                          /* tp_descr_set */
+    0,                                          /* tp_dictoffset */
+    0,                                          /* tp_init */
+    PyType_GenericAlloc,                        /* tp_alloc */
+    typedlist_new,                              /* tp_new */
+    PyObject_GC_Del,                            /* tp_free */
+};
+
+
+/*********************** Typed List Iterator **************************/
+
+typedef struct {
+    PyObject_HEAD
+    Py_ssize_t it_index;
+    PyTypedListObject *it_seq; /* Set to NULL when iterator is exhausted */
+} typedlistiterobject;
+
+static void
+typedlistiter_dealloc(typedlistiterobject *it)
+{
+    _PyObject_GC_UNTRACK(it);
+    Py_XDECREF(it->it_seq);
+    PyObject_GC_Del(it);
+}
+
+static int
+typedlistiter_traverse(typedlistiterobject *it, visitproc visit, void *arg)
+{
+    Py_VISIT(it->it_seq);
+    return 0;
+}
+
+static PyObject *
+typedlistiter_next(typedlistiterobject *it)
+{
+    PyTypedListObject *seq = it->it_seq;
+
+    if (seq == NULL)
+        return NULL;
+    if (it->it_index < Py_SIZE(seq))
+        return load(seq->ob_storage, seq->ob_items, it->it_index++);
+    it->it_seq = NULL;
+    Py_DECREF(seq);
+    return NULL;
+}
+
+static PyObject *
+typedlistiter_len(typedlistiterobject *it)
+{
+    Py_ssize_t len;
+
+    if (it->it_seq) {
+        len = Py_SIZE(it->it_seq) - it->it_index;
+        if (len >= 0)
+            return PyLong_FromSsize_t(len);
+    }
+    return PyLong_FromLong(0);
+}
+
+PyDoc_STRVAR(length_hint_doc,
+"Private method returning an estimate of len(list(it)).");
+
+static PyMethodDef typedlistiter_methods[] = {
+    {"__length_hint__", (PyCFunction)typedlistiter_len, METH_NOARGS,
+     length_hint_doc},
+    {NULL,              NULL}           /* sentinel */
+};
+
+PyTypeObject PyTypedListIter_Type = {
+    PyVarObject_HEAD_INIT(&PyType_Type, 0)
+    "typedlist_iterator",                       /* tp_name */
+    sizeof(typedlistiterobject),                /* tp_basicsize */
+    0,                                          /* tp_itemsize */
+    (destructor)typedlistiter_dealloc,          /* tp_dealloc */
+    0,                                          /* tp_print */
+    0,                                          /* tp_getattr */
+    0,                                          /* tp_setattr */
+    0,                                          /* tp_reserved */
+    0,                                          /* tp_repr */
+    0,                                          /* tp_as_number */
+    0,                                          /* tp_as_sequence */
+    0,                                          /* tp_as_mapping */
+    0,                                          /* tp_hash */
+    0,                                          /* tp_call */
+    0,                                          /* tp_str */
+    PyObject_GenericGetAttr,                    /* tp_getattro */
+    0,                                          /* tp_setattro */
+    0,                                          /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,    /* tp_flags */
+    0,                                          /* tp_doc */
+    (traverseproc)typedlistiter_traverse,       /* tp_traverse */
+    0,                                          /* tp_clear */
+    0,                                          /* tp_richcompare */
+    0,                                          /* tp_weaklistoffset */
+    PyObject_SelfIter,                          /* tp_iter */
+    (iternextfunc)typedlistiter_next,           /* tp_iternext */
+    typedlistiter_methods,                      /* tp_methods */
+    0,                                          /* tp_members */
+};
+
+static PyObject *
+typedlist_iter(PyObject *seq)
+{
+    typedlistiterobject *it;
+
+    it = PyObject_GC_New(typedlistiterobject, &PyTypedListIter_Type);
+    if (it == NULL)
+        return NULL;
+    it->it_index = 0;
+    Py_INCREF(seq);
+    it->it_seq = (PyTypedListObject *)seq;
+    _PyObject_GC_TRACK(it);
+    return (PyObject *)it;
+}
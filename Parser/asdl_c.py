@@ -433,6 +433,7 @@ class Obj2ModVisitor(PickleVisitor):
             args = [f.name for f in t.fields] + [a.name for a in sum.attributes]
             self.emit("*out = %s(%s);" % (t.name, self.buildArgs(args)), 2)
             self.emit("if (*out == NULL) goto failed;", 2)
+            self.emit("if (record_node(obj, *out) < 0) goto failed;", 2)
             self.emit("return 0;", 2)
             self.emit("}", 1)
         self.sumTrailer(name, True)
@@ -1100,6 +1101,8 @@ class ObjVisitor(PickleVisitor):
             self.emit('if (_PyObject_SetAttrId(result, &PyId_%s, value) < 0)' % a.name, 1)
             self.emit('goto failed;', 2)
             self.emit('Py_DECREF(value);', 1)
+        self.emit("if (record_node(result, o) < 0)", 1)
+        self.emit("goto failed;", 2)
         self.func_end()
 
     def simpleSum(self, sum, name):
@@ -1192,15 +1195,31 @@ class PartingShots(StaticVisitor):
     CODE = """
 PyObject* PyAST_mod2obj(mod_ty t)
 {
+    return _PyAST_mod2obj_nodes(t, NULL);
+}
+
+PyObject* _PyAST_mod2obj_nodes(mod_ty t, PyObject* nodes)
+{
+    PyObject *res, *saved = ast_nodes;
     if (!init_types())
         return NULL;
-    return ast2obj_mod(t);
+    ast_nodes = nodes;
+    res = ast2obj_mod(t);
+    ast_nodes = saved;
+    return res;
 }
 
 /* mode is 0 for "exec", 1 for "eval" and 2 for "single" input */
 mod_ty PyAST_obj2mod(PyObject* ast, PyArena* arena, int mode)
+{
+    return _PyAST_obj2mod_nodes(ast, arena, mode, NULL);
+}
+
+mod_ty _PyAST_obj2mod_nodes(PyObject* ast, PyArena* arena, int mode,
+                            PyObject* nodes)
 {
     mod_ty res;
+    PyObject *saved;
     PyObject *req_type[3];
     char *req_name[] = {"Module", "Expression", "Interactive"};
     int isinstance;
@@ -1222,10 +1241,14 @@ mod_ty PyAST_obj2mod(PyObject* ast, PyArena* arena, int mode)
                      req_name[mode], Py_TYPE(ast)->tp_name);
         return NULL;
     }
+    /* The objects may run Python code, which may convert other trees, while
+       they are converted, so the list of nodes is saved and restored */
+    saved = ast_nodes;
+    ast_nodes = nodes;
     if (obj2ast_mod(ast, &res, arena) != 0)
-        return NULL;
-    else
-        return res;
+        res = NULL;
+    ast_nodes = saved;
+    return res;
 }
 
 int PyAST_Check(PyObject* obj)
@@ -1236,6 +1259,42 @@ int PyAST_Check(PyObject* obj)
 }
 """
 
+NODES_PROTOTYPES = """
+/* Like PyAST_mod2obj and PyAST_obj2mod, but also appending to the list nodes
+   each object converted from or to a node of a sum type with fields, such as
+   an expr or stmt, followed by the address of that node as an int. This
+   allows information to be associated with the nodes of an arena AST through
+   the objects, as the garter checker does, see _PyAST_CompileGarter. */
+PyObject* _PyAST_mod2obj_nodes(mod_ty t, PyObject* nodes);
+mod_ty _PyAST_obj2mod_nodes(PyObject* ast, PyArena* arena, int mode,
+                            PyObject* nodes);
+"""
+
+NODES_CODE = """
+/* The list of nodes passed to _PyAST_mod2obj_nodes or _PyAST_obj2mod_nodes
+   during the conversion, or NULL */
+static PyObject *ast_nodes = NULL;
+
+static int
+record_node(PyObject *obj, void *node)
+{
+    PyObject *address;
+    int res;
+
+    if (ast_nodes == NULL)
+        return 0;
+    if (PyList_Append(ast_nodes, obj) < 0)
+        return -1;
+    address = PyLong_FromVoidPtr(node);
+    if (address == NULL)
+        return -1;
+    res = PyList_Append(ast_nodes, address);
+    Py_DECREF(address);
+    return res;
+}
+
+"""
+
 class ChainOfVisitors:
     def __init__(self, *visitors):
         self.visitors = visitors
@@ -1271,6 +1330,7 @@ def main(srcfile, dump_module=False):
         f.write("PyObject* PyAST_mod2obj(mod_ty t);\n")
         f.write("mod_ty PyAST_obj2mod(PyObject* ast, PyArena* arena, int mode);\n")
         f.write("int PyAST_Check(PyObject* obj);\n")
+        f.write(NODES_PROTOTYPES)
         f.close()
 
     if SRC_DIR:
@@ -1283,6 +1343,7 @@ def main(srcfile, dump_module=False):
         f.write('#include "%s-ast.h"\n' % mod.name)
         f.write('\n')
         f.write("static PyTypeObject AST_type;\n")
+        f.write(NODES_CODE)
         v = ChainOfVisitors(
             PyTypesDeclareVisitor(f),
             PyTypesVisitor(f),
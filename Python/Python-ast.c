@@ -6,6 +6,29 @@
 #include "Python-ast.h"
 
 static PyTypeObject AST_type;
+
+/* The list of nodes passed to _PyAST_mod2obj_nodes or _PyAST_obj2mod_nodes
+   during the conversion, or NULL */
+static PyObject *ast_nodes = NULL;
+
+static int
+record_node(PyObject *obj, void *node)
+{
+    PyObject *address;
+    int res;
+
+    if (ast_nodes == NULL)
+        return 0;
+    if (PyList_Append(ast_nodes, obj) < 0)
+        return -1;
+    address = PyLong_FromVoidPtr(node);
+    if (address == NULL)
+        return -1;
+    res = PyList_Append(ast_nodes, address);
+    Py_DECREF(address);
+    return res;
+}
+
 static PyTypeObject *mod_type;
 static PyObject* ast2obj_mod(void*);
 static PyTypeObject *Module_type;
@@ -2546,6 +2569,8 @@ ast2obj_mod(void* _o)
         Py_DECREF(value);
         break;
     }
+    if (record_node(result, o) < 0)
+        goto failed;
     return result;
 failed:
     Py_XDECREF(value);
@@ -2952,6 +2977,8 @@ ast2obj_stmt(void* _o)
     if (_PyObject_SetAttrId(result, &PyId_col_offset, value) < 0)
         goto failed;
     Py_DECREF(value);
+    if (record_node(result, o) < 0)
+        goto failed;
     return result;
 failed:
     Py_XDECREF(value);
@@ -3379,6 +3406,8 @@ ast2obj_expr(void* _o)
     if (_PyObject_SetAttrId(result, &PyId_col_offset, value) < 0)
         goto failed;
     Py_DECREF(value);
+    if (record_node(result, o) < 0)
+        goto failed;
     return result;
 failed:
     Py_XDECREF(value);
@@ -3462,6 +3491,8 @@ ast2obj_slice(void* _o)
         Py_DECREF(value);
         break;
     }
+    if (record_node(result, o) < 0)
+        goto failed;
     return result;
 failed:
     Py_XDECREF(value);
@@ -3667,6 +3698,8 @@ ast2obj_excepthandler(void* _o)
     if (_PyObject_SetAttrId(result, &PyId_col_offset, value) < 0)
         goto failed;
     Py_DECREF(value);
+    if (record_node(result, o) < 0)
+        goto failed;
     return result;
 failed:
     Py_XDECREF(value);
@@ -3894,6 +3927,7 @@ obj2ast_mod(PyObject* obj, mod_ty* out, PyArena* arena)
         }
         *out = Module(body, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Interactive_type);
@@ -3929,6 +3963,7 @@ obj2ast_mod(PyObject* obj, mod_ty* out, PyArena* arena)
         }
         *out = Interactive(body, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Expression_type);
@@ -3951,6 +3986,7 @@ obj2ast_mod(PyObject* obj, mod_ty* out, PyArena* arena)
         }
         *out = Expression(body, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Suite_type);
@@ -3986,6 +4022,7 @@ obj2ast_mod(PyObject* obj, mod_ty* out, PyArena* arena)
         }
         *out = Suite(body, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
 
@@ -4124,6 +4161,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         *out = FunctionDef(name, args, body, decorator_list, returns, lineno,
                            col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)AsyncFunctionDef_type);
@@ -4220,6 +4258,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         *out = AsyncFunctionDef(name, args, body, decorator_list, returns,
                                 lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)ClassDef_type);
@@ -4343,6 +4382,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         *out = ClassDef(name, bases, keywords, body, decorator_list, lineno,
                         col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Return_type);
@@ -4364,6 +4404,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         }
         *out = Return(value, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Delete_type);
@@ -4399,6 +4440,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         }
         *out = Delete(targets, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Assign_type);
@@ -4457,6 +4499,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         }
         *out = Assign(targets, value, type, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)AugAssign_type);
@@ -4503,6 +4546,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         }
         *out = AugAssign(target, op, value, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)For_type);
@@ -4587,6 +4631,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         }
         *out = For(target, iter, body, orelse, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)AsyncFor_type);
@@ -4671,6 +4716,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         }
         *out = AsyncFor(target, iter, body, orelse, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)While_type);
@@ -4743,6 +4789,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         }
         *out = While(test, body, orelse, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)If_type);
@@ -4815,6 +4862,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         }
         *out = If(test, body, orelse, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)With_type);
@@ -4875,6 +4923,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         }
         *out = With(items, body, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)AsyncWith_type);
@@ -4935,6 +4984,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         }
         *out = AsyncWith(items, body, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Raise_type);
@@ -4967,6 +5017,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         }
         *out = Raise(exc, cause, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Try_type);
@@ -5078,6 +5129,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         *out = Try(body, handlers, orelse, finalbody, lineno, col_offset,
                    arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Assert_type);
@@ -5111,6 +5163,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         }
         *out = Assert(test, msg, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Import_type);
@@ -5146,6 +5199,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         }
         *out = Import(names, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)ImportFrom_type);
@@ -5203,6 +5257,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         }
         *out = ImportFrom(module, names, level, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Global_type);
@@ -5238,6 +5293,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         }
         *out = Global(names, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Nonlocal_type);
@@ -5273,6 +5329,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         }
         *out = Nonlocal(names, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Expr_type);
@@ -5295,6 +5352,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
         }
         *out = Expr(value, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Pass_type);
@@ -5305,6 +5363,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
 
         *out = Pass(lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Break_type);
@@ -5315,6 +5374,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
 
         *out = Break(lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Continue_type);
@@ -5325,6 +5385,7 @@ obj2ast_stmt(PyObject* obj, stmt_ty* out, PyArena* arena)
 
         *out = Continue(lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
 
@@ -5414,6 +5475,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = BoolOp(op, values, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)BinOp_type);
@@ -5460,6 +5522,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = BinOp(left, op, right, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)UnaryOp_type);
@@ -5494,6 +5557,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = UnaryOp(op, operand, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Lambda_type);
@@ -5528,6 +5592,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = Lambda(args, body, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)IfExp_type);
@@ -5574,6 +5639,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = IfExp(test, body, orelse, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Dict_type);
@@ -5634,6 +5700,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = Dict(keys, values, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Set_type);
@@ -5669,6 +5736,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = Set(elts, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)ListComp_type);
@@ -5716,6 +5784,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = ListComp(elt, generators, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)SetComp_type);
@@ -5763,6 +5832,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = SetComp(elt, generators, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)DictComp_type);
@@ -5822,6 +5892,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = DictComp(key, value, generators, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)GeneratorExp_type);
@@ -5869,6 +5940,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = GeneratorExp(elt, generators, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Await_type);
@@ -5891,6 +5963,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = Await(value, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Yield_type);
@@ -5912,6 +5985,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = Yield(value, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)YieldFrom_type);
@@ -5934,6 +6008,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = YieldFrom(value, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Compare_type);
@@ -6006,6 +6081,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = Compare(left, ops, comparators, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Call_type);
@@ -6078,6 +6154,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = Call(func, args, keywords, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Num_type);
@@ -6100,6 +6177,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = Num(n, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Str_type);
@@ -6122,6 +6200,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = Str(s, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)FormattedValue_type);
@@ -6167,6 +6246,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         *out = FormattedValue(value, conversion, format_spec, lineno,
                               col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)JoinedStr_type);
@@ -6202,6 +6282,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = JoinedStr(values, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Bytes_type);
@@ -6224,6 +6305,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = Bytes(s, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)NameConstant_type);
@@ -6246,6 +6328,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = NameConstant(value, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Ellipsis_type);
@@ -6256,6 +6339,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
 
         *out = Ellipsis(lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Attribute_type);
@@ -6302,6 +6386,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = Attribute(value, attr, ctx, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Subscript_type);
@@ -6348,6 +6433,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = Subscript(value, slice, ctx, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Starred_type);
@@ -6382,6 +6468,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = Starred(value, ctx, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Name_type);
@@ -6416,6 +6503,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = Name(id, ctx, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)List_type);
@@ -6463,6 +6551,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = List(elts, ctx, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Tuple_type);
@@ -6510,6 +6599,7 @@ obj2ast_expr(PyObject* obj, expr_ty* out, PyArena* arena)
         }
         *out = Tuple(elts, ctx, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
 
@@ -6629,6 +6719,7 @@ obj2ast_slice(PyObject* obj, slice_ty* out, PyArena* arena)
         }
         *out = Slice(lower, upper, step, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)ExtSlice_type);
@@ -6664,6 +6755,7 @@ obj2ast_slice(PyObject* obj, slice_ty* out, PyArena* arena)
         }
         *out = ExtSlice(dims, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
     isinstance = PyObject_IsInstance(obj, (PyObject*)Index_type);
@@ -6686,6 +6778,7 @@ obj2ast_slice(PyObject* obj, slice_ty* out, PyArena* arena)
         }
         *out = Index(value, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
 
@@ -7118,6 +7211,7 @@ obj2ast_excepthandler(PyObject* obj, excepthandler_ty* out, PyArena* arena)
         }
         *out = ExceptHandler(type, name, body, lineno, col_offset, arena);
         if (*out == NULL) goto failed;
+        if (record_node(obj, *out) < 0) goto failed;
         return 0;
     }
 
@@ -7634,15 +7728,31 @@ PyInit__ast(void)
 
 PyObject* PyAST_mod2obj(mod_ty t)
 {
+    return _PyAST_mod2obj_nodes(t, NULL);
+}
+
+PyObject* _PyAST_mod2obj_nodes(mod_ty t, PyObject* nodes)
+{
+    PyObject *res, *saved = ast_nodes;
     if (!init_types())
         return NULL;
-    return ast2obj_mod(t);
+    ast_nodes = nodes;
+    res = ast2obj_mod(t);
+    ast_nodes = saved;
+    return res;
 }
 
 /* mode is 0 for "exec", 1 for "eval" and 2 for "single" input */
 mod_ty PyAST_obj2mod(PyObject* ast, PyArena* arena, int mode)
+{
+    return _PyAST_obj2mod_nodes(ast, arena, mode, NULL);
+}
+
+mod_ty _PyAST_obj2mod_nodes(PyObject* ast, PyArena* arena, int mode,
+                            PyObject* nodes)
 {
     mod_ty res;
+    PyObject *saved;
     PyObject *req_type[3];
     char *req_name[] = {"Module", "Expression", "Interactive"};
     int isinstance;
@@ -7664,10 +7774,14 @@ mod_ty PyAST_obj2mod(PyObject* ast, PyArena* arena, int mode)
                      req_name[mode], Py_TYPE(ast)->tp_name);
         return NULL;
     }
+    /* The objects may run Python code, which may convert other trees, while
+       they are converted, so the list of nodes is saved and restored */
+    saved = ast_nodes;
+    ast_nodes = nodes;
     if (obj2ast_mod(ast, &res, arena) != 0)
-        return NULL;
-    else
-        return res;
+        res = NULL;
+    ast_nodes = saved;
+    return res;
 }
 
 int PyAST_Check(PyObject* obj)
@@ -14,6 +14,7 @@
 #include "code.h"
 #include "dictobject.h"
 #include "frameobject.h"
+#include "longintrepr.h"
 #include "opcode.h"
 #include "setobject.h"
 #include "structmember.h"
@@ -114,6 +115,7 @@ static PyObject * call_function(PyObject ***, int, uint64*, uint64*);
 static PyObject * call_function(PyObject ***, int);
 #endif
 static PyObject * fast_function(PyObject *, PyObject ***, int, int, int);
+static PyObject * direct_function(PyObject *, PyObject **, int);
 static PyObject * do_call(PyObject *, PyObject ***, int, int);
 static PyObject * ext_do_call(PyObject *, PyObject ***, int, int, int);
 static PyObject * update_keyword_args(PyObject *, int, PyObject ***,
@@ -122,6 +124,13 @@ static PyObject * update_star_args(int, int, PyObject *, PyObject ***);
 static PyObject * load_args(PyObject ***, int);
 #define CALL_FLAG_VAR 1
 #define CALL_FLAG_KW 2
+/* The flags of the code objects of the functions which CALL_FUNCTION_DIRECT
+   calls with direct_function(): those which take only positional arguments,
+   and are neither generators nor coroutines */
+#define DIRECT_CALL_MASK (CO_OPTIMIZED | CO_NEWLOCALS | CO_VARARGS | \
+                          CO_VARKEYWORDS | CO_GENERATOR | CO_COROUTINE | \
+                          CO_ITERABLE_COROUTINE)
+#define DIRECT_CALL_FLAGS (CO_OPTIMIZED | CO_NEWLOCALS)
 
 #ifdef LLTRACE
 static int lltrace;
@@ -139,6 +148,19 @@ static int maybe_call_line_trace(Py_tracefunc, PyObject *,
                                  PyThreadState *, PyFrameObject *, int *, int *, int *);
 
 static PyObject * cmp_outcome(int, PyObject *, PyObject *);
+/* Ints of a single digit, as most ints are, which the opcodes specialized
+   for Garter code operate on directly */
+#define IS_SMALL_INT(v) (PyLong_CheckExact(v) && Py_ABS(Py_SIZE(v)) <= 1)
+#define SMALL_INT_VALUE(v) \
+    (Py_SIZE(v) == 0 ? 0L : \
+     Py_SIZE(v) < 0 ? -(long)((PyLongObject *)(v))->ob_digit[0] : \
+     (long)((PyLongObject *)(v))->ob_digit[0])
+static PyObject * int_binary_op(int, PyObject *, PyObject *);
+static PyObject * float_binary_op(int, PyObject *, PyObject *);
+static int as_double(PyObject *, double *);
+static PyObject * compare_doubles(int, double, double);
+static PyObject * list_subscr(PyObject *, PyObject *);
+static int list_ass_subscr(PyObject *, PyObject *, PyObject *);
 static PyObject * import_from(PyObject *, PyObject *);
 static int import_all_from(PyObject *, PyObject *);
 static void format_exc_check_arg(PyObject *, const char *, PyObject *);
@@ -2343,7 +2365,41 @@ PyEval_EvalFrameEx(PyFrameObject *f, int throwflag)
             DISPATCH();
         }
 
-        TARGET(LOAD_GLOBAL) {
+        /* The garter checker has proven that the global is bound, and as
+           Garter code never deletes globals, the entry of the globals in
+           which it is bound only moves when they are resized. It is found
+           directly, by its index recorded in co_globalhints when the global
+           was last loaded. */
+        TARGET(LOAD_GLOBAL_BOUND) {
+            PyObject *name = GETITEM(names, oparg);
+            PyObject *v;
+            if (co->co_globalhints == NULL) {
+                Py_ssize_t i, n = PyTuple_GET_SIZE(co->co_names);
+                co->co_globalhints = PyMem_NEW(Py_ssize_t, n);
+                if (co->co_globalhints == NULL)
+                    goto _load_global;
+                for (i = 0; i < n; i++)
+                    co->co_globalhints[i] = -1;
+            }
+            if (!PyDict_CheckExact(f->f_globals)
+                || !PyDict_CheckExact(f->f_builtins))
+                goto _load_global;
+            v = _PyDict_LoadGlobalHint((PyDictObject *)f->f_globals,
+                                       (PyDictObject *)f->f_builtins,
+                                       name, &co->co_globalhints[oparg]);
+            if (v == NULL) {
+                if (!_PyErr_OCCURRED())
+                    format_exc_check_arg(PyExc_NameError,
+                                         NAME_ERROR_MSG, name);
+                goto error;
+            }
+            Py_INCREF(v);
+            PUSH(v);
+            DISPATCH();
+        }
+
+        TARGET(LOAD_GLOBAL)
+        _load_global: {
             PyObject *name = GETITEM(names, oparg);
             PyObject *v;
             if (PyDict_CheckExact(f->f_globals)
@@ -2489,6 +2545,25 @@ PyEval_EvalFrameEx(PyFrameObject *f, int throwflag)
             DISPATCH();
         }
 
+        TARGET_WITH_IMPL(BUILD_INT_LIST, _build_typed_list)
+        TARGET_WITH_IMPL(BUILD_FLOAT_LIST, _build_typed_list)
+        TARGET(BUILD_BOOL_LIST)
+        _build_typed_list: {
+            char typecode = opcode == BUILD_INT_LIST ? 'l' :
+                            opcode == BUILD_FLOAT_LIST ? 'd' : '?';
+            PyObject *list = _PyTypedList_FromArray(typecode,
+                                                    stack_pointer - oparg,
+                                                    oparg);
+            while (--oparg >= 0) {
+                PyObject *item = POP();
+                Py_DECREF(item);
+            }
+            if (list == NULL)
+                goto error;
+            PUSH(list);
+            DISPATCH();
+        }
+
         TARGET_WITH_IMPL(BUILD_TUPLE_UNPACK, _build_list_unpack)
         TARGET(BUILD_LIST_UNPACK)
         _build_list_unpack: {
@@ -2711,6 +2786,101 @@ PyEval_EvalFrameEx(PyFrameObject *f, int throwflag)
             DISPATCH();
         }
 
+        /* The following opcodes are emitted for Garter code in place of the
+           generic opcodes when the checker has proven the types of the
+           operands. Each falls back to the behaviour of the generic opcode if
+           the operands aren't small ints, floats or lists after all, so the
+           results are always the same. */
+
+        TARGET(BINARY_OP_INT) {
+            PyObject *right = POP();
+            PyObject *left = TOP();
+            PyObject *res = int_binary_op(oparg, left, right);
+            Py_DECREF(left);
+            Py_DECREF(right);
+            SET_TOP(res);
+            if (res == NULL)
+                goto error;
+            DISPATCH();
+        }
+
+        TARGET(BINARY_OP_FLOAT) {
+            PyObject *right = POP();
+            PyObject *left = TOP();
+            PyObject *res = float_binary_op(oparg, left, right);
+            Py_DECREF(left);
+            Py_DECREF(right);
+            SET_TOP(res);
+            if (res == NULL)
+                goto error;
+            DISPATCH();
+        }
+
+        TARGET(COMPARE_OP_INT) {
+            PyObject *right = POP();
+            PyObject *left = TOP();
+            PyObject *res;
+            if (oparg <= PyCmp_GE && IS_SMALL_INT(left) && IS_SMALL_INT(right))
+                res = compare_doubles(oparg, SMALL_INT_VALUE(left),
+                                      SMALL_INT_VALUE(right));
+            else
+                res = cmp_outcome(oparg, left, right);
+            Py_DECREF(left);
+            Py_DECREF(right);
+            SET_TOP(res);
+            if (res == NULL)
+                goto error;
+            PREDICT(POP_JUMP_IF_FALSE);
+            PREDICT(POP_JUMP_IF_TRUE);
+            DISPATCH();
+        }
+
+        TARGET(COMPARE_OP_FLOAT) {
+            PyObject *right = POP();
+            PyObject *left = TOP();
+            PyObject *res;
+            double a, b;
+            if (oparg <= PyCmp_GE && as_double(left, &a) && as_double(right, &b))
+                res = compare_doubles(oparg, a, b);
+            else
+                res = cmp_outcome(oparg, left, right);
+            Py_DECREF(left);
+            Py_DECREF(right);
+            SET_TOP(res);
+            if (res == NULL)
+                goto error;
+            PREDICT(POP_JUMP_IF_FALSE);
+            PREDICT(POP_JUMP_IF_TRUE);
+            DISPATCH();
+        }
+
+        TARGET(BINARY_SUBSCR_LIST) {
+            PyObject *sub = POP();
+            PyObject *container = TOP();
+            PyObject *res = list_subscr(container, sub);
+            Py_DECREF(container);
+            Py_DECREF(sub);
+            SET_TOP(res);
+            if (res == NULL)
+                goto error;
+            DISPATCH();
+        }
+
+        TARGET(STORE_SUBSCR_LIST) {
+            PyObject *sub = TOP();
+            PyObject *container = SECOND();
+            PyObject *v = THIRD();
+            int err;
+            STACKADJ(-3);
+            err = list_ass_subscr(container, sub, v);
+            Py_DECREF(v);
+            Py_DECREF(container);
+            Py_DECREF(sub);
+            if (err != 0)
+                goto error;
+            DISPATCH();
+        }
+
         TARGET(IMPORT_NAME) {
             _Py_IDENTIFIER(__import__);
             PyObject *name = GETITEM(names, oparg);
@@ -3175,7 +3345,48 @@ PyEval_EvalFrameEx(PyFrameObject *f, int throwflag)
             DISPATCH();
         }
 
-        TARGET(CALL_FUNCTION) {
+        TARGET(CALL_FUNCTION_DIRECT) {
+            PyObject *func = PEEK(oparg + 1);
+            PyObject *self = NULL, *res;
+            PyCodeObject *callee;
+            int n = oparg;
+            if (PyMethod_Check(func) && PyMethod_GET_SELF(func) != NULL) {
+                self = PyMethod_GET_SELF(func);
+                func = PyMethod_GET_FUNCTION(func);
+                n++;
+            }
+            if (!PyFunction_Check(func))
+                goto _call_function;
+            callee = (PyCodeObject *)PyFunction_GET_CODE(func);
+            if (callee->co_argcount != n || callee->co_kwonlyargcount != 0 ||
+                (callee->co_flags & DIRECT_CALL_MASK) != DIRECT_CALL_FLAGS)
+                goto _call_function;
+            PCALL(PCALL_ALL);
+            if (self != NULL) {
+                /* Pass self as the first argument, in place of the bound
+                   method, which may hold the only reference to func */
+                PyObject *meth = PEEK(n);
+                PCALL(PCALL_METHOD);
+                PCALL(PCALL_BOUND_METHOD);
+                Py_INCREF(self);
+                Py_INCREF(func);
+                SET_VALUE(n, self);
+                Py_DECREF(meth);
+            }
+            res = direct_function(func, stack_pointer - n, n);
+            /* The arguments have been moved into the frame */
+            STACKADJ(-n);
+            if (self == NULL)
+                STACKADJ(-1);
+            Py_DECREF(func);
+            PUSH(res);
+            if (res == NULL)
+                goto error;
+            DISPATCH();
+        }
+
+        TARGET(CALL_FUNCTION)
+        _call_function: {
             PyObject **sp, *res;
             PCALL(PCALL_ALL);
             sp = stack_pointer;
@@ -4825,6 +5036,76 @@ fast_function(PyObject *func, PyObject ***pp_stack, int n, int na, int nk)
                                     name, qualname);
 }
 
+/* The direct_function() function calls a function whose code takes exactly
+   the n positional arguments at args, as CALL_FUNCTION_DIRECT has checked.
+   The references to the arguments are stolen, being moved straight into the
+   fast locals of the new frame, and the cell and free variables are set up
+   as in _PyEval_EvalCodeWithName(), such that closures skip the generic
+   binding of arguments too. PyFrame_New() reuses the zombie frame of the
+   code where it can, which is shared by all of the function objects created
+   from a nested function's code.
+*/
+
+static PyObject *
+direct_function(PyObject *func, PyObject **args, int n)
+{
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyThreadState *tstate = PyThreadState_GET();
+    PyFrameObject *f;
+    PyObject *retval;
+    PyObject **fastlocals;
+    Py_ssize_t i, ncells, nfrees;
+
+    PCALL(PCALL_FUNCTION);
+    PCALL(PCALL_FASTER_FUNCTION);
+    assert(co->co_argcount == n);
+    f = PyFrame_New(tstate, co, PyFunction_GET_GLOBALS(func), NULL);
+    if (f == NULL) {
+        for (i = 0; i < n; i++)
+            Py_DECREF(args[i]);
+        return NULL;
+    }
+
+    fastlocals = f->f_localsplus;
+    memcpy(fastlocals, args, n * sizeof(PyObject *));
+
+    if (!(co->co_flags & CO_NOFREE)) {
+        PyObject *closure = PyFunction_GET_CLOSURE(func);
+        ncells = PyTuple_GET_SIZE(co->co_cellvars);
+        nfrees = PyTuple_GET_SIZE(co->co_freevars);
+        for (i = 0; i < ncells; i++) {
+            PyObject *c;
+            int arg;
+            if (co->co_cell2arg != NULL &&
+                (arg = co->co_cell2arg[i]) != CO_CELL_NOT_AN_ARG) {
+                c = PyCell_New(fastlocals[arg]);
+                Py_CLEAR(fastlocals[arg]);
+            }
+            else {
+                c = PyCell_New(NULL);
+            }
+            if (c == NULL) {
+                ++tstate->recursion_depth;
+                Py_DECREF(f);
+                --tstate->recursion_depth;
+                return NULL;
+            }
+            fastlocals[co->co_nlocals + i] = c;
+        }
+        for (i = 0; i < nfrees; i++) {
+            PyObject *o = PyTuple_GET_ITEM(closure, i);
+            Py_INCREF(o);
+            fastlocals[co->co_nlocals + ncells + i] = o;
+        }
+    }
+
+    retval = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return retval;
+}
+
 static PyObject *
 update_keyword_args(PyObject *orig_kwdict, int nk, PyObject ***pp_stack,
                     PyObject *func)
@@ -5131,6 +5412,215 @@ cmp_outcome(int op, PyObject *v, PyObject *w)
     return v;
 }
 
+/* The behaviour of the binary or inplace operator opcode, for the specialized
+   opcodes to fall back to */
+static PyObject *
+binary_op(int opcode, PyObject *v, PyObject *w)
+{
+    switch (opcode) {
+    case BINARY_ADD:
+        return PyNumber_Add(v, w);
+    case BINARY_SUBTRACT:
+        return PyNumber_Subtract(v, w);
+    case BINARY_MULTIPLY:
+        return PyNumber_Multiply(v, w);
+    case BINARY_TRUE_DIVIDE:
+        return PyNumber_TrueDivide(v, w);
+    case BINARY_FLOOR_DIVIDE:
+        return PyNumber_FloorDivide(v, w);
+    case BINARY_MODULO:
+        return PyUnicode_CheckExact(v) ?
+            PyUnicode_Format(v, w) :
+            PyNumber_Remainder(v, w);
+    case INPLACE_ADD:
+        return PyNumber_InPlaceAdd(v, w);
+    case INPLACE_SUBTRACT:
+        return PyNumber_InPlaceSubtract(v, w);
+    case INPLACE_MULTIPLY:
+        return PyNumber_InPlaceMultiply(v, w);
+    case INPLACE_TRUE_DIVIDE:
+        return PyNumber_InPlaceTrueDivide(v, w);
+    case INPLACE_FLOOR_DIVIDE:
+        return PyNumber_InPlaceFloorDivide(v, w);
+    case INPLACE_MODULO:
+        return PyNumber_InPlaceRemainder(v, w);
+    default:
+        PyErr_Format(PyExc_SystemError,
+                     "opcode %d can't be specialized", opcode);
+        return NULL;
+    }
+}
+
+/* BINARY_OP_INT: ints of a single digit, which most are, are operated on
+   directly. As they are less than 2**30 in magnitude, none of the operations
+   overflow, with products computed as long longs. */
+static PyObject *
+int_binary_op(int opcode, PyObject *v, PyObject *w)
+{
+    long a, b, r;
+
+    if (!IS_SMALL_INT(v) || !IS_SMALL_INT(w))
+        return binary_op(opcode, v, w);
+    a = SMALL_INT_VALUE(v);
+    b = SMALL_INT_VALUE(w);
+    switch (opcode) {
+    case BINARY_ADD:
+    case INPLACE_ADD:
+        return PyLong_FromLong(a + b);
+    case BINARY_SUBTRACT:
+    case INPLACE_SUBTRACT:
+        return PyLong_FromLong(a - b);
+    case BINARY_MULTIPLY:
+    case INPLACE_MULTIPLY:
+        return PyLong_FromLongLong((PY_LONG_LONG)a * b);
+    case BINARY_FLOOR_DIVIDE:
+    case INPLACE_FLOOR_DIVIDE:
+        if (b == 0)
+            break; /* Let the generic opcode raise ZeroDivisionError */
+        r = a / b;
+        if (a % b != 0 && (a < 0) != (b < 0))
+            r--; /* Round towards negative infinity */
+        return PyLong_FromLong(r);
+    case BINARY_MODULO:
+    case INPLACE_MODULO:
+        if (b == 0)
+            break;
+        r = a % b;
+        if (r != 0 && (r < 0) != (b < 0))
+            r += b; /* Take the sign of the divisor */
+        return PyLong_FromLong(r);
+    }
+    return binary_op(opcode, v, w);
+}
+
+/* BINARY_OP_FLOAT: as for float arithmetic, ints may be mixed with floats.
+   The result of an operation on two ints must be an int, however, so that is
+   left to the generic opcode. */
+static PyObject *
+float_binary_op(int opcode, PyObject *v, PyObject *w)
+{
+    double a, b;
+
+    if ((!PyFloat_CheckExact(v) && !PyFloat_CheckExact(w)) ||
+        !as_double(v, &a) || !as_double(w, &b))
+        return binary_op(opcode, v, w);
+    switch (opcode) {
+    case BINARY_ADD:
+    case INPLACE_ADD:
+        return PyFloat_FromDouble(a + b);
+    case BINARY_SUBTRACT:
+    case INPLACE_SUBTRACT:
+        return PyFloat_FromDouble(a - b);
+    case BINARY_MULTIPLY:
+    case INPLACE_MULTIPLY:
+        return PyFloat_FromDouble(a * b);
+    case BINARY_TRUE_DIVIDE:
+    case INPLACE_TRUE_DIVIDE:
+        if (b == 0.0)
+            break;
+        return PyFloat_FromDouble(a / b);
+    }
+    return binary_op(opcode, v, w);
+}
+
+/* Stores the value of v in *x if it is a float or a small int, which are
+   exactly representable as doubles, returning whether it was */
+static int
+as_double(PyObject *v, double *x)
+{
+    if (PyFloat_CheckExact(v)) {
+        *x = PyFloat_AS_DOUBLE(v);
+        return 1;
+    }
+    if (IS_SMALL_INT(v)) {
+        *x = (double)SMALL_INT_VALUE(v);
+        return 1;
+    }
+    return 0;
+}
+
+/* COMPARE_OP_INT and COMPARE_OP_FLOAT: the result of comparing a and b with
+   op, which is one of PyCmp_LT to PyCmp_GE */
+static PyObject *
+compare_doubles(int op, double a, double b)
+{
+    int res = 0;
+    PyObject *v;
+    switch (op) {
+    case PyCmp_LT:
+        res = a < b;
+        break;
+    case PyCmp_LE:
+        res = a <= b;
+        break;
+    case PyCmp_EQ:
+        res = a == b;
+        break;
+    case PyCmp_NE:
+        res = a != b;
+        break;
+    case PyCmp_GT:
+        res = a > b;
+        break;
+    case PyCmp_GE:
+        res = a >= b;
+        break;
+    }
+    v = res ? Py_True : Py_False;
+    Py_INCREF(v);
+    return v;
+}
+
+/* BINARY_SUBSCR_LIST: lists indexed by small ints in range */
+static PyObject *
+list_subscr(PyObject *v, PyObject *w)
+{
+    if (PyList_CheckExact(v) && IS_SMALL_INT(w)) {
+        Py_ssize_t i = SMALL_INT_VALUE(w);
+        if (i < 0)
+            i += PyList_GET_SIZE(v);
+        if (i >= 0 && i < PyList_GET_SIZE(v)) {
+            PyObject *res = PyList_GET_ITEM(v, i);
+            Py_INCREF(res);
+            return res;
+        }
+    }
+    else if (PyTypedList_CheckExact(v) && IS_SMALL_INT(w)) {
+        Py_ssize_t i = SMALL_INT_VALUE(w);
+        if (i < 0)
+            i += Py_SIZE(v);
+        if (i >= 0 && i < Py_SIZE(v))
+            return _PyTypedList_GetItem(v, i);
+    }
+    return PyObject_GetItem(v, w);
+}
+
+/* STORE_SUBSCR_LIST: v[w] = x */
+static int
+list_ass_subscr(PyObject *v, PyObject *w, PyObject *x)
+{
+    if (PyList_CheckExact(v) && IS_SMALL_INT(w)) {
+        Py_ssize_t i = SMALL_INT_VALUE(w);
+        if (i < 0)
+            i += PyList_GET_SIZE(v);
+        if (i >= 0 && i < PyList_GET_SIZE(v)) {
+            PyObject *old = PyList_GET_ITEM(v, i);
+            Py_INCREF(x);
+            PyList_SET_ITEM(v, i, x);
+            Py_DECREF(old);
+            return 0;
+        }
+    }
+    else if (PyTypedList_CheckExact(v) && IS_SMALL_INT(w)) {
+        Py_ssize_t i = SMALL_INT_VALUE(w);
+        if (i < 0)
+            i += Py_SIZE(v);
+        if (i >= 0 && i < Py_SIZE(v))
+            return _PyTypedList_SetItem(v, i, x);
+    }
+    return PyObject_SetItem(v, w, x);
+}
+
 static PyObject *
 import_from(PyObject *v, PyObject *name)
 {
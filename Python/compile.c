@@ -161,6 +161,8 @@ struct compiler {
     struct compiler_unit *u; /* compiler state for current block */
     PyObject *c_stack;           /* Python list holding compiler_unit ptrs */
     PyArena *c_arena;            /* pointer to memory allocation arena */
+    PyObject *c_specs;           /* specs recorded by the garter checker,
+                                    or NULL, see _PyAST_CompileGarter */
 };
 
 static int compiler_enter_scope(struct compiler *, identifier, int, void *, int);
@@ -174,6 +176,7 @@ static int compiler_addop_j(struct compiler *, int, basicblock *, int);
 static basicblock *compiler_use_new_block(struct compiler *);
 static int compiler_error(struct compiler *, const char *);
 static int compiler_nameop(struct compiler *, identifier, expr_context_ty);
+static int compiler_boundnameop(struct compiler *, identifier);
 
 static PyCodeObject *compiler_mod(struct compiler *, mod_ty);
 static int compiler_visit_stmt(struct compiler *, stmt_ty);
@@ -182,6 +185,7 @@ static int compiler_visit_expr(struct compiler *, expr_ty);
 static int compiler_augassign(struct compiler *, stmt_ty);
 static int compiler_visit_slice(struct compiler *, slice_ty,
                                 expr_context_ty);
+static int compiler_list_subscr(struct compiler *, expr_ty);
 
 static int compiler_push_fblock(struct compiler *, enum fblocktype,
                                 basicblock *);
@@ -290,6 +294,16 @@ compiler_init(struct compiler *c)
 PyCodeObject *
 PyAST_CompileObject(mod_ty mod, PyObject *filename, PyCompilerFlags *flags,
                    int optimize, PyArena *arena)
+{
+    return _PyAST_CompileGarter(mod, filename, flags, optimize, arena, NULL);
+}
+
+/* Like PyAST_CompileObject, but emitting the opcodes specialized for the
+   specs in the dict specs, if it isn't NULL, see Garter_SPEC_INT in
+   compile.h */
+PyCodeObject *
+_PyAST_CompileGarter(mod_ty mod, PyObject *filename, PyCompilerFlags *flags,
+                     int optimize, PyArena *arena, PyObject *specs)
 {
     struct compiler c;
     PyCodeObject *co = NULL;
@@ -307,6 +321,8 @@ PyAST_CompileObject(mod_ty mod, PyObject *filename, PyCompilerFlags *flags,
     Py_INCREF(filename);
     c.c_filename = filename;
     c.c_arena = arena;
+    Py_XINCREF(specs);
+    c.c_specs = specs;
     c.c_future = PyFuture_FromASTObject(mod, filename);
     if (c.c_future == NULL)
         goto finally;
@@ -375,6 +391,35 @@ compiler_free(struct compiler *c)
         PyObject_Free(c->c_future);
     Py_XDECREF(c->c_filename);
     Py_DECREF(c->c_stack);
+    Py_XDECREF(c->c_specs);
+}
+
+/* The spec which the garter checker recorded for node. Specs only select
+   specialized opcodes, which behave as the general ones do, so if it can't
+   be looked up, the general opcodes are emitted. */
+static int
+compiler_spec(struct compiler *c, void *node)
+{
+    PyObject *address, *spec;
+    long value;
+
+    if (c->c_specs == NULL)
+        return Garter_SPEC_NONE;
+    address = PyLong_FromVoidPtr(node);
+    if (address == NULL) {
+        PyErr_Clear();
+        return Garter_SPEC_NONE;
+    }
+    spec = PyDict_GetItem(c->c_specs, address);
+    Py_DECREF(address);
+    if (spec == NULL || !PyLong_Check(spec))
+        return Garter_SPEC_NONE;
+    value = PyLong_AsLong(spec);
+    if (value == -1 && PyErr_Occurred()) {
+        PyErr_Clear();
+        return Garter_SPEC_NONE;
+    }
+    return (int)value;
 }
 
 static PyObject *
@@ -891,6 +936,9 @@ PyCompile_OpcodeStackEffect(int opcode, int oparg)
         case BINARY_SUBSCR:
         case BINARY_FLOOR_DIVIDE:
         case BINARY_TRUE_DIVIDE:
+        case BINARY_SUBSCR_LIST:
+        case BINARY_OP_INT:
+        case BINARY_OP_FLOAT:
             return -1;
         case INPLACE_FLOOR_DIVIDE:
         case INPLACE_TRUE_DIVIDE:
@@ -903,6 +951,7 @@ PyCompile_OpcodeStackEffect(int opcode, int oparg)
         case INPLACE_MODULO:
             return -1;
         case STORE_SUBSCR:
+        case STORE_SUBSCR_LIST:
             return -3;
         case DELETE_SUBSCR:
             return -2;
@@ -976,6 +1025,9 @@ PyCompile_OpcodeStackEffect(int opcode, int oparg)
             return 1;
         case BUILD_TUPLE:
         case BUILD_LIST:
+        case BUILD_INT_LIST:
+        case BUILD_FLOAT_LIST:
+        case BUILD_BOOL_LIST:
         case BUILD_SET:
             return 1-oparg;
         case BUILD_LIST_UNPACK:
@@ -990,6 +1042,8 @@ PyCompile_OpcodeStackEffect(int opcode, int oparg)
         case LOAD_ATTR:
             return 0;
         case COMPARE_OP:
+        case COMPARE_OP_INT:
+        case COMPARE_OP_FLOAT:
             return -1;
         case IMPORT_NAME:
             return -1;
@@ -1007,6 +1061,7 @@ PyCompile_OpcodeStackEffect(int opcode, int oparg)
             return -1;
 
         case LOAD_GLOBAL:
+        case LOAD_GLOBAL_BOUND:
             return 1;
 
         case CONTINUE_LOOP:
@@ -1029,6 +1084,7 @@ PyCompile_OpcodeStackEffect(int opcode, int oparg)
             return -oparg;
 #define NARGS(o) (((o) % 256) + 2*(((o) / 256) % 256))
         case CALL_FUNCTION:
+        case CALL_FUNCTION_DIRECT:
             return -NARGS(oparg);
         case CALL_FUNCTION_VAR:
         case CALL_FUNCTION_KW:
@@ -1783,12 +1839,100 @@ compiler_function(struct compiler *c, stmt_ty s, int is_async)
     return compiler_nameop(c, name, Store);
 }
 
+/* Garter classes, for which the checker has proven that the fields declared
+   in the body are the only attributes of the instances, are laid out with a
+   slot for each field rather than a __dict__. The field declarations are
+   compiled as usual, storing their values in the class namespace, where they
+   would conflict with the slots, so the end of the body moves them into a
+   __garter_defaults__ tuple, from which _garter.Record, the base of the
+   class, initializes new instances, and declares the __slots__. Both are
+   ordered by the mangled names of the fields, as type_new orders the slots.
+*/
+static int
+compiler_class_slots(struct compiler *c, asdl_seq *body)
+{
+    PyObject *names, *slots, *name;
+    Py_ssize_t i, n;
+    int ok = 0;
+
+    names = PyList_New(0);
+    if (names == NULL)
+        return 0;
+    for (i = 0; i < asdl_seq_LEN(body); i++) {
+        stmt_ty st = (stmt_ty)asdl_seq_GET(body, i);
+        expr_ty target;
+        if (st->kind != Assign_kind ||
+            asdl_seq_LEN(st->v.Assign.targets) != 1)
+            continue;
+        target = (expr_ty)asdl_seq_GET(st->v.Assign.targets, 0);
+        if (target->kind != Name_kind)
+            continue;
+        name = _Py_Mangle(c->u->u_private, target->v.Name.id);
+        if (name == NULL)
+            goto error;
+        if (PyList_Append(names, name) < 0) {
+            Py_DECREF(name);
+            goto error;
+        }
+        Py_DECREF(name);
+    }
+    if (PyList_Sort(names) < 0)
+        goto error;
+
+    /* __garter_defaults__ = (<field>, ...); del <field>, ... */
+    n = PyList_GET_SIZE(names);
+    for (i = 0; i < n; i++) {
+        if (!compiler_addop_o(c, LOAD_NAME, c->u->u_names,
+                              PyList_GET_ITEM(names, i)))
+            goto error;
+    }
+    if (!compiler_addop_i(c, BUILD_TUPLE, n))
+        goto error;
+    name = PyUnicode_InternFromString("__garter_defaults__");
+    if (name == NULL)
+        goto error;
+    if (!compiler_nameop(c, name, Store)) {
+        Py_DECREF(name);
+        goto error;
+    }
+    Py_DECREF(name);
+    for (i = 0; i < n; i++) {
+        if (!compiler_addop_o(c, DELETE_NAME, c->u->u_names,
+                              PyList_GET_ITEM(names, i)))
+            goto error;
+    }
+
+    /* __slots__ = ('<field>', ...) */
+    slots = PyList_AsTuple(names);
+    if (slots == NULL)
+        goto error;
+    if (!compiler_addop_o(c, LOAD_CONST, c->u->u_consts, slots)) {
+        Py_DECREF(slots);
+        goto error;
+    }
+    Py_DECREF(slots);
+    name = PyUnicode_InternFromString("__slots__");
+    if (name == NULL)
+        goto error;
+    if (!compiler_nameop(c, name, Store)) {
+        Py_DECREF(name);
+        goto error;
+    }
+    Py_DECREF(name);
+    ok = 1;
+
+error:
+    Py_DECREF(names);
+    return ok;
+}
+
 static int
 compiler_class(struct compiler *c, stmt_ty s)
 {
     PyCodeObject *co;
     PyObject *str;
-    int i;
+    int i, nbases = 2;
+    int slots = compiler_spec(c, s) == Garter_SPEC_SLOTS;
     asdl_seq* decos = s->v.ClassDef.decorator_list;
 
     if (!compiler_decorators(c, decos))
@@ -1803,7 +1947,8 @@ compiler_class(struct compiler *c, stmt_ty s)
          <name> is the class name
          <bases> is the positional arguments and *varargs argument
          <keywords> is the keyword arguments and **kwds argument
-       This borrows from compiler_call.
+       This borrows from compiler_call. Garter classes laid out with slots
+       have _garter.Record as their first base.
     */
 
     /* 1. compile the class body into a code object */
@@ -1846,6 +1991,10 @@ compiler_class(struct compiler *c, stmt_ty s)
             compiler_exit_scope(c);
             return 0;
         }
+        if (slots && !compiler_class_slots(c, s->v.ClassDef.body)) {
+            compiler_exit_scope(c);
+            return 0;
+        }
         if (c->u->u_ste->ste_needs_class_closure) {
             /* return the (empty) __class__ cell */
             str = PyUnicode_InternFromString("__class__");
@@ -1887,13 +2036,34 @@ compiler_class(struct compiler *c, stmt_ty s)
     /* 4. load class name */
     ADDOP_O(c, LOAD_CONST, s->v.ClassDef.name, consts);
 
-    /* 5. generate the rest of the code for the call */
-    if (!compiler_call_helper(c, 2,
+    /* 5. load _garter.Record for Garter classes laid out with slots */
+    if (slots) {
+        PyObject *level = PyLong_FromLong(0);
+        if (level == NULL)
+            return 0;
+        ADDOP_O(c, LOAD_CONST, level, consts);
+        Py_DECREF(level);
+        ADDOP_O(c, LOAD_CONST, Py_None, consts);
+        str = PyUnicode_InternFromString("_garter");
+        if (str == NULL)
+            return 0;
+        ADDOP_NAME(c, IMPORT_NAME, str, names);
+        Py_DECREF(str);
+        str = PyUnicode_InternFromString("Record");
+        if (str == NULL)
+            return 0;
+        ADDOP_NAME(c, LOAD_ATTR, str, names);
+        Py_DECREF(str);
+        nbases++;
+    }
+
+    /* 6. generate the rest of the code for the call */
+    if (!compiler_call_helper(c, nbases,
                               s->v.ClassDef.bases,
                               s->v.ClassDef.keywords))
         return 0;
 
-    /* 6. apply decorators */
+    /* 7. apply decorators */
     for (i = 0; i < asdl_seq_LEN(decos); i++) {
         ADDOP_I(c, CALL_FUNCTION, 1);
     }
@@ -2877,6 +3047,47 @@ inplace_binop(struct compiler *c, operator_ty op)
     }
 }
 
+/* Adds the opcode for the binary operator op, or for the inplace operator for
+   augmented assignments. Where the garter checker has proven the types of the
+   operands, as given by spec, a specialized opcode is used instead, with the
+   generic opcode as its argument. */
+static int
+compiler_binop(struct compiler *c, operator_ty op, int spec, int inplace)
+{
+    int opcode = inplace ? inplace_binop(c, op) : binop(c, op);
+
+    if (spec == Garter_SPEC_INT &&
+        (op == Add || op == Sub || op == Mult || op == FloorDiv || op == Mod)) {
+        ADDOP_I(c, BINARY_OP_INT, opcode);
+    }
+    else if (spec == Garter_SPEC_FLOAT &&
+             (op == Add || op == Sub || op == Mult || op == Div)) {
+        ADDOP_I(c, BINARY_OP_FLOAT, opcode);
+    }
+    else {
+        ADDOP(c, opcode);
+    }
+    return 1;
+}
+
+/* Likewise, adds the opcode for the comparison operator op */
+static int
+compiler_cmpop(struct compiler *c, cmpop_ty op, int spec)
+{
+    int oparg = cmpop(op);
+
+    if (spec == Garter_SPEC_INT && oparg <= PyCmp_GE) {
+        ADDOP_I(c, COMPARE_OP_INT, oparg);
+    }
+    else if (spec == Garter_SPEC_FLOAT && oparg <= PyCmp_GE) {
+        ADDOP_I(c, COMPARE_OP_FLOAT, oparg);
+    }
+    else {
+        ADDOP_I(c, COMPARE_OP, oparg);
+    }
+    return 1;
+}
+
 static int
 compiler_nameop(struct compiler *c, identifier name, expr_context_ty ctx)
 {
@@ -3002,6 +3213,32 @@ compiler_nameop(struct compiler *c, identifier name, expr_context_ty ctx)
     return compiler_addop_i(c, op, arg);
 }
 
+/* Loads a variable which the garter checker has proven is bound, with
+   LOAD_GLOBAL_BOUND if it is a global variable of a function. Local loads
+   are left as LOAD_FAST, whose check that the variable is bound can't be
+   skipped, as compile() may be passed any AST, and a tracer may unbind
+   locals through f_locals. */
+static int
+compiler_boundnameop(struct compiler *c, identifier name)
+{
+    PyObject *mangled;
+    int scope;
+
+    if (c->u->u_ste->ste_type != FunctionBlock)
+        return compiler_nameop(c, name, Load);
+    mangled = _Py_Mangle(c->u->u_private, name);
+    if (!mangled)
+        return 0;
+    scope = PyST_GetScope(c->u->u_ste, mangled);
+    if (scope != GLOBAL_IMPLICIT && scope != GLOBAL_EXPLICIT) {
+        Py_DECREF(mangled);
+        return compiler_nameop(c, name, Load);
+    }
+    ADDOP_O(c, LOAD_GLOBAL_BOUND, mangled, names);
+    Py_DECREF(mangled);
+    return 1;
+}
+
 static int
 compiler_boolop(struct compiler *c, expr_ty e)
 {
@@ -3102,8 +3339,23 @@ compiler_list(struct compiler *c, expr_ty e)
         return assignment_helper(c, elts);
     }
     else if (e->v.List.ctx == Load) {
-        return starunpack_helper(c, elts,
-                                 BUILD_LIST, BUILD_TUPLE, BUILD_LIST_UNPACK);
+        /* The garter checker has proven the type of the items of typed
+           lists, which store them unboxed */
+        int op;
+        switch (compiler_spec(c, e)) {
+        case Garter_SPEC_INT:
+            op = BUILD_INT_LIST;
+            break;
+        case Garter_SPEC_FLOAT:
+            op = BUILD_FLOAT_LIST;
+            break;
+        case Garter_SPEC_BOOL:
+            op = BUILD_BOOL_LIST;
+            break;
+        default:
+            op = BUILD_LIST;
+        }
+        return starunpack_helper(c, elts, op, BUILD_TUPLE, BUILD_LIST_UNPACK);
     }
     else
         VISIT_SEQ(c, expr, elts);
@@ -3179,6 +3431,7 @@ compiler_compare(struct compiler *c, expr_ty e)
 {
     Py_ssize_t i, n;
     basicblock *cleanup = NULL;
+    int spec = compiler_spec(c, e);
 
     /* XXX the logic can be cleaned up for 1 or multiple comparisons */
     VISIT(c, expr, e->v.Compare.left);
@@ -3194,9 +3447,9 @@ compiler_compare(struct compiler *c, expr_ty e)
     for (i = 1; i < n; i++) {
         ADDOP(c, DUP_TOP);
         ADDOP(c, ROT_THREE);
-        ADDOP_I(c, COMPARE_OP,
-            cmpop((cmpop_ty)(asdl_seq_GET(
-                                      e->v.Compare.ops, i - 1))));
+        if (!compiler_cmpop(c, (cmpop_ty)asdl_seq_GET(e->v.Compare.ops, i - 1),
+                            spec))
+            return 0;
         ADDOP_JABS(c, JUMP_IF_FALSE_OR_POP, cleanup);
         NEXT_BLOCK(c);
         if (i < (n - 1))
@@ -3204,8 +3457,9 @@ compiler_compare(struct compiler *c, expr_ty e)
                 (expr_ty)asdl_seq_GET(e->v.Compare.comparators, i));
     }
     VISIT(c, expr, (expr_ty)asdl_seq_GET(e->v.Compare.comparators, n - 1));
-    ADDOP_I(c, COMPARE_OP,
-           cmpop((cmpop_ty)(asdl_seq_GET(e->v.Compare.ops, n - 1))));
+    if (!compiler_cmpop(c, (cmpop_ty)asdl_seq_GET(e->v.Compare.ops, n - 1),
+                        spec))
+        return 0;
     if (n > 1) {
         basicblock *end = compiler_new_block(c);
         if (end == NULL)
@@ -3223,6 +3477,14 @@ static int
 compiler_call(struct compiler *c, expr_ty e)
 {
     VISIT(c, expr, e->v.Call.func);
+    if (compiler_spec(c, e) == Garter_SPEC_DIRECT &&
+        asdl_seq_LEN(e->v.Call.keywords) == 0) {
+        /* The garter checker has proven that exactly the positional
+           arguments which the function declares are passed */
+        VISIT_SEQ(c, expr, e->v.Call.args);
+        ADDOP_I(c, CALL_FUNCTION_DIRECT, asdl_seq_LEN(e->v.Call.args));
+        return 1;
+    }
     return compiler_call_helper(c, 0,
                                 e->v.Call.args,
                                 e->v.Call.keywords);
@@ -3896,11 +4158,17 @@ compiler_visit_expr(struct compiler *c, expr_ty e)
     switch (e->kind) {
     case BoolOp_kind:
         return compiler_boolop(c, e);
-    case BinOp_kind:
+    case BinOp_kind: {
+        int spec = compiler_spec(c, e);
         VISIT(c, expr, e->v.BinOp.left);
         VISIT(c, expr, e->v.BinOp.right);
-        ADDOP(c, binop(c, e->v.BinOp.op));
-        break;
+        /* Operations on constants are left for the peephole optimizer to
+           fold, which it only does for the generic opcodes */
+        if (e->v.BinOp.left->kind == Num_kind &&
+            e->v.BinOp.right->kind == Num_kind)
+            spec = Garter_SPEC_NONE;
+        return compiler_binop(c, e->v.BinOp.op, spec, 0);
+    }
     case UnaryOp_kind:
         VISIT(c, expr, e->v.UnaryOp.operand);
         ADDOP(c, unaryop(e->v.UnaryOp.op));
@@ -4013,6 +4281,10 @@ compiler_visit_expr(struct compiler *c, expr_ty e)
         }
         break;
     case Subscript_kind:
+        if (compiler_spec(c, e) == Garter_SPEC_LIST &&
+            e->v.Subscript.slice->kind == Index_kind &&
+            e->v.Subscript.ctx != Del && e->v.Subscript.ctx != Param)
+            return compiler_list_subscr(c, e);
         switch (e->v.Subscript.ctx) {
         case AugLoad:
             VISIT(c, expr, e->v.Subscript.value);
@@ -4053,6 +4325,9 @@ compiler_visit_expr(struct compiler *c, expr_ty e)
         }
         break;
     case Name_kind:
+        if (e->v.Name.ctx == Load &&
+            compiler_spec(c, e) == Garter_SPEC_BOUND)
+            return compiler_boundnameop(c, e->v.Name.id);
         return compiler_nameop(c, e->v.Name.id, e->v.Name.ctx);
     /* child nodes of List and Tuple will have expr_context set */
     case List_kind:
@@ -4068,6 +4343,7 @@ compiler_augassign(struct compiler *c, stmt_ty s)
 {
     expr_ty e = s->v.AugAssign.target;
     expr_ty auge;
+    int spec = compiler_spec(c, s), list;
 
     assert(s->kind == AugAssign_kind);
 
@@ -4079,7 +4355,8 @@ compiler_augassign(struct compiler *c, stmt_ty s)
             return 0;
         VISIT(c, expr, auge);
         VISIT(c, expr, s->v.AugAssign.value);
-        ADDOP(c, inplace_binop(c, s->v.AugAssign.op));
+        if (!compiler_binop(c, s->v.AugAssign.op, spec, 1))
+            return 0;
         auge->v.Attribute.ctx = AugStore;
         VISIT(c, expr, auge);
         break;
@@ -4088,17 +4365,26 @@ compiler_augassign(struct compiler *c, stmt_ty s)
                          AugLoad, e->lineno, e->col_offset, c->c_arena);
         if (auge == NULL)
             return 0;
-        VISIT(c, expr, auge);
+        /* auge has no spec of its own, being built here */
+        list = compiler_spec(c, e) == Garter_SPEC_LIST &&
+            e->v.Subscript.slice->kind == Index_kind;
+        if (list ? !compiler_list_subscr(c, auge) :
+                   !compiler_visit_expr(c, auge))
+            return 0;
         VISIT(c, expr, s->v.AugAssign.value);
-        ADDOP(c, inplace_binop(c, s->v.AugAssign.op));
+        if (!compiler_binop(c, s->v.AugAssign.op, spec, 1))
+            return 0;
         auge->v.Subscript.ctx = AugStore;
-        VISIT(c, expr, auge);
+        if (list ? !compiler_list_subscr(c, auge) :
+                   !compiler_visit_expr(c, auge))
+            return 0;
         break;
     case Name_kind:
         if (!compiler_nameop(c, e->v.Name.id, Load))
             return 0;
         VISIT(c, expr, s->v.AugAssign.value);
-        ADDOP(c, inplace_binop(c, s->v.AugAssign.op));
+        if (!compiler_binop(c, s->v.AugAssign.op, spec, 1))
+            return 0;
         return compiler_nameop(c, e->v.Name.id, Store);
     default:
         PyErr_Format(PyExc_SystemError,
@@ -4203,6 +4489,33 @@ compiler_handle_subscr(struct compiler *c, const char *kind,
     return 1;
 }
 
+/* Subscripts of lists by ints, where the garter checker has proven the types,
+   are loaded and stored by specialized opcodes */
+static int
+compiler_list_subscr(struct compiler *c, expr_ty e)
+{
+    expr_context_ty ctx = e->v.Subscript.ctx;
+
+    assert(e->v.Subscript.slice->kind == Index_kind);
+    if (ctx != AugStore) {
+        VISIT(c, expr, e->v.Subscript.value);
+        VISIT(c, expr, e->v.Subscript.slice->v.Index.value);
+    }
+    if (ctx == AugLoad) {
+        ADDOP(c, DUP_TOP_TWO);
+    }
+    else if (ctx == AugStore) {
+        ADDOP(c, ROT_THREE);
+    }
+    if (ctx == Load || ctx == AugLoad) {
+        ADDOP(c, BINARY_SUBSCR_LIST);
+    }
+    else {
+        ADDOP(c, STORE_SUBSCR_LIST);
+    }
+    return 1;
+}
+
 static int
 compiler_slice(struct compiler *c, slice_ty s, expr_context_ty ctx)
 {
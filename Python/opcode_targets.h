@@ -29,8 +29,8 @@ static void *opcode_targets[256] = {
     &&TARGET_BINARY_TRUE_DIVIDE,
     &&TARGET_INPLACE_FLOOR_DIVIDE,
     &&TARGET_INPLACE_TRUE_DIVIDE,
-    &&_unknown_opcode,
-    &&_unknown_opcode,
+    &&TARGET_BINARY_SUBSCR_LIST,
+    &&TARGET_STORE_SUBSCR_LIST,
     &&_unknown_opcode,
     &&_unknown_opcode,
     &&_unknown_opcode,
@@ -155,16 +155,16 @@ static void *opcode_targets[256] = {
     &&TARGET_BUILD_SET_UNPACK,
     &&TARGET_SETUP_ASYNC_WITH,
     &&TARGET_FORMAT_VALUE,
-    &&_unknown_opcode,
-    &&_unknown_opcode,
-    &&_unknown_opcode,
-    &&_unknown_opcode,
-    &&_unknown_opcode,
-    &&_unknown_opcode,
-    &&_unknown_opcode,
-    &&_unknown_opcode,
-    &&_unknown_opcode,
-    &&_unknown_opcode,
+    &&TARGET_BINARY_OP_INT,
+    &&TARGET_BINARY_OP_FLOAT,
+    &&TARGET_COMPARE_OP_INT,
+    &&TARGET_COMPARE_OP_FLOAT,
+    &&TARGET_BUILD_INT_LIST,
+    &&TARGET_BUILD_FLOAT_LIST,
+    &&TARGET_BUILD_BOOL_LIST,
+    &&_unknown_opcode,
+    &&TARGET_LOAD_GLOBAL_BOUND,
+    &&TARGET_CALL_FUNCTION_DIRECT,
     &&_unknown_opcode,
     &&_unknown_opcode,
     &&_unknown_opcode,
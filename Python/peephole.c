@@ -91,8 +91,9 @@
    new constant (c1, c2, ... cn) can be appended.
    Called with codestr pointing to the first LOAD_CONST.
    Bails out with no change if one or more of the LOAD_CONSTs is missing.
-   Also works for BUILD_LIST and BUILT_SET when followed by an "in" or "not in"
-   test; for BUILD_SET it assembles a frozenset rather than a tuple.
+   Also works for BUILD_LIST (and its typed forms) and BUILT_SET when followed
+   by an "in" or "not in" test; for BUILD_SET it assembles a frozenset rather
+   than a tuple.
 */
 static int
 tuple_of_constants(unsigned char *codestr, Py_ssize_t n,
@@ -475,6 +476,9 @@ PyCode_Optimize(PyObject *code, PyObject* consts, PyObject *names,
                    Replace BUILD_SEQN 3 UNPACK_SEQN 3 with ROT3 ROT2. */
             case BUILD_TUPLE:
             case BUILD_LIST:
+            case BUILD_INT_LIST:
+            case BUILD_FLOAT_LIST:
+            case BUILD_BOOL_LIST:
             case BUILD_SET:
                 j = GETARG(codestr, i);
                 if (j == 0)
@@ -484,7 +488,7 @@ PyCode_Optimize(PyObject *code, PyObject* consts, PyObject *names,
                 if (h >= 0 && j > 0 && j <= CONST_STACK_LEN() &&
                     ((opcode == BUILD_TUPLE &&
                       ISBASICBLOCK(blocks, h, i-h+3)) ||
-                     ((opcode == BUILD_LIST || opcode == BUILD_SET) &&
+                     (opcode != BUILD_TUPLE &&
                       codestr[i+3]==COMPARE_OP &&
                       ISBASICBLOCK(blocks, h, i-h+6) &&
                       (GETARG(codestr,i+3)==6 ||
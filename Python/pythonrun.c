@@ -1034,6 +1034,143 @@ Py_CompileStringObject(const char *str, PyObject *filename, int start,
     return (PyObject *)co;
 }
 
+/* The specs which the garter checker has recorded on the AST objects in
+   nodes, as listed by _PyAST_mod2obj_nodes or _PyAST_obj2mod_nodes, in a
+   dict keyed by the addresses of the corresponding nodes, as
+   _PyAST_CompileGarter expects. */
+static PyObject *
+garter_specs(PyObject *nodes)
+{
+    _Py_IDENTIFIER(spec);
+    PyObject *specs, **dictptr, *spec;
+    Py_ssize_t i;
+
+    specs = PyDict_New();
+    if (specs == NULL)
+        return NULL;
+    for (i = 0; i + 1 < PyList_GET_SIZE(nodes); i += 2) {
+        /* Looked up in the instance dict, such that nodes without a spec
+           don't raise AttributeError */
+        dictptr = _PyObject_GetDictPtr(PyList_GET_ITEM(nodes, i));
+        if (dictptr == NULL || *dictptr == NULL)
+            continue;
+        spec = _PyDict_GetItemId(*dictptr, &PyId_spec);
+        if (spec == NULL || !PyLong_CheckExact(spec))
+            continue;
+        if (PyDict_SetItem(specs, PyList_GET_ITEM(nodes, i + 1), spec) < 0) {
+            Py_DECREF(specs);
+            return NULL;
+        }
+    }
+    return specs;
+}
+
+/* Compile mod with the specs recorded on the AST objects in nodes */
+static PyObject *
+garter_compile_nodes(mod_ty mod, PyObject *nodes, PyObject *filename,
+                     PyCompilerFlags *flags, int optimize, PyArena *arena)
+{
+    PyCodeObject *co;
+    PyObject *specs = garter_specs(nodes);
+    if (specs == NULL)
+        return NULL;
+    co = _PyAST_CompileGarter(mod, filename, flags, optimize, arena, specs);
+    Py_DECREF(specs);
+    return (PyObject *)co;
+}
+
+/* Like Py_CompileStringObject, but also validates the source as Garter code.
+
+   The AST objects built by _PyAST_mod2obj_nodes are validated by the garter
+   module, which records the types it has proven in their spec attributes.
+   The arena AST from which they were built is then compiled with those
+   specs, so that specialized opcodes are emitted, without being converted
+   back from the objects. global_scope may be NULL or None, in which case the
+   garter module creates a fresh global scope. */
+PyObject *
+Garter_CompileStringObject(const char *str, PyObject *filename, int start,
+                           PyCompilerFlags *flags, int optimize,
+                           PyObject *global_scope)
+{
+    _Py_IDENTIFIER(check);
+    PyObject *garter, *tree, *nodes, *res;
+    mod_ty mod;
+    PyArena *arena = PyArena_New();
+    if (arena == NULL)
+        return NULL;
+
+    mod = PyParser_ASTFromStringObject(str, filename, start, flags, arena);
+    if (mod == NULL) {
+        PyArena_Free(arena);
+        return NULL;
+    }
+    nodes = PyList_New(0);
+    if (nodes == NULL) {
+        PyArena_Free(arena);
+        return NULL;
+    }
+    tree = _PyAST_mod2obj_nodes(mod, nodes);
+    if (tree == NULL)
+        goto error;
+
+    garter = PyImport_ImportModule("garter");
+    if (garter == NULL)
+        goto error;
+    if (global_scope == NULL)
+        global_scope = Py_None;
+    res = _PyObject_CallMethodIdObjArgs(garter, &PyId_check, tree, filename,
+                                        global_scope, NULL);
+    Py_DECREF(garter);
+    if (res == NULL)
+        goto error;
+    Py_DECREF(res);
+
+    if (flags && (flags->cf_flags & PyCF_ONLY_AST)) {
+        Py_DECREF(nodes);
+        PyArena_Free(arena);
+        return tree;
+    }
+    res = garter_compile_nodes(mod, nodes, filename, flags, optimize, arena);
+    Py_DECREF(tree);
+    Py_DECREF(nodes);
+    PyArena_Free(arena);
+    return res;
+
+error:
+    Py_XDECREF(tree);
+    Py_DECREF(nodes);
+    PyArena_Free(arena);
+    return NULL;
+}
+
+/* Like compile() of an AST object, but emitting the opcodes specialized for
+   the specs which the garter checker has recorded on the objects of tree,
+   which it must have validated. mode is 0 for "exec", 1 for "eval" and 2 for
+   "single" input, as for PyAST_obj2mod. */
+PyObject *
+Garter_CompileASTObject(PyObject *tree, PyObject *filename, int mode,
+                        PyCompilerFlags *flags, int optimize)
+{
+    PyObject *nodes, *res = NULL;
+    mod_ty mod;
+    PyArena *arena = PyArena_New();
+    if (arena == NULL)
+        return NULL;
+
+    nodes = PyList_New(0);
+    if (nodes == NULL) {
+        PyArena_Free(arena);
+        return NULL;
+    }
+    mod = _PyAST_obj2mod_nodes(tree, arena, mode, nodes);
+    if (mod != NULL && PyAST_Validate(mod))
+        res = garter_compile_nodes(mod, nodes, filename, flags, optimize,
+                                   arena);
+    Py_DECREF(nodes);
+    PyArena_Free(arena);
+    return res;
+}
+
 PyObject *
 Py_CompileStringExFlags(const char *str, const char *filename_str, int start,
                         PyCompilerFlags *flags, int optimize)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Benchmarks the Garter checker, reporting separately the time spent parsing,
+validating and compiling each program: the examples, the assignments, the
+GarterTest programs, and synthetic programs generated by genprog. The types
+and memory allocated while validating are reported as well.
+
+    garterbench.py [-n LINES] [-r REPEAT] [-t PATTERN] [-f FILE] [-c FILE]
+
+Results can be saved as JSON with -f, and compared with a previous run with -c,
+in which case the exit status is 1 if validation of any program has become
+slower by more than the threshold given by --threshold (10% by default).
+
+The same programs are also available as pybench tests, in Tools/pybench/Garter.py,
+for use with pybench's calibration and comparison of runs.
+"""
+
+import argparse
+import ast
+import collections
+import glob
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+import garter
+import genprog
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+CORPUS = ('Examples/*.py', 'Assns/*/*.py', 'GarterTest/Pass/*.py')
+
+
+def corpus():
+    """
+    Return a list of (name, source) pairs for the Garter programs in the tree
+    """
+    programs = []
+    for pattern in CORPUS:
+        for path in sorted(glob.glob(os.path.join(ROOT, pattern))):
+            with open(path, encoding='utf-8') as f:
+                programs.append((os.path.relpath(path, ROOT), f.read()))
+    return programs
+
+
+def generated(lines):
+    """
+    Return a list of (name, source) pairs for the generated programs
+    """
+    return [(f'<{kind}>', genprog.generate(kind, lines))
+            for kind in genprog.KINDS]
+
+
+def measure(name, source, repeat):
+    """
+    Time the phases of compiling source, returning a dictionary of the best
+    time of each, and what was allocated while validating
+    """
+    best = {'parse': float('inf'), 'validate': float('inf'),
+            'compile': float('inf')}
+    try:
+        compile(source, name, 'exec', ast.PyCF_ONLY_AST)
+    except SyntaxError as err:
+        return {'lines': source.count('\n'), 'parse': 0.0, 'validate': 0.0,
+                'compile': 0.0, 'types': 0, 'peak': 0, 'error': str(err)}
+
+    error = None
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        tree = compile(source, name, 'exec', ast.PyCF_ONLY_AST)
+        t1 = time.perf_counter()
+        try:
+            garter.check(tree, name)
+        except garter.GarterError as err:
+            error = str(err)
+        t2 = time.perf_counter()
+        if error == None:
+            compile(tree, name, 'exec')
+        t3 = time.perf_counter()
+        best['parse'] = min(best['parse'], t1 - t0)
+        best['validate'] = min(best['validate'], t2 - t1)
+        best['compile'] = min(best['compile'], t3 - t2)
+
+    # Allocations are measured separately, as measuring them is slow
+    tree = compile(source, name, 'exec', ast.PyCF_ONLY_AST)
+    tracemalloc.start()
+    try:
+        with garter.Profile() as prof:
+            garter.check(tree, name)
+    except garter.GarterError:
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        'lines': source.count('\n'),
+        'parse': best['parse'],
+        'validate': best['validate'],
+        'compile': best['compile'],
+        'types': prof.types['allocated'],
+        'peak': peak,
+        'error': error,
+    }
+
+
+def report(results, previous=None, threshold=0.1):
+    """
+    Print the results, compared with previous if given, and return the names
+    of the programs whose validation has regressed by more than threshold
+    """
+    regressed = []
+    print(f"{'program':32} {'lines':>7} {'parse':>9} {'validate':>9} "
+          f"{'compile':>9} {'types':>6} {'peak KiB':>9}")
+    for name, r in results.items():
+        line = (f"{name:32} {r['lines']:7} {r['parse'] * 1000:8.2f}ms "
+                f"{r['validate'] * 1000:8.2f}ms {r['compile'] * 1000:8.2f}ms "
+                f"{r['types']:6} {r['peak'] // 1024:9}")
+        old = previous.get(name) if previous else None
+        if old:
+            change = r['validate'] / old['validate'] - 1 if old['validate'] else 0
+            line += f" {change:+7.1%}"
+            if change > threshold:
+                regressed.append(name)
+                line += " !"
+        if r['error']:
+            line += " (error)"
+        print(line)
+    return regressed
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Garter checker")
+    parser.add_argument('-n', '--lines', type=int, default=10000,
+                        help="the size of the generated programs, in lines")
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help="the number of times to time each program")
+    parser.add_argument('-t', '--tests', metavar='PATTERN',
+                        help="only run programs whose names match PATTERN")
+    parser.add_argument('-f', '--file', help="save the results as JSON to FILE")
+    parser.add_argument('-c', '--compare', metavar='FILE',
+                        help="compare with the results saved in FILE")
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help="the validation slowdown treated as a regression")
+    options = parser.parse_args(args)
+
+    programs = corpus() + generated(options.lines)
+    if options.tests:
+        programs = [(name, source) for name, source in programs
+                    if re.search(options.tests, name)]
+
+    results = collections.OrderedDict(
+        (name, measure(name, source, options.repeat))
+        for name, source in programs)
+
+    previous = None
+    if options.compare:
+        with open(options.compare) as f:
+            previous = json.load(f)
+    regressed = report(results, previous, options.threshold)
+
+    if options.file:
+        with open(options.file, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if regressed:
+        print(f"Validation regressed for {', '.join(regressed)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
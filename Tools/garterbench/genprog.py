@@ -0,0 +1,122 @@
+"""
+Generators of synthetic Garter programs, for benchmarking the checker on
+programs much larger than the examples. Each kind of program stresses a
+different part of the checker:
+
+    nested   - functions with deeply nested if and while statements
+    classes  - many classes, with fields and methods which use each other
+    chains   - long arithmetic and boolean expressions
+    literals - wide list and dict literals
+    calls    - chains of 100 functions, each calling the next
+    mixed    - all of the above, interleaved
+
+generate(kind, lines) returns the source of a valid program of that kind with
+at least the given number of lines.
+"""
+
+KINDS = ('nested', 'classes', 'chains', 'literals', 'calls', 'mixed')
+
+NEST_DEPTH = 40
+CHAIN_WIDTH = 40
+LITERAL_WIDTH = 1000
+CALL_DEPTH = 100
+
+
+def nested(n):
+    lines = [f"def nest{n}(a: int) -> int:",
+             "    b := a"]
+    indent = "    "
+    for depth in range(NEST_DEPTH):
+        if depth % 2:
+            lines.append(f"{indent}while b < {depth * 10}:")
+        else:
+            lines.append(f"{indent}if b > {depth} or b == {n}:")
+        indent += "    "
+        lines.append(f"{indent}b = b + {depth + 1}")
+    lines.append("    return b")
+    lines.append(f"r{n} := nest{n}({n})")
+    return lines
+
+
+def classes(n):
+    lines = [f"class C{n}:",
+             f"    a := {n}",
+             "    b: float = 1.5",
+             f"    s := \"c{n}\"",
+             "    xs: [int] = []",
+             "    def get(self, k: int) -> float:",
+             "        return self.a * k + self.b"]
+    if n > 0:
+        lines += [f"    def link(self, other: C{n - 1}) -> int:",
+                  "        return self.a + other.a"]
+    lines += [f"c{n} := C{n}()",
+              f"c{n}.a = c{n}.a + 1",
+              f"c{n}.xs = [c{n}.a, {n}]"]
+    if n > 0:
+        lines.append(f"t{n} := c{n}.get(2) + c{n}.link(c{n - 1})")
+    return lines
+
+
+def chains(n):
+    prev = f"v{n - 1}" if n > 0 else "1"
+    terms = [f"{prev} * {i % 7 + 1}" if i % 2 else f"({prev} - {i})"
+             for i in range(CHAIN_WIDTH)]
+    tests = [f"v{n} > {i}" if i % 2 else f"not v{n} == {i}"
+             for i in range(CHAIN_WIDTH // 4)]
+    return [f"v{n} := " + " + ".join(terms),
+            f"ok{n} := " + " and ".join(tests) + f" or v{n} < 0"]
+
+
+def literals(n):
+    lines = [f"xs{n} := ["]
+    for i in range(0, LITERAL_WIDTH, 10):
+        lines.append("    " + ", ".join(str(j) for j in range(i, i + 10)) + ",")
+    lines.append("]")
+    lines.append(f"ds{n} := {{")
+    for i in range(0, LITERAL_WIDTH // 10, 5):
+        lines.append("    " + ", ".join(f'"k{j}": {j}.5'
+                                        for j in range(i, i + 5)) + ",")
+    lines.append("}")
+    lines.append(f"ls{n} := [[{n}, 1], [2, 3], [], [xs{n}[0]]]")
+    return lines
+
+
+def calls(n):
+    lines = []
+    for i in range(CALL_DEPTH):
+        lines += [f"def f{n}_{i}(a: int, s: str) -> int:",
+                  f"    return f{n}_{i + 1}(a + 1, s) * 2"]
+    lines += [f"def f{n}_{CALL_DEPTH}(a: int, s: str) -> int:",
+              "    return a + len(s)",
+              f"print(f{n}_0({n}, \"x\"))"]
+    return lines
+
+
+def mixed(n):
+    # Interleave the other kinds, giving each consecutive block numbers
+    kinds = len(KINDS) - 1
+    return GENERATORS[KINDS[n % kinds]](n // kinds)
+
+
+GENERATORS = {
+    'nested': nested,
+    'classes': classes,
+    'chains': chains,
+    'literals': literals,
+    'calls': calls,
+    'mixed': mixed,
+}
+
+
+def generate(kind, lines):
+    """
+    Return the source of a generated program of the given kind with at least
+    lines lines
+    """
+    block = GENERATORS[kind]
+    out = []
+    n = 0
+    while len(out) < lines:
+        out += block(n)
+        n += 1
+    return "\n".join(out) + "\n"
@@ -0,0 +1,120 @@
+from pybench import Test
+import ast
+import os
+import sys
+
+import garter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'garterbench'))
+import garterbench
+import genprog
+del sys.path[0]
+
+# The size of the generated programs, in lines
+LINES = 1000
+
+CORPUS = garterbench.corpus()
+
+_generated = {}
+
+def generated(kind):
+    if kind not in _generated:
+        _generated[kind] = [('<%s>' % kind, genprog.generate(kind, LINES))]
+    return _generated[kind]
+
+
+_trees = {}
+
+def parse(programs):
+    # Only programs which are valid Garter are benchmarked, such that
+    # changes to error handling don't affect the timings. They are parsed
+    # once, as calibration repeats the setup of each test many times.
+    key = tuple(programs)
+    if key in _trees:
+        return _trees[key]
+    trees = _trees[key] = []
+    for name, source in programs:
+        try:
+            tree = compile(source, name, 'exec', ast.PyCF_ONLY_AST)
+            garter.check(tree, name)
+        except SyntaxError:
+            continue
+        trees.append((name, compile(source, name, 'exec', ast.PyCF_ONLY_AST)))
+    return trees
+
+
+class CheckCorpus(Test):
+
+    version = 2.0
+    operations = 1
+    rounds = 2000
+
+    def test(self):
+
+        trees = parse(CORPUS)
+        check = garter.check
+
+        for i in range(self.rounds):
+            for name, tree in trees:
+                check(tree, name)
+
+    def calibrate(self):
+
+        trees = parse(CORPUS)
+        check = garter.check
+
+        for i in range(self.rounds):
+            for name, tree in trees:
+                pass
+
+
+class CheckGenerated:
+
+    # Mixed into the tests below, which give the kind of program to generate
+
+    version = 2.0
+    operations = 1
+    rounds = 100
+    kind = None
+
+    def test(self):
+
+        (name, tree), = parse(generated(self.kind))
+        check = garter.check
+
+        for i in range(self.rounds):
+            check(tree, name)
+
+    def calibrate(self):
+
+        (name, tree), = parse(generated(self.kind))
+        check = garter.check
+
+        for i in range(self.rounds):
+            pass
+
+
+class CheckNested(CheckGenerated, Test):
+    kind = 'nested'
+
+
+class CheckClasses(CheckGenerated, Test):
+    kind = 'classes'
+
+
+class CheckChains(CheckGenerated, Test):
+    kind = 'chains'
+    rounds = 20
+
+
+class CheckLiterals(CheckGenerated, Test):
+    kind = 'literals'
+
+
+class CheckCalls(CheckGenerated, Test):
+    kind = 'calls'
+
+
+class CheckMixed(CheckGenerated, Test):
+    kind = 'mixed'
@@ -41,3 +41,7 @@ try:
     from Unicode import *
 except (ImportError, SyntaxError):
     pass
+try:
+    from Garter import *
+except (ImportError, SyntaxError):
+    pass